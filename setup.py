@@ -8,6 +8,7 @@ setup(
     author='NetAngels',
     author_email='info@netangels.ru',
     packages=['whois2', ],
+    package_data={'whois2': ['public_suffix_list.dat', 'public_suffix_list.idx']},
     scripts=['scripts/whois2', ],
     url='',
     download_url = '',
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare date parsing with dateutil and with DatetimeFormat on dates found
+in tests/whois_data fixtures by date matchers
+
+Run with whois2 installed (see tests/requrements.pip): python tests/bench_dates.py
+"""
+import os
+import timeit
+from whois2 import extract_tld
+from whois2.parsers import tld_parser
+from whois2.parser_utils import WhoisRecord, DatetimeFormat, clean_datetime
+
+WHOIS_DATA = os.path.join(os.path.dirname(__file__), 'whois_data')
+NUMBER = 1000
+
+
+def get_dates():
+    dates = []
+    for filename in sorted(os.listdir(WHOIS_DATA)):
+        name, tld = extract_tld(filename)
+        if tld is None:
+            continue
+        with open(os.path.join(WHOIS_DATA, filename)) as fd:
+            record = WhoisRecord(fd.read())
+        for parser in tld_parser.get(tld):
+            if isinstance(getattr(parser, 'clean', None), DatetimeFormat):
+                for line in record.get_lines(parser.key):
+                    match = parser.regexp.match(line)
+                    if match:
+                        dates.append((parser.clean, match.group(parser.attribute_name)))
+    return dates
+
+
+def main():
+    dates = get_dates()
+    for clean, value in dates:
+        assert clean(value) == clean_datetime(value), value
+    dateutil_time = timeit.timeit(lambda: [clean_datetime(value) for clean, value in dates], number=NUMBER)
+    fast_time = timeit.timeit(lambda: [clean(value) for clean, value in dates], number=NUMBER)
+    count = len(dates) * NUMBER
+    print '{0} dates from fixtures, parsed {1} times'.format(len(dates), NUMBER)
+    print 'dateutil:       {0:.2f} us per date'.format(dateutil_time / count * 1e6)
+    print 'DatetimeFormat: {0:.2f} us per date'.format(fast_time / count * 1e6)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Loopback stand-in RDAP server for tests
+"""
+import json
+import threading
+import BaseHTTPServer
+import SocketServer
+
+
+class RdapHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.client_address))
+        domain = self.path.rsplit('/', 1)[-1]
+        data = self.server.domains.get(domain)
+        if data is None:
+            status, body = 404, json.dumps({'errorCode': 404})
+        elif isinstance(data, basestring):
+            status, body = 200, data
+        else:
+            status, body = 200, json.dumps(data)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/rdap+json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class RdapServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, domains):
+        """
+        :param domains: dict of registered domains and their RDAP responses,
+                        strings are sent as is
+        """
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), RdapHandler)
+        self.domains = domains
+        self.requests = []
+        self.url = 'http://127.0.0.1:{0}/rdap/'.format(self.server_address[1])
+
+    def __enter__(self):
+        thread = threading.Thread(target=self.serve_forever, args=(0.05, ))
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
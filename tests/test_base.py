@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import os
+import gc
 import datetime
 from nose.tools import eq_, ok_
 from mock import patch
-from whois2 import check, extract_tld, get_validation_errors, normalize_domain_name, SUPPORTED_TLD
+from whois2 import check, get_throttled, extract_tld, get_validation_errors, normalize_domain_name, parse_whois_data, parse_cache, SUPPORTED_TLD
 from whois2.utils import is_idna
+from whois2.parser_utils import normalize_text
 
 
 def test_extract_tld():
@@ -16,6 +19,18 @@ def test_extract_tld():
         eq_(extract_tld(domain, SUPPORTED_TLD), parts)
 
 
+def test_extract_tld_custom_suffixes():
+    suffixes = ['ru', 'org.ru', 'spb.org.ru']
+    domains = {
+        'linux.spb.org.ru': ('linux', 'spb.org.ru'),
+        'www.linux.org.ru': ('www.linux', 'org.ru'),
+        'linux.com.ru': ('linux.com', 'ru'),
+        'ru': ('ru', None),
+    }
+    for domain, parts in domains.iteritems():
+        eq_(extract_tld(domain, suffixes), parts)
+
+
 def test_is_idna():
     domains = {
         'xn--e1aybc.xn--p1ai': True,
@@ -52,12 +67,27 @@ def test_rf_domains():
         eq_(errors == [], valid, 'Unexpected error status for %s: %s' % (domain, errors))
 
 
-def mock_get_whois(domain, whois_server=None, cache=None, cache_timeout=None):
+def mock_get_whois(domain, whois_server=None, cache=None, cache_timeout=None, **kwargs):
     with open('tests/whois_data/%s' % domain.lower()) as fd:
         return fd.read()
 
+def get_fixture_tlds():
+    """
+    Return zones of whois data fixtures, see
+    tests/whois_data/update_whois_data.sh
+
+    Zones are taken from the fixtures rather than SUPPORTED_TLD, which lists
+    every zone with a known whois server, and most of them have no fixtures.
+    Public suffixes like co.uk are checked as well, every zone must have
+    fixtures of both registered and free domains.
+    """
+    tld_list = sorted(name.split('.', 1)[1] for name in os.listdir('tests/whois_data') if name.startswith('google.'))
+    for tld in tld_list:
+        ok_(os.path.exists('tests/whois_data/sahchoo5theevaa8peel.%s' % tld), 'No fixture of a free domain in %s' % tld)
+    return tld_list
+
 def test_not_found():
-    tld_list = SUPPORTED_TLD[::]
+    tld_list = get_fixture_tlds()
     tld_list.remove('xn--p1ai')
     for tld in tld_list:
         domain1 = 'google.%s' % tld
@@ -69,7 +99,7 @@ def test_not_found():
         eq_(result2.registered, False, 'Domain %s is identified as registered while it is not' % domain2)
 
 def test_nameservers():
-    tld_list = SUPPORTED_TLD[::]
+    tld_list = get_fixture_tlds()
     tld_list.remove('xn--p1ai')
     tld_list.remove('name')
 
@@ -106,3 +136,140 @@ def test_ru_dates():
         result = check(domain)
     ok_(result.created, datetime.datetime(2004, 7, 21))
     ok_(result.paid_till, datetime.datetime(2013, 3, 5))
+
+
+def test_whois_record():
+    from whois2.parser_utils import WhoisRecord
+    record = WhoisRecord('Domain Name: GOOGLE.COM\n   Name Server:  NS1.GOOGLE.COM\n\n   Name   Server: NS2.GOOGLE.COM\nfree text')
+    eq_(record.normalized_lines, ['domain name: google.com', 'name server: ns1.google.com', '', 'name server: ns2.google.com', 'free text'])
+    eq_(record.get_lines('name server'), ['   Name Server:  NS1.GOOGLE.COM', '   Name   Server: NS2.GOOGLE.COM'])
+    eq_(record.get_lines('nserver'), [])
+    eq_(len(record.get_lines()), 5)
+
+
+def test_whois_record_is_freed():
+    parse_cache.clear()
+    with open('tests/whois_data/google.com') as fd:
+        whois = parse_whois_data('google.com', fd.read())
+    eq_(whois.registered, True)
+    eq_(whois._record, None)
+    whois.parse()
+    eq_(whois._record, None)
+    ok_(whois.nameservers)
+
+
+def test_template_matcher():
+    import re
+    from whois2.parser_utils import TemplateMatcher
+    matcher = TemplateMatcher(['no match', 'no match.', 'not found', re.compile(r'reserved[^\n]*name')])
+    ok_(matcher.search('domain not found'))
+    ok_(matcher.search('foo\nreserved name'))
+    ok_(not matcher.search('reserved\nname'))
+    ok_(not matcher.search('domain name: google.com'))
+    ok_(matcher.search('domain name: google.com', ['google.com']))
+
+
+def test_registrar():
+    from whois2.decorators import Registrar
+    reg = Registrar()
+    common, foo = object(), object()
+    reg('__all__')(common)
+    reg('foo')(foo)
+    eq_(reg.get('foo'), (common, foo))
+    eq_(reg.get('unknown'), (common, ))
+    ok_('unknown' not in reg.registry)
+    bar = reg('foo', 'bar')(object())
+    eq_(reg.get('foo'), (common, foo, bar))
+    eq_(reg.get('bar'), (common, bar))
+
+
+def test_status_only():
+    parse_cache.clear()
+    for domain in ('google.ru', 'sahchoo5theevaa8peel.ru', 'google.com', 'sahchoo5theevaa8peel.com'):
+        with patch('whois2.get_whois', mock_get_whois):
+            full = check(domain)
+            status = check(domain, fields=('registered', ))
+        eq_(status.registered, full.registered)
+        ok_(status.is_parsed('registered'))
+        ok_(not status.is_parsed('nameservers'))
+        ok_(not status.is_parsed('paid_till'))
+
+
+def test_lazy_parsing():
+    parse_cache.clear()
+    with patch('whois2.get_whois', mock_get_whois):
+        result = check('google.ru')
+    ok_(not result.is_parsed('paid_till'))
+    eq_(result.paid_till, datetime.datetime(2013, 3, 5))
+    ok_(result.is_parsed('paid_till'))
+    ok_(not result.is_parsed('nameservers'))
+    ok_(not hasattr(result, 'unknown_attribute'))
+
+
+def test_keep_raw():
+    from whois2 import COMPRESS_RAW
+    with patch('whois2.get_whois', mock_get_whois):
+        full = check('google.ru')
+        dropped = check('google.ru', keep_raw=False)
+        compressed = check('google.ru', keep_raw=COMPRESS_RAW)
+        invalid = check('www.google.ru', keep_raw=False)
+    eq_(dropped.whois_data, None)
+    eq_(compressed.whois_data, full.whois_data)
+    eq_(dropped.to_dict(), full.to_dict())
+    eq_(compressed.to_tuple(), full.to_tuple())
+    eq_(full.to_dict()['paid_till'], datetime.datetime(2013, 3, 5))
+    # no per-instance dict is created for known attributes
+    ok_(not [value for value in gc.get_referents(full) if type(value) is dict])
+    eq_(full._parsing, None)
+    eq_(dropped._parsing, None)
+    eq_(invalid.to_tuple()[:2], ('www.google.ru', True))
+
+
+def test_datetime_format():
+    from whois2.parser_utils import DatetimeFormat
+    clean = DatetimeFormat('%Y.%m.%d')
+    eq_(clean('2004.07.21'), datetime.datetime(2004, 7, 21))
+    # values of another format are passed to dateutil
+    eq_(clean('2004-07-21'), datetime.datetime(2004, 7, 21))
+    eq_(DatetimeFormat('%Y-%m-%dT%H:%M:%S')('2004-07-21T10:20:30'), datetime.datetime(2004, 7, 21, 10, 20, 30))
+
+
+def test_parse_cache():
+    parse_cache.clear()
+    template = 'No match for "{0}".\nName Server: NS1.{0}\nName Server: NS.EXAMPLE.NET\n'
+    first = parse_whois_data('foo.com', template.format('FOO.COM'), fields=('registered', 'nameservers'))
+    second = parse_whois_data('bar.com', template.format('BAR.COM'))
+    eq_((parse_cache.hits, parse_cache.misses), (1, 1))
+    ok_(second.is_parsed('registered'))
+    eq_(second.registered, False)
+    # values with the domain name are parsed for every domain
+    ok_(not second.is_parsed('nameservers'))
+    eq_(first.nameservers, ['ns1.foo.com', 'ns.example.net'])
+    eq_(second.nameservers, ['ns1.bar.com', 'ns.example.net'])
+
+
+def test_parse_cache_values_are_copied():
+    parse_cache.clear()
+    data = 'Name Server: NS1.EXAMPLE.NET\n'
+    first = parse_whois_data('foo.com', data)
+    first.nameservers.append('evil.example')
+    eq_(parse_whois_data('bar.com', data).nameservers, ['ns1.example.net'])
+
+
+def test_throttled():
+    eq_(parse_whois_data('google.ru', 'You have exceeded allowed connection rate.\n').throttled, True)
+    eq_(parse_whois_data('google.de', '% Error: 55000000002 Connection refused; access control limit reached.\n').throttled, True)
+    with open('tests/whois_data/google.ru') as fd:
+        eq_(parse_whois_data('google.ru', fd.read()).throttled, False)
+
+
+def test_get_throttled():
+    data = '% Error: 55000000002 Connection refused; access control limit reached.\n'
+    with patch('whois2.utils.WhoisRecord') as record:
+        eq_(get_throttled('google.de', 'google', 'de')(data), True)
+        eq_(get_throttled('google.ru', 'google', 'ru')(data), False)
+        eq_(get_throttled('google.ru', 'google', 'ru')('Too many  QUERIES\n'), True)
+    # templates are matched on the raw text, no whois objects are built
+    eq_(record.call_count, 0)
+    # the text is normalized once for all checks of the same response
+    ok_(normalize_text(data) is normalize_text(data))
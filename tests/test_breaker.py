@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import time
+from nose.tools import eq_, ok_
+from mock import patch
+from whois2 import check_many, WhoisClient, WhoisConnectionError, WhoisTimeout, CircuitOpenError
+from whois2 import CircuitBreakers, RateLimiter
+from whois2.ratelimit import ConcurrencyLimiter
+from whois2.breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from whois2.engine import Loop, whois_async
+from whois2.servers import ServerTable
+from whois_server import WhoisServer, fixture_responses
+from test_ratelimit import Clock
+from test_transport import slow_responses
+
+
+def test_circuit_breaker():
+    clock = Clock()
+    breaker = CircuitBreaker('whois.nic.ru', max_failures=2, reset_timeout=10, clock=clock)
+    breaker.failure()
+    breaker.check()
+    breaker.success()
+    breaker.failure()
+    breaker.check()
+    breaker.failure()
+    eq_(breaker.state, OPEN)
+    try:
+        breaker.check()
+    except CircuitOpenError:
+        pass
+    else:
+        ok_(False, 'CircuitOpenError is not raised')
+    clock.now = 10
+    # one query probes the server
+    breaker.check()
+    eq_(breaker.state, HALF_OPEN)
+    try:
+        breaker.check()
+    except CircuitOpenError:
+        pass
+    else:
+        ok_(False, 'CircuitOpenError is not raised')
+    breaker.failure()
+    eq_(breaker.state, OPEN)
+    clock.now = 20
+    breaker.check()
+    breaker.success()
+    eq_(breaker.state, CLOSED)
+    breaker.check()
+
+
+def test_dead_server():
+    with WhoisServer(fixture_responses) as dead:
+        dead_port = dead.port
+    with WhoisServer(fixture_responses) as server:
+        # servers of both zones are on the same host, so the dead one is "localhost"
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1', 'com': 'localhost'}, cache_path=None),
+                             port=server.port, timeout=1, breakers=CircuitBreakers(max_failures=2))
+        with patch.object(client, 'port', dead_port):
+            for i in range(2):
+                try:
+                    client.whois('google.com')
+                except WhoisConnectionError:
+                    pass
+        with patch('whois2.utils.default_client', client):
+            results = list(check_many(['google.ru', 'google.com'] * 5))
+    ok_(all(result.registered for result in results[::2]))
+    ok_(all(isinstance(result.error, CircuitOpenError) for result in results[1::2]))
+    eq_(len(server.queries), 5)
+
+
+def test_loop_dead_server():
+    with WhoisServer(fixture_responses) as dead:
+        dead_port = dead.port
+    client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=dead_port, timeout=1,
+                         breakers=CircuitBreakers(max_failures=2))
+    loop = Loop(concurrency=1)
+    futures = [whois_async(loop, client, 'google.ru') for i in range(2)]
+    loop.run()
+    ok_(all(isinstance(future.error, WhoisConnectionError) for future in futures))
+    ok_(isinstance(whois_async(loop, client, 'google.ru').error, CircuitOpenError))
+
+
+def test_deadlines_are_not_failures():
+    with WhoisServer(slow_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             breakers=CircuitBreakers(max_failures=2),
+                             concurrency_limiter=ConcurrencyLimiter(initial=1, maximum=1))
+        loop = Loop()
+        # the first query is sent and cut off by the deadline, the others
+        # wait for it until the deadline, so they are never sent
+        deadline = time.time() + 0.5
+        futures = [whois_async(loop, client, 'slow.ru', deadline=deadline) for i in range(3)]
+        loop.run()
+        ok_(all(isinstance(future.error, WhoisTimeout) for future in futures))
+        ok_(not any(isinstance(future.error, WhoisConnectionError) for future in futures))
+        eq_(len(server.queries), 1)
+        client.concurrency_limiter = ConcurrencyLimiter(initial=4)
+        for i in range(3):
+            # sent and cut off by the deadline
+            try:
+                client.whois('slow.ru', deadline=time.time() + 0.3)
+            except WhoisConnectionError:
+                ok_(False, 'the deadline is blamed on the server')
+            except WhoisTimeout:
+                pass
+        eq_(client.breakers.get('127.0.0.1').state, CLOSED)
+        eq_(client.concurrency_limiter.get('127.0.0.1').limit, 4)
+        client.rate_limiter = RateLimiter({'127.0.0.1': (0.1, 1)})
+        client.rate_limiter.reserve('127.0.0.1')
+        for i in range(2):
+            # rate limit delay exceeds the deadline
+            try:
+                client.whois('google.ru', deadline=time.time() + 0.5)
+            except WhoisTimeout:
+                pass
+            else:
+                ok_(False, 'WhoisTimeout is not raised')
+        eq_(client.breakers.get('127.0.0.1').state, CLOSED)
+        eq_(len(server.queries), 4)
+        # timeouts of the server are its failures
+        client.timeout = 0.3
+        for i in range(2):
+            try:
+                client.whois('slow.ru')
+            except WhoisConnectionError:
+                pass
+            else:
+                ok_(False, 'WhoisConnectionError is not raised')
+        eq_(client.breakers.get('127.0.0.1').state, OPEN)
+
+
+def test_abandoned_probe():
+    clock = Clock()
+    with WhoisServer(fixture_responses) as server:
+        breakers = CircuitBreakers(max_failures=1, reset_timeout=10, clock=clock)
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             rate_limiter=RateLimiter({'127.0.0.1': (0.1, 1)}), breakers=breakers)
+        breaker = breakers.get('127.0.0.1')
+        breaker.failure()
+        client.rate_limiter.reserve('127.0.0.1')
+        clock.now = 10
+        try:
+            client.whois('google.ru', deadline=time.time() + 0.5)
+        except WhoisTimeout:
+            pass
+        else:
+            ok_(False, 'WhoisTimeout is not raised')
+        # the probe is not sent, so the next query probes the server
+        eq_(breaker.state, OPEN)
+        loop = Loop()
+        future = whois_async(loop, client, 'google.ru', deadline=time.time() + 0.5)
+        ok_(isinstance(future.error, WhoisTimeout))
+        eq_(breaker.state, OPEN)
+        # probe aborted by the loop
+        client.rate_limiter = RateLimiter({})
+        future = whois_async(loop, client, 'google.ru')
+        loop.abort('budget exceeded')
+        ok_(isinstance(future.error, WhoisTimeout))
+        eq_(breaker.state, OPEN)
+        client.whois('google.ru')
+        eq_(breaker.state, CLOSED)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_, ok_
+from mock import patch
+from whois2 import check, LocalCache, WhoisClient
+from whois2.servers import ServerTable
+from whois_server import WhoisServer, fixture_responses
+from test_ratelimit import Clock
+
+
+def test_lru():
+    cache = LocalCache(max_entries=2)
+    cache.set('a', 'A', 0)
+    cache.set('b', 'B', 0)
+    eq_(cache.get('a'), 'A')
+    cache.set('c', 'C', 0)
+    # b is the least recently used
+    eq_(cache.get('b'), None)
+    eq_(cache.get('a'), 'A')
+    eq_(cache.get('c'), 'C')
+    eq_((cache.hits, cache.misses), (3, 1))
+
+
+def test_ttl():
+    clock = Clock()
+    cache = LocalCache(clock=clock)
+    cache.set('a', 'A', 10)
+    cache.set('b', 'B', 0)
+    clock.now = 9
+    eq_(cache.get('a'), 'A')
+    clock.now = 10
+    eq_(cache.get('a'), None)
+    eq_(cache.get('b'), 'B')
+    eq_(cache.size, 2)
+
+
+def test_max_size():
+    cache = LocalCache(max_entries=None, max_size=10)
+    cache.set('a', '1234', 0)
+    cache.set('b', '1234', 0)
+    eq_(cache.size, 10)
+    cache.set('c', '12', 0)
+    eq_(cache.get('a'), None)
+    eq_(cache.size, 8)
+    # entries larger than the whole cache are not kept
+    cache.set('d', '1234567890', 0)
+    eq_(cache.get('d'), None)
+    eq_(cache.size, 8)
+    cache.set('b', '', 0)
+    eq_(cache.size, 4)
+
+
+def test_check_with_local_cache():
+    cache = LocalCache()
+    # an empty cache is still used
+    ok_(cache)
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port)
+        with patch('whois2.utils.default_client', client):
+            eq_(check('google.ru', cache=cache).registered, True)
+            eq_(check('google.ru', cache=cache).registered, True)
+    eq_(len(server.queries), 1)
+    eq_((cache.hits, cache.misses), (1, 1))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_, ok_, raises
+from mock import patch
+from whois2 import check_async, check_many_async, WhoisClient, WhoisConnectionError, WhoisServerNotFound
+from whois2.engine import Loop, whois_async
+from whois2.servers import ServerTable
+from whois_server import WhoisServer, fixture_responses
+from test_transport import referral_responses
+
+
+def test_loop():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({}, cache_path=None), port=server.port, iana_server='127.0.0.1')
+        loop = Loop(concurrency=2)
+        futures = [whois_async(loop, client, domain) for domain in ('google.ru', 'google.com', 'sahchoo5theevaa8peel.ru')]
+        loop.run()
+    with open('tests/whois_data/google.com') as fd:
+        eq_(futures[1].result(), fd.read())
+
+
+def test_check_many_async():
+    domains = ['google.ru', 'sahchoo5theevaa8peel.ru', 'google.c', 'google.aq'] * 20
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1', 'aq': ''}, cache_path=None), port=server.port)
+        with patch('whois2.utils.default_client', client):
+            results = check_many_async(domains, concurrency=10)
+            # result() runs the loop
+            eq_(check_async('google.ru').result().registered, True)
+    eq_([result.registered for result in results[:2]], [True, False])
+    ok_(results[2].invalid)
+    ok_(isinstance(results[3], WhoisServerNotFound))
+    eq_(len(server.queries), 41)
+
+
+@patch('whois2.transport.THIN_SERVERS', set(['127.0.0.1']))
+@patch('whois2.transport.QUERY_FORMATS', {'localhost': 'registrar {0}'})
+@patch('whois2.engine.THIN_SERVERS', set(['127.0.0.1']))
+@patch('whois2.engine.QUERY_FORMATS', {'localhost': 'registrar {0}'})
+def test_referrals():
+    with WhoisServer(referral_responses) as server:
+        client = WhoisClient(ServerTable({'com': '127.0.0.1'}, cache_path=None), port=server.port, timeout=1)
+        loop = Loop()
+        full = whois_async(loop, client, 'example.com')
+        down = whois_async(loop, client, 'down.com')
+        loop.run()
+    ok_(full.result().endswith('John Doe\n'))
+    eq_(down.result(), 'Domain Name: DOWN.COM\nRegistrar WHOIS Server: 127.0.0.2\n')
+
+
+@raises(WhoisConnectionError)
+def test_connection_error():
+    with WhoisServer(fixture_responses) as server:
+        port = server.port
+    client = WhoisClient(ServerTable({}, cache_path=None), port=port, timeout=1)
+    whois_async(Loop(), client, 'google.ru', '127.0.0.1').result()
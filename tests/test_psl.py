@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from nose.tools import eq_, ok_
+from whois2.psl import PublicSuffixIndex, compile_index, compile_file, load_index, parse_rules
+
+
+PSL = u"""// ===BEGIN ICANN DOMAINS===
+
+// uk
+uk
+co.uk
+
+// ck
+*.ck
+!www.ck
+
+// рф
+рф
+
+// ===END ICANN DOMAINS===
+// ===BEGIN PRIVATE DOMAINS===
+
+// Registry : https://registry.example/
+com.ru
+
+// Hosting : https://hosting.example/
+blogspot.ru
+
+// ===END PRIVATE DOMAINS===
+""".encode('utf-8')
+
+
+def test_parse_rules():
+    rules = list(parse_rules(PSL.splitlines(), ['Registry']))
+    eq_(rules, ['uk', 'co.uk', '*.ck', '!www.ck', 'xn--p1ai', 'com.ru'])
+
+
+def test_split():
+    index = PublicSuffixIndex(compile_index(parse_rules(PSL.splitlines(), ['Registry'])))
+    domains = {
+        'google.co.uk': ('google', 'co.uk'),
+        'www.google.co.uk': ('www.google', 'co.uk'),
+        'google.uk': ('google', 'uk'),
+        'foo.bar.ck': ('foo', 'bar.ck'),
+        'www.ck': ('www', 'ck'),
+        'xn--e1aybc.xn--p1ai': ('xn--e1aybc', 'xn--p1ai'),
+        'google.com.ru': ('google', 'com.ru'),
+        'google.blogspot.ru': ('google.blogspot.ru', None),
+        'co.uk': ('co', 'uk'),
+    }
+    for domain, parts in domains.iteritems():
+        eq_(index.split(domain), parts)
+    eq_(list(index.suffixes('uk')), ['co.uk'])
+
+
+def test_load_index():
+    fd, psl_path = tempfile.mkstemp()
+    os.write(fd, PSL)
+    os.close(fd)
+    index_path = psl_path + '.idx'
+    try:
+        compile_file(psl_path, index_path, ['Registry'])
+        index = load_index(index_path, psl_path)
+        ok_('com.ru' in index)
+        ok_('blogspot.ru' not in index)
+        eq_(index.split('google.co.uk'), ('google', 'co.uk'))
+    finally:
+        os.remove(psl_path)
+        os.remove(index_path)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+import time
+import threading
+from nose.tools import eq_, ok_
+from whois2 import WhoisClient, RateLimiter
+from whois2.engine import Loop, whois_async
+from whois2.ratelimit import TokenBucket, AdaptiveLimit, ConcurrencyLimiter
+from whois2.servers import ServerTable
+from whois_server import WhoisServer, fixture_responses
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket():
+    clock = Clock()
+    bucket = TokenBucket(2, 3, clock)
+    eq_([bucket.reserve() for i in range(5)], [0, 0, 0, 0.5, 1.0])
+    clock.now = 1.0
+    # tokens taken in advance are paid back first
+    eq_(bucket.reserve(), 0.5)
+    clock.now = 10.0
+    eq_([bucket.reserve() for i in range(4)], [0, 0, 0, 0.5])
+
+
+def test_abandoned_tokens():
+    clock = Clock()
+    bucket = TokenBucket(1, 1, clock)
+    eq_(bucket.reserve(0.5), 0)
+    # the wait would be too long, so the token is not taken
+    eq_(bucket.reserve(0.5), None)
+    eq_(bucket.reserve(1.0), 1.0)
+    bucket.refund()
+    eq_(bucket.reserve(), 1.0)
+
+
+def test_rate_limiter():
+    clock = Clock()
+    limiter = RateLimiter({'whois.tcinet.ru': (1, 1)}, clock=clock)
+    eq_([limiter.reserve('whois.tcinet.ru') for i in range(3)], [0, 1.0, 2.0])
+    # other servers are not limited
+    eq_([limiter.reserve('whois.verisign-grs.com') for i in range(3)], [0, 0, 0])
+    limiter.set_default(10, 1)
+    eq_([limiter.reserve('whois.verisign-grs.com') for i in range(2)], [0, 0.1])
+    eq_(limiter.reserve('whois.tcinet.ru'), 3.0)
+
+
+def test_client_rate_limit():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             rate_limiter=RateLimiter({'127.0.0.1': (20, 2)}))
+        started = time.time()
+        for i in range(6):
+            client.whois('google.ru')
+        ok_(time.time() - started >= 0.2)
+
+
+def test_loop_rate_limit():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1', 'com': 'localhost'}, cache_path=None), port=server.port,
+                             rate_limiter=RateLimiter({'127.0.0.1': (20, 2)}))
+        loop = Loop()
+        started = time.time()
+        limited = [whois_async(loop, client, 'google.ru') for i in range(6)]
+        unlimited = [whois_async(loop, client, 'google.com') for i in range(6)]
+        unlimited[-1].result()
+        # queries to other servers are not delayed
+        ok_(time.time() - started < 0.1)
+        loop.run()
+        ok_(time.time() - started >= 0.2)
+    eq_(len(server.queries), 12)
+
+
+def test_loop_rate_limit_deadline():
+    with WhoisServer(fixture_responses) as server:
+        limiter = RateLimiter({'127.0.0.1': (2, 1)})
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             rate_limiter=limiter)
+        loop = Loop()
+        futures = [whois_async(loop, client, 'google.ru', deadline=time.time() + 1.2) for i in range(6)]
+        loop.run()
+        eq_(len(server.queries), 3)
+        eq_(len([future for future in futures if future.error is None]), 3)
+        # queries which were not sent don't leave the bucket in debt
+        client.whois('google.ru', deadline=time.time() + 1)
+
+
+def test_adaptive_limit():
+    clock = Clock()
+    limit = AdaptiveLimit(initial=2, maximum=4, clock=clock)
+    ok_(limit.try_acquire())
+    ok_(limit.try_acquire())
+    ok_(not limit.try_acquire())
+    clock.now = 0.1
+    limit.release(0, True)
+    limit.release(0, True)
+    # the limit grows by one per round
+    eq_(limit.limit, 2.9)
+    ok_(limit.try_acquire())
+    ok_(limit.try_acquire())
+    ok_(not limit.try_acquire())
+    # slow answers don't raise the limit
+    clock.now = 1.0
+    limit.release(0.1, True)
+    eq_(limit.limit, 2.9)
+    # failures cut the limit once per round
+    limit.release(0.1, False)
+    eq_(limit.limit, 1.45)
+    ok_(limit.try_acquire())
+    clock.now = 2.0
+    limit.release(0.1, False)
+    eq_(limit.limit, 1.45)
+    limit.try_acquire()
+    limit.release(1.5, False)
+    eq_(limit.limit, 1)
+
+
+def test_loop_concurrency_limit():
+    state = {'in_flight': 0, 'max_in_flight': 0}
+    lock = threading.Lock()
+
+    def responses(query):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        time.sleep(0.01)
+        with lock:
+            state['in_flight'] -= 1
+        if query.startswith('throttled'):
+            return 'Query rate limit exceeded\n'
+        return fixture_responses(query)
+
+    with WhoisServer(responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             concurrency_limiter=ConcurrencyLimiter(initial=2, maximum=3))
+        loop = Loop()
+        futures = [whois_async(loop, client, 'google.ru') for i in range(20)]
+        loop.run()
+        ok_(all(future.result() for future in futures))
+        eq_(state['max_in_flight'], 3)
+        limit = client.concurrency_limiter.get('127.0.0.1')
+        eq_(limit.in_flight, 0)
+        eq_(limit.limit, 3)
+        # throttled answers cut the limit
+        loop = Loop()
+        futures = [whois_async(loop, client, 'throttled.ru') for i in range(3)]
+        loop.run()
+        eq_(limit.limit, 1.5)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import datetime
+from nose.tools import eq_, ok_, raises
+from mock import patch
+from whois2 import check_rdap, parse_rdap_data, RdapClient, WhoisError, WhoisServerNotFound
+from whois2.rdap import ConnectionPool
+from whois2.servers import ServerTable
+from rdap_server import RdapServer
+
+GOOGLE_COM = {
+    'objectClassName': 'domain',
+    'ldhName': 'GOOGLE.COM',
+    'nameservers': [
+        {'objectClassName': 'nameserver', 'ldhName': 'NS1.GOOGLE.COM'},
+        {'objectClassName': 'nameserver', 'ldhName': 'NS2.GOOGLE.COM.'},
+    ],
+    'events': [
+        {'eventAction': 'registration', 'eventDate': '1997-09-15T04:00:00Z'},
+        {'eventAction': 'expiration', 'eventDate': '2028-09-14T04:00:00Z'},
+        {'eventAction': 'last update of RDAP database', 'eventDate': '2024-01-01T00:00:00Z'},
+    ],
+}
+
+
+def test_parse_rdap_data():
+    with RdapServer({'google.com': GOOGLE_COM}) as server:
+        client = RdapClient(ServerTable({'com': server.url}, cache_path=None))
+        result = parse_rdap_data('google.com', client.rdap('google.com'))
+        eq_(result.registered, True)
+        eq_(result.nameservers, ['ns1.google.com', 'ns2.google.com'])
+        eq_(result.created, datetime.datetime(1997, 9, 15, 4, 0))
+        eq_(result.paid_till, datetime.datetime(2028, 9, 14, 4, 0))
+        eq_(parse_rdap_data('sahchoo5theevaa8peel.com', client.rdap('sahchoo5theevaa8peel.com')).registered, False)
+    eq_(server.requests[0][0], '/rdap/domain/google.com')
+
+
+def test_connections_are_reused():
+    with RdapServer({'google.com': GOOGLE_COM}) as server:
+        client = RdapClient(ServerTable({'com': server.url}, cache_path=None), ConnectionPool(timeout=1))
+        for i in range(10):
+            client.rdap('google.com')
+            client.rdap('sahchoo5theevaa8peel.com')
+    eq_(len(server.requests), 20)
+    eq_(len(set(address for path, address in server.requests)), 1)
+
+
+def test_stale_connection():
+    pool = ConnectionPool(timeout=1)
+    with RdapServer({'google.com': GOOGLE_COM}) as server:
+        client = RdapClient(ServerTable({'com': server.url}, cache_path=None), pool)
+        client.rdap('google.com')
+        # the server closes idle connection
+        for connections in pool.idle.values():
+            for connection in connections:
+                connection.sock.close()
+        ok_(client.rdap('google.com'))
+
+
+def test_check_rdap():
+    with RdapServer({'google.com': GOOGLE_COM}) as server:
+        client = RdapClient(ServerTable({'com': server.url}, cache_path=None))
+        with patch('whois2.rdap.default_rdap_client', client):
+            eq_(check_rdap('google.com').registered, True)
+            eq_(check_rdap('sahchoo5theevaa8peel.com').registered, False)
+            ok_(check_rdap('google.com', keep_raw=False).whois_data is None)
+            ok_(check_rdap('google.c').invalid)
+
+
+@raises(WhoisServerNotFound)
+def test_rdap_server_not_found():
+    RdapClient(ServerTable({}, cache_path=None)).rdap('google.ru')
+
+
+def test_invalid_rdap_response():
+    with RdapServer({'google.com': '<html>Service Unavailable</html>'}) as server:
+        client = RdapClient(ServerTable({'com': server.url}, cache_path=None))
+        with patch('whois2.rdap.default_rdap_client', client):
+            try:
+                check_rdap('google.com')
+            except WhoisError as e:
+                ok_('google.com > invalid RDAP response: <html>' in str(e))
+            else:
+                ok_(False, 'WhoisError is not raised')
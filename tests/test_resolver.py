@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import time
+import socket
+from nose.tools import eq_, ok_
+from mock import patch
+from whois2 import WhoisClient
+from whois2.engine import Loop, whois_async
+from whois2.resolver import Resolver, interleave, connect
+from whois2.servers import ServerTable
+from whois_server import WhoisServer, fixture_responses
+from test_ratelimit import Clock
+
+class StalledServer(object):
+    """
+    Listening socket with full accept queue, connecting to it hangs, like
+    connecting over broken IPv6
+    """
+
+    def __enter__(self):
+        self.sock = socket.socket()
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(0)
+        self.address = (socket.AF_INET, socket.SOCK_STREAM, 6, '', self.sock.getsockname())
+        self.client = socket.create_connection(self.sock.getsockname())
+        return self
+
+    def __exit__(self, *args):
+        self.client.close()
+        self.sock.close()
+
+
+V4 = (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('192.0.2.1', 43))
+V6 = (socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('2001:db8::1', 43, 0, 0))
+
+
+def test_interleave():
+    eq_(interleave([V6, V6, V6, V4]), [V6, V4, V6, V6])
+    eq_(interleave([V4, V4, V6]), [V4, V6, V4])
+    eq_(interleave([]), [])
+
+
+def test_resolver_ttl():
+    clock = Clock()
+    resolver = Resolver(ttl=60, clock=clock)
+    with patch('socket.getaddrinfo', return_value=[V6, V6, V4]) as getaddrinfo:
+        eq_(resolver.resolve('whois.nic.ru', 43), [V6, V4, V6])
+        resolver.resolve('whois.nic.ru', 43)
+        eq_(getaddrinfo.call_count, 1)
+        clock.now = 60
+        resolver.resolve('whois.nic.ru', 43)
+        eq_(getaddrinfo.call_count, 2)
+
+
+def test_connect_falls_back():
+    with WhoisServer(fixture_responses) as dead:
+        dead_address = (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', dead.port))
+    with WhoisServer(fixture_responses) as server:
+        address = (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', server.port))
+        sock = connect([dead_address, address], timeout=1, delay=10)
+        eq_(sock.getpeername(), ('127.0.0.1', server.port))
+        sock.close()
+
+
+def test_addresses_are_cached():
+    with WhoisServer(fixture_responses) as dead:
+        dead_port = dead.port
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': 'whois.example'}, cache_path=None), port=server.port)
+        addresses = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', dead_port)),
+                     (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', server.port))]
+        with patch('socket.getaddrinfo', return_value=addresses) as getaddrinfo:
+            client.whois('google.ru')
+            loop = Loop()
+            future = whois_async(loop, client, 'google.ru')
+            loop.run()
+            future.result()
+        eq_(getaddrinfo.call_count, 1)
+    eq_(len(server.queries), 2)
+
+
+def test_connect_races_stalled_address():
+    with StalledServer() as stalled, WhoisServer(fixture_responses) as server:
+        address = (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', server.port))
+        started = time.time()
+        sock = connect([stalled.address, address], timeout=5)
+        ok_(time.time() - started < 1)
+        eq_(sock.getpeername(), ('127.0.0.1', server.port))
+        sock.close()
+
+
+def test_loop_races_stalled_address():
+    with StalledServer() as stalled, WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': 'whois.example'}, cache_path=None), port=server.port, timeout=5)
+        addresses = [stalled.address, (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', server.port))]
+        with patch('socket.getaddrinfo', return_value=addresses):
+            loop = Loop()
+            started = time.time()
+            futures = [whois_async(loop, client, 'google.ru') for i in range(3)]
+            loop.run()
+        ok_(time.time() - started < 1)
+        ok_(all(future.result() for future in futures))
+    eq_(len(server.queries), 3)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_, raises
+from whois2 import check, check_many, set_default_client, WhoisClient, SourceAddressPool, LEAST_THROTTLED, RateLimiter
+from whois2.engine import Loop, whois_async
+from whois2.servers import ServerTable
+from whois_server import WhoisServer, fixture_responses
+from test_ratelimit import Clock
+
+
+def test_round_robin():
+    pool = SourceAddressPool(['127.0.0.2', '127.0.0.3'])
+    eq_([pool.choose('whois.nic.ru') for i in range(4)], ['127.0.0.2', '127.0.0.3'] * 2)
+    # throttling doesn't matter in turn
+    pool.throttled('127.0.0.2', 'whois.nic.ru')
+    eq_(pool.choose('whois.nic.ru'), '127.0.0.2')
+
+
+def test_least_throttled():
+    clock = Clock()
+    pool = SourceAddressPool(['127.0.0.2', '127.0.0.3', '127.0.0.4'], LEAST_THROTTLED, clock)
+    clock.now = 1
+    pool.throttled('127.0.0.2', 'whois.nic.ru')
+    clock.now = 2
+    pool.throttled('127.0.0.3', 'whois.nic.ru')
+    eq_(pool.choose('whois.nic.ru'), '127.0.0.4')
+    clock.now = 3
+    pool.throttled('127.0.0.4', 'whois.nic.ru')
+    eq_(pool.choose('whois.nic.ru'), '127.0.0.2')
+    # throttling is tracked per server
+    eq_(pool.choose('whois.verisign-grs.com'), '127.0.0.3')
+
+
+@raises(ValueError)
+def test_empty_pool():
+    SourceAddressPool([])
+
+
+def test_rate_limit_per_source():
+    limiter = RateLimiter({'whois.nic.ru': (1.0, 1)}, clock=Clock())
+    eq_(limiter.try_acquire('whois.nic.ru', '127.0.0.2'), True)
+    eq_(limiter.try_acquire('whois.nic.ru', '127.0.0.2'), False)
+    eq_(limiter.try_acquire('whois.nic.ru', '127.0.0.3'), True)
+
+
+def test_queries_are_spread_across_sources():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             source_addresses=SourceAddressPool(['127.0.0.2', '127.0.0.3']))
+        for i in range(2):
+            client.whois('google.ru')
+        loop = Loop()
+        futures = [whois_async(loop, client, 'google.ru') for i in range(2)]
+        loop.run()
+        [future.result() for future in futures]
+    addresses = [address for query, address in server.queries]
+    eq_(addresses[:2], ['127.0.0.2', '127.0.0.3'])
+    # concurrent queries may arrive in any order
+    eq_(sorted(addresses[2:]), ['127.0.0.2', '127.0.0.3'])
+
+
+def test_throttled_source_is_avoided():
+    def responses(query):
+        if server.queries[-1][1] == '127.0.0.2':
+            return 'Query rate limit exceeded, try again later\n'
+        return fixture_responses(query)
+
+    with WhoisServer(responses) as server:
+        pool = SourceAddressPool(['127.0.0.2', '127.0.0.3'], LEAST_THROTTLED)
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             source_addresses=pool)
+        for i in range(3):
+            client.whois('google.ru')
+    eq_([address for query, address in server.queries], ['127.0.0.2', '127.0.0.3', '127.0.0.3'])
+
+
+def test_set_default_client():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             source_addresses=SourceAddressPool(['127.0.0.2', '127.0.0.3']))
+        previous = set_default_client(client)
+        try:
+            eq_(check('google.ru').registered, True)
+            eq_([result.registered for result in check_many(['google.ru', 'google.ru'], workers=1)], [True, True])
+        finally:
+            eq_(set_default_client(previous), client)
+    eq_([address for query, address in server.queries], ['127.0.0.2', '127.0.0.3', '127.0.0.2'])
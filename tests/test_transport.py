@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import tempfile
+from nose.tools import eq_, ok_, raises
+from mock import patch, Mock
+from whois2 import check, check_many, check_many_async, RetryPolicy, WhoisThrottled, WhoisTimeout, WhoisClient, WhoisError, WhoisConnectionError, WhoisServerNotFound, REGISTRY_REFERRALS
+from whois2.servers import ServerTable, parse_iana_dump
+from whois2.transport import parse_referral, Latencies, RegistrarServers
+from whois_server import WhoisServer, fixture_responses
+from test_ratelimit import Clock
+
+
+def test_parse_referral():
+    eq_(parse_referral('domain: RU\nwhois:        whois.tcinet.ru\n'), 'whois.tcinet.ru')
+    eq_(parse_referral('refer: whois.verisign-grs.com\nwhois: whois.iana.org'), 'whois.verisign-grs.com')
+    eq_(parse_referral('domain: AQ\n'), None)
+
+
+def test_whois_client():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({}, cache_path=None), port=server.port, iana_server='127.0.0.1')
+        with open('tests/whois_data/google.ru') as fd:
+            eq_(client.whois('google.ru'), fd.read())
+        client.whois('sahchoo5theevaa8peel.ru')
+    # server of the tld is learned once
+    eq_([query for query, address in server.queries], ['ru', 'google.ru', 'sahchoo5theevaa8peel.ru'])
+
+
+def test_check_with_native_transport():
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({}, cache_path=None), port=server.port, iana_server='127.0.0.1')
+        with patch('whois2.utils.default_client', client):
+            eq_(check('google.ru').registered, True)
+            eq_(check('sahchoo5theevaa8peel.ru').registered, False)
+
+
+@raises(WhoisConnectionError)
+def test_connection_error():
+    with WhoisServer(fixture_responses) as server:
+        port = server.port
+    WhoisClient(port=port, timeout=1).whois('google.ru', '127.0.0.1')
+
+
+def test_server_table():
+    fd, cache_path = tempfile.mkstemp()
+    os.close(fd)
+    os.remove(cache_path)
+    try:
+        servers = ServerTable({'ru': 'whois.tcinet.ru', 'spb.ru': 'whois.nic.ru', 'aq': ''}, cache_path)
+        eq_(servers.get('google.ru'), 'whois.tcinet.ru')
+        eq_(servers.get('google.spb.ru'), 'whois.nic.ru')
+        eq_(servers.get('google.aq'), '')
+        eq_(servers.get('google.nonexistent'), None)
+        servers.learn('nonexistent', 'whois.nic.nonexistent')
+        # learned servers survive restarts
+        eq_(ServerTable({}, cache_path).get('google.nonexistent'), 'whois.nic.nonexistent')
+    finally:
+        os.remove(cache_path)
+
+
+def test_referral_is_learned():
+    with WhoisServer(fixture_responses) as server:
+        servers = ServerTable({}, cache_path=None)
+        client = WhoisClient(servers, port=server.port, iana_server='127.0.0.1')
+        client.whois('google.ru')
+    eq_(servers.get('google.ru'), '127.0.0.1')
+
+
+def test_iana_errors_are_not_learned():
+    answers = ['Query rate limit exceeded, try again later\n', '% This query returned 0 objects.\n',
+               'domain: AQ\norganisation: Antarctica\n']
+
+    def responses(query):
+        return answers[len(server.queries) - 1]
+
+    with WhoisServer(responses) as server:
+        servers = ServerTable({}, cache_path=None)
+        client = WhoisClient(servers, port=server.port, iana_server='127.0.0.1')
+        try:
+            client.whois('google.ru')
+        except WhoisThrottled:
+            pass
+        else:
+            ok_(False, 'WhoisThrottled is not raised')
+        eq_(servers.get('google.ru'), None)
+        try:
+            client.whois('google.ru')
+        except WhoisServerNotFound:
+            pass
+        else:
+            ok_(False, 'WhoisServerNotFound is not raised')
+        eq_(servers.get('google.ru'), None)
+        # the zone has no whois server
+        try:
+            client.whois('google.aq')
+        except WhoisServerNotFound:
+            pass
+        else:
+            ok_(False, 'WhoisServerNotFound is not raised')
+        eq_(servers.get('google.aq'), '')
+
+def test_parse_iana_dump():
+    dump = [
+        '% IANA WHOIS server',
+        'domain:       RU',
+        'whois:        whois.tcinet.ru',
+        'status:       ACTIVE',
+        'domain:       AQ',
+        'status:       ACTIVE',
+    ]
+    eq_(parse_iana_dump(dump), {'ru': 'whois.tcinet.ru', 'aq': ''})
+
+
+def referral_responses(query):
+    # registry answers plain queries, registrar is "localhost", which is
+    # queried with "registrar" prefix
+    if query.startswith('registrar '):
+        return 'Registrant Name: John Doe\n'
+    if query == 'down.com':
+        return 'Domain Name: DOWN.COM\nRegistrar WHOIS Server: 127.0.0.2\n'
+    return 'Domain Name: {0}\nRegistrar WHOIS Server: localhost\n'.format(query.upper())
+
+
+@patch('whois2.transport.THIN_SERVERS', set(['127.0.0.1']))
+@patch('whois2.transport.QUERY_FORMATS', {'localhost': 'registrar {0}'})
+def test_referrals():
+    with WhoisServer(referral_responses) as server:
+        client = WhoisClient(ServerTable({'com': '127.0.0.1'}, cache_path=None), port=server.port, timeout=1)
+        eq_(client.whois('example.com', referrals=REGISTRY_REFERRALS),
+            'Domain Name: EXAMPLE.COM\nRegistrar WHOIS Server: localhost\n')
+        eq_(client.whois('example.com'),
+            'Domain Name: EXAMPLE.COM\nRegistrar WHOIS Server: localhost\n\nRegistrant Name: John Doe\n')
+        eq_(client.registrar_servers.get('example.com'), 'localhost')
+        # registrar is known, both servers are queried at once
+        del server.queries[:]
+        ok_(client.whois('example.com').endswith('John Doe\n'))
+        eq_(sorted(query for query, address in server.queries), ['example.com', 'registrar example.com'])
+        # answer of the registry is returned if the registrar is down
+        eq_(client.whois('down.com'), 'Domain Name: DOWN.COM\nRegistrar WHOIS Server: 127.0.0.2\n')
+
+
+@patch('whois2.transport.THIN_SERVERS', set(['127.0.0.1']))
+@patch('whois2.transport.QUERY_FORMATS', {'localhost': 'registrar {0}'})
+def test_changed_referrals():
+    clock = Clock()
+    with WhoisServer(referral_responses) as server:
+        client = WhoisClient(ServerTable({'com': '127.0.0.1'}, cache_path=None), port=server.port, timeout=1)
+        client.registrar_servers = RegistrarServers(ttl=60, clock=clock)
+        client.whois('example.com')
+        # the domain moved to another registrar, its answer replaces the parallel one
+        client.registrar_servers.set('example.com', '127.0.0.1')
+        del server.queries[:]
+        ok_(client.whois('example.com').endswith('John Doe\n'))
+        eq_(sorted(query for query, address in server.queries), ['example.com', 'example.com', 'registrar example.com'])
+        eq_(client.registrar_servers.get('example.com'), 'localhost')
+        # stale registrar is not queried before the registry refers to it
+        clock.now += 60
+        eq_(client.registrar_servers.get('example.com'), None)
+        client.registrar_servers.set('example.com', '127.0.0.1')
+        clock.now += 60
+        del server.queries[:]
+        ok_(client.whois('example.com').endswith('John Doe\n'))
+        eq_(sorted(query for query, address in server.queries), ['example.com', 'registrar example.com'])
+
+
+@patch('whois2.transport.THIN_SERVERS', set(['127.0.0.1']))
+@patch('whois2.transport.QUERY_FORMATS', {'localhost': 'registrar {0}'})
+def test_whois_many():
+    with WhoisServer(referral_responses) as server:
+        client = WhoisClient(ServerTable({'com': '127.0.0.1', 'aq': ''}, cache_path=None), port=server.port, timeout=1)
+        result = client.whois_many(['a.com', 'b.com', 'c.aq'])
+    eq_(sorted(result), ['a.com', 'b.com', 'c.aq'])
+    ok_(result['a.com'].endswith('John Doe\n'))
+    ok_(isinstance(result['c.aq'], WhoisServerNotFound))
+
+
+def test_check_many():
+    domains = ['google.ru', 'google.c', 'sahchoo5theevaa8peel.ru', 'google.aq'] * 5
+    with WhoisServer(fixture_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1', 'aq': ''}, cache_path=None), port=server.port)
+        with patch('whois2.utils.default_client', client):
+            with patch('whois2.utils.subprocess_whois', Mock(side_effect=WhoisError('whois is down'))):
+                results = list(check_many(domains, workers=4))
+                unordered = list(check_many(domains, workers=4, ordered=False))
+    eq_([result.domain for result in results], domains)
+    eq_(results[0].registered, True)
+    ok_(results[1].invalid)
+    eq_(results[2].registered, False)
+    ok_(results[3].failed)
+    eq_(str(results[3].error), 'whois is down')
+    eq_(sorted(result.domain for result in unordered), sorted(domains))
+    ok_(all(result.invalid for result in unordered[:5]))
+    # invalid domains are not fetched
+    eq_(len(server.queries), 20)
+
+
+class Cache(object):
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, timeout):
+        self.values[key] = value
+
+
+def test_throttled_queries_are_retried():
+    answers = ['Query rate limit exceeded\n', 'Too many requests, try again later\n']
+
+    def responses(query):
+        if answers:
+            return answers.pop(0)
+        return fixture_responses(query)
+
+    delays = []
+    retry = RetryPolicy(attempts=3, delay=0.01, jitter=0, sleep=delays.append)
+    with WhoisServer(responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port)
+        with patch('whois2.utils.default_client', client):
+            cache = Cache()
+            eq_(check('google.ru', cache=cache, retry=retry).registered, True)
+            eq_(delays, [0.01, 0.02])
+            eq_(cache.values.keys(), ['google.ru:'])
+            answers.extend(['Query rate limit exceeded\n'] * 3)
+            cache.values.clear()
+            try:
+                check('google.ru', cache=cache, retry=retry)
+            except WhoisThrottled:
+                pass
+            else:
+                ok_(False, 'WhoisThrottled is not raised')
+            # throttled answers are not cached
+            eq_(cache.values, {})
+
+
+def slow_responses(query):
+    if query.startswith('slow'):
+        time.sleep(1)
+    return fixture_responses(query.replace('slow', 'google'))
+
+
+def test_timeout():
+    with WhoisServer(slow_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port)
+        with patch('whois2.utils.default_client', client):
+            started = time.time()
+            try:
+                check('slow.ru', timeout=0.2)
+            except WhoisTimeout:
+                pass
+            else:
+                ok_(False, 'WhoisTimeout is not raised')
+            ok_(time.time() - started < 0.5)
+            eq_(check('google.ru', timeout=0.2).registered, True)
+
+
+def test_batch_budget():
+    domains = ['google.ru', 'slow.ru', 'sahchoo5theevaa8peel.ru']
+    with WhoisServer(slow_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port)
+        with patch('whois2.utils.default_client', client):
+            for batch in (lambda: list(check_many(domains, budget=0.3)),
+                          lambda: check_many_async(domains, budget=0.3)):
+                started = time.time()
+                results = batch()
+                ok_(time.time() - started < 0.6)
+                eq_(results[0].registered, True)
+                eq_(results[2].registered, False)
+                # unresolved domains are reported
+                ok_(isinstance(getattr(results[1], 'error', results[1]), WhoisTimeout))
+
+
+def hedged_responses(query):
+    # alternate server is "localhost", which is queried with "alt" prefix
+    if query.startswith('alt '):
+        return fixture_responses(query.replace('alt slow', 'google'))
+    return slow_responses(query)
+
+
+@patch('whois2.transport.QUERY_FORMATS', {'localhost': 'alt {0}'})
+def test_hedged_requests():
+    with WhoisServer(hedged_responses) as server:
+        client = WhoisClient(ServerTable({'ru': '127.0.0.1'}, cache_path=None), port=server.port,
+                             alternate_servers={'ru': ('localhost', )})
+        client.latencies = Latencies(min_samples=1)
+        client.latencies.record('127.0.0.1', 0.05)
+        with patch('whois2.utils.default_client', client):
+            started = time.time()
+            eq_(check('slow.ru', hedge=True).registered, True)
+            ok_(time.time() - started < 0.5)
+            eq_(sorted(query for query, address in server.queries), ['alt slow.ru', 'slow.ru'])
+            # fast answers are not hedged
+            del server.queries[:]
+            check('google.ru', hedge=True)
+            eq_(server.queries, [('google.ru', '127.0.0.1')])
+            # alternate server is not queried over its rate limit
+            del server.queries[:]
+            client.rate_limiter.set_limit('localhost', 1, 1)
+            client.rate_limiter.reserve('localhost')
+            started = time.time()
+            check('slow.ru', hedge=True)
+            ok_(time.time() - started >= 1)
+            eq_(server.queries, [('slow.ru', '127.0.0.1')])
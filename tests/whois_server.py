@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Loopback stand-in whois server for tests
+"""
+import threading
+import SocketServer
+
+
+class WhoisHandler(SocketServer.StreamRequestHandler):
+
+    def handle(self):
+        query = self.rfile.readline().strip()
+        self.server.queries.append((query, self.client_address[0]))
+        response = self.server.responses(query)
+        if response is not None:
+            self.wfile.write(response)
+
+
+class WhoisServer(SocketServer.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, responses, host='127.0.0.1'):
+        """
+        :param responses: callable returning the response for the query, or
+                          None to close the connection without response
+        """
+        SocketServer.ThreadingTCPServer.__init__(self, (host, 0), WhoisHandler)
+        self.responses = responses
+        self.queries = []
+        self.port = self.server_address[1]
+
+    def __enter__(self):
+        thread = threading.Thread(target=self.serve_forever, args=(0.05, ))
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+def fixture_responses(query):
+    """
+    Respond with tests/whois_data fixtures, and as IANA server for top level
+    domains
+    """
+    domain = query.split()[-1]
+    if '.' not in domain:
+        return 'domain: {0}\nwhois: 127.0.0.1\n'.format(domain.upper())
+    with open('tests/whois_data/{0}'.format(domain)) as fd:
+        return fd.read()
@@ -1,27 +1,257 @@
 # -*- coding: utf-8 -*-
-from .utils import get_whois, normalize_domain_name, WhoisDomain, WhoisDomainInvalid, _
+import time
+from multiprocessing.pool import ThreadPool
+
+from .utils import get_whois, normalize_domain_name, WhoisDomain, WhoisDomainInvalid, WhoisDomainError, RU_SUBDOMAINS, COMPRESS_RAW, _
+from .utils import get_cache_key, set_default_client, RetryPolicy, DEFAULT_CACHE_TIMEOUT, DEFAULT_RETRY, NO_RETRY
+from . import utils
+from .errors import WhoisError, WhoisConnectionError, WhoisServerNotFound, WhoisThrottled, WhoisTimeout, WhoisServerTimeout, CircuitOpenError
+from .transport import WhoisClient, SOCKET_TRANSPORT, SUBPROCESS_TRANSPORT, REGISTRY_REFERRALS, FULL_REFERRALS, DEFAULT_WORKERS
 from .validators import tld_validator
-from .parsers import tld_parser
+from .parsers import tld_parser, get_parsers
+from .suffixes import SuffixIndex
+from .parser_utils import ParseCache, TemplateFlag, normalize_text
+from .cache import LocalCache
+from .psl import public_suffixes
+from .rdap import RdapClient, get_rdap, parse_rdap
+from .ratelimit import RateLimiter
+from .breaker import CircuitBreakers
+from .sources import SourceAddressPool, ROUND_ROBIN, LEAST_THROTTLED
+from .engine import Loop, Future, whois_async, completed, DEFAULT_CONCURRENCY
 from .data import zones
 
-SUPPORTED_TLD = zones
+SUPPORTED_TLD = zones + RU_SUBDOMAINS
+
+STATUS_FIELDS = set(['registered'])
+
+# built once at import, see extract_tld
+tld_index = SuffixIndex(SUPPORTED_TLD)
+
+tld_validator.freeze()
+tld_parser.freeze()
+
+# parsed attributes of recent whois responses, see parse_whois_data
+parse_cache = ParseCache()
 
-def check(domain, cache=None, cache_timeout=None):
+
+def check(domain, cache=None, cache_timeout=None, fields=None, keep_raw=True, retry=DEFAULT_RETRY, timeout=None,
+          hedge=False):
+    """
+    Check the domain and return the WhoisDomain (or WhoisDomainInvalid) object
+
+    :param fields: names of WhoisDomain attributes to parse right away, other
+                   attributes are parsed on first access. For example, pass
+                   ('registered', ) to get registration status, the parsing
+                   stops as soon as the status is known.
+    :param keep_raw: if False, parse the fields (all of them by default) and
+                     then drop whois data. If COMPRESS_RAW, keep whois data
+                     compressed.
+    :param retry: RetryPolicy of queries throttled by whois server, answers
+                  are recognized as throttled by 'throttled' parsers of the tld
+    :param timeout: max number of seconds to get whois data in, WhoisTimeout
+                    is raised if it's exceeded
+    :param hedge: if the whois server is slow, query an alternate server of
+                  the zone too (see get_whois)
+
+    If only registration status is asked for, referrals of thin registries to
+    registrar whois servers are not followed.
+    """
     domain = normalize_domain_name(domain)
-    validation_errors = get_validation_errors(domain)
+    name, tld = extract_tld(domain)
+    validation_errors = _get_validation_errors(domain, name, tld)
     if validation_errors:
         return WhoisDomainInvalid(domain, validation_errors)
-    name, tld = extract_tld(domain)
-    whois_data = get_whois(domain, cache=cache, cache_timeout=cache_timeout)
-    whois_result = parse_whois_data(domain, whois_data)
+    whois_data = get_whois(domain, cache=cache, cache_timeout=cache_timeout, referrals=get_referrals(fields),
+                           retry=retry, throttled=get_throttled(domain, name, tld), timeout=timeout, hedge=hedge)
+    whois_result = _parse_whois_data(domain, name, tld, whois_data, fields, keep_raw)
     return whois_result
 
 
+def check_many(domains, workers=DEFAULT_WORKERS, ordered=True, cache=None, cache_timeout=None, fields=None, keep_raw=True,
+               retry=DEFAULT_RETRY, timeout=None, budget=None, hedge=False):
+    """
+    Check the domains in a pool of threads and yield results: WhoisDomain,
+    WhoisDomainInvalid, or WhoisDomainError objects for domains which whois
+    data can't be received for
+
+    All domains are validated up front, whois data is fetched for valid ones
+    only. Other arguments are the same as for check(..).
+
+    :param workers: number of threads
+    :param ordered: if True, yield results in the order of domains, otherwise
+                    as soon as they are ready (invalid domains first)
+    :param timeout: max number of seconds to get whois data of every domain in
+    :param budget: max number of seconds to check all domains in, counted
+                   from the first result asked for. Domains which are not
+                   resolved by then yield WhoisDomainError with WhoisTimeout.
+    """
+    deadline = None
+    if budget is not None:
+        deadline = time.time() + budget
+    results = []
+    for domain in domains:
+        domain = normalize_domain_name(domain)
+        name, tld = extract_tld(domain)
+        validation_errors = _get_validation_errors(domain, name, tld)
+        if validation_errors:
+            results.append(WhoisDomainInvalid(domain, validation_errors))
+        else:
+            results.append((domain, name, tld))
+    valid = [result for result in results if isinstance(result, tuple)]
+    referrals = get_referrals(fields)
+
+    def fetch((domain, name, tld)):
+        try:
+            if deadline is not None and time.time() >= deadline:
+                raise WhoisTimeout('{0} > not resolved within the time budget'.format(domain))
+            whois_data = get_whois(domain, cache=cache, cache_timeout=cache_timeout, referrals=referrals,
+                                   retry=retry, throttled=get_throttled(domain, name, tld), timeout=timeout,
+                                   deadline=deadline, hedge=hedge)
+        except WhoisError as e:
+            return WhoisDomainError(domain, e)
+        return _parse_whois_data(domain, name, tld, whois_data, fields, keep_raw)
+
+    pool = ThreadPool(max(1, min(workers, len(valid))))
+    try:
+        if ordered:
+            fetched = pool.imap(fetch, valid)
+            for result in results:
+                yield next(fetched) if isinstance(result, tuple) else result
+        else:
+            for result in results:
+                if not isinstance(result, tuple):
+                    yield result
+            for result in pool.imap_unordered(fetch, valid):
+                yield result
+    finally:
+        pool.terminate()
+
+
+def check_async(domain, cache=None, cache_timeout=None, fields=None, keep_raw=True, loop=None, timeout=None):
+    """
+    Start checking the domain on the non-blocking loop (see whois2.engine),
+    and return the Future of the WhoisDomain (or WhoisDomainInvalid) object
+
+    Arguments are the same as for check(..), if timeout is exceeded, the
+    future fails with WhoisTimeout. Future.result() runs the loop
+    until the result is ready; to check many domains at once, start all of
+    them on one loop and run it, or use check_many_async(..).
+
+    Unlike check(..), domains of zones without known whois server are not
+    passed to "whois" command line utility, their futures fail with
+    WhoisServerNotFound, and throttled queries are not retried, their futures
+    fail with WhoisThrottled.
+    """
+    if loop is None:
+        loop = Loop()
+    domain = normalize_domain_name(domain)
+    name, tld = extract_tld(domain)
+    validation_errors = _get_validation_errors(domain, name, tld)
+    if validation_errors:
+        return completed(WhoisDomainInvalid(domain, validation_errors), loop)
+    referrals = get_referrals(fields)
+    cache_key = get_cache_key(domain, referrals=referrals)
+    whois_data = cache.get(cache_key) if cache else None
+    if whois_data is not None:
+        return completed(_parse_whois_data(domain, name, tld, whois_data, fields, keep_raw), loop)
+
+    def parse(whois_data):
+        if get_throttled(domain, name, tld)(whois_data):
+            raise WhoisThrottled('{0} > {1}'.format(domain, whois_data.strip()[:200]))
+        if cache:
+            cache.set(cache_key, whois_data, cache_timeout or DEFAULT_CACHE_TIMEOUT)
+        return _parse_whois_data(domain, name, tld, whois_data, fields, keep_raw)
+
+    deadline = None
+    if timeout is not None:
+        deadline = time.time() + timeout
+    return whois_async(loop, utils.default_client, domain, referrals=referrals, deadline=deadline).then(parse)
+
+
+def check_many_async(domains, concurrency=DEFAULT_CONCURRENCY, cache=None, cache_timeout=None, fields=None, keep_raw=True,
+                     timeout=None, budget=None):
+    """
+    Check the domains on one non-blocking loop, with at most concurrency
+    whois queries in flight, and return the list of results in the order of
+    domains: WhoisDomain (or WhoisDomainInvalid) objects, or WhoisError
+    instances for domains which failed
+
+    :param timeout: max number of seconds to get whois data of every domain in
+    :param budget: max number of seconds to check all domains in, domains
+                   which are not resolved by then get WhoisTimeout errors
+    """
+    loop = Loop(concurrency)
+    futures = [check_async(domain, cache, cache_timeout, fields, keep_raw, loop, timeout) for domain in domains]
+    loop.run(None if budget is None else time.time() + budget)
+    return [future.value if future.error is None else future.error for future in futures]
+
+
+def check_rdap(domain, cache=None, cache_timeout=None, keep_raw=True):
+    """
+    Check the domain with RDAP and return the WhoisDomain (or
+    WhoisDomainInvalid) object
+
+    RDAP response is structured, so all attributes are set right away.
+
+    :param keep_raw: if False, drop RDAP response (available as whois_data)
+    """
+    domain = normalize_domain_name(domain)
+    name, tld = extract_tld(domain)
+    validation_errors = _get_validation_errors(domain, name, tld)
+    if validation_errors:
+        return WhoisDomainInvalid(domain, validation_errors)
+    rdap_data = get_rdap(domain, cache=cache, cache_timeout=cache_timeout)
+    return parse_rdap_data(domain, rdap_data, keep_raw)
+
+
+def parse_rdap_data(domain, rdap_data, keep_raw=True):
+    """
+    Parse RDAP response and return the WhoisDomain object
+    """
+    name, tld = extract_tld(domain)
+    whois = WhoisDomain(domain, rdap_data, name, tld)
+    parse_rdap(whois, rdap_data)
+    if keep_raw is not True:
+        whois.drop_raw(compress=keep_raw == COMPRESS_RAW)
+    return whois
+
+
+def get_throttled(domain, name, tld):
+    """
+    Return function, which returns True if whois data of the domain is an
+    answer of the server refusing to answer because of too many queries
+
+    Templates of 'throttled' parsers of the zone are matched against the raw
+    text right away, without building whois objects, and the text normalized
+    by the transport for the same check is reused.
+    """
+    matchers = [parser.matcher for parser in get_parsers(tld, ('throttled', ))
+                if isinstance(parser, TemplateFlag) and parser.attribute_name == 'throttled']
+
+    def throttled(whois_data):
+        text = normalize_text(whois_data)
+        return any(matcher.search(text) for matcher in matchers)
+    return throttled
+
+
+def get_referrals(fields):
+    """
+    Return referrals mode of get_whois(..) sufficient to parse the fields
+    """
+    if fields is not None and set(fields) == STATUS_FIELDS:
+        return REGISTRY_REFERRALS
+    return FULL_REFERRALS
+
+
 def get_validation_errors(domain):
+    name, tld = extract_tld(domain)
+    return _get_validation_errors(domain, name, tld)
+
+
+def _get_validation_errors(domain, name, tld):
     # basic validation
     if not '.' in domain:
         return [_('invalid domain name')]
-    name, tld = extract_tld(domain)
     if tld is None:
         prefix, suffix = domain.rsplit('.', 1)
         return [_('there are no rules to handle .{0} domains').format(suffix)]
@@ -34,18 +264,29 @@ def get_validation_errors(domain):
     return errors
 
 
-def parse_whois_data(domain, whois_data):
+def parse_whois_data(domain, whois_data, fields=None, keep_raw=True):
+    """
+    Parse whois data and return the WhoisDomain object
+
+    Parsed attributes are remembered in parse_cache, so responses, which are
+    the same as recent ones up to the domain name, are not parsed again
+    """
     name, tld = extract_tld(domain)
-    whois = WhoisDomain(domain, whois_data)
-    for parser in tld_parser.get(tld):
-        parser(whois, name, tld)
-    # while we have only one parser to check is domain not registered
-    # that if registered is None, it means this parser found nothing
-    whois.registered = getattr(whois, 'registered', True)
+    return _parse_whois_data(domain, name, tld, whois_data, fields, keep_raw)
+
+
+def _parse_whois_data(domain, name, tld, whois_data, fields=None, keep_raw=True):
+    parsed_values = parse_cache.get(domain, tld, whois_data)
+    whois = WhoisDomain(domain, whois_data, name, tld, get_parsers(tld), parsed_values)
+    if keep_raw is True:
+        whois.parse(fields or ())
+    else:
+        whois.parse(fields)
+        whois.drop_raw(compress=keep_raw == COMPRESS_RAW)
     return whois
 
 
-def extract_tld(domain):
+def extract_tld(domain, suffixes=None):
     """
     extract tld, based on the list of registry suffixes, starting from the
     longest one.
@@ -55,9 +296,14 @@ def extract_tld(domain):
 
     If there is no such suffix, appropriate for the domain, then function
     returns ['full_domain.tld', None]
+
+    Suffixes are taken from the Public Suffix List (see whois2.psl), then from
+    SUPPORTED_TLD, so that 'google.co.uk' is split as ['google', 'co.uk'].
+    Pass another list of suffixes to split the domain against it instead.
     """
-    suffixes = sorted(SUPPORTED_TLD, key=len, reverse=True)
-    for suffix in suffixes:
-        if domain.endswith('.{0}'.format(suffix)):
-            return domain[:-len(suffix)-1], domain[-len(suffix):]
-    return domain, None
+    if suffixes is not None and suffixes is not SUPPORTED_TLD:
+        return SuffixIndex(suffixes).split(domain)
+    name, tld = public_suffixes.split(domain)
+    if tld is None:
+        name, tld = tld_index.split(domain)
+    return name, tld
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Circuit breakers of whois servers.
+
+After several connection failures in a row the circuit of the server opens,
+and queries to the server fail right away with CircuitOpenError instead of
+waiting for timeouts. After reset_timeout one query is let through to probe
+the server: if it succeeds, the circuit closes, otherwise it opens again.
+"""
+import time
+import threading
+
+from .errors import CircuitOpenError, WhoisConnectionError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+DEFAULT_MAX_FAILURES = 5
+DEFAULT_RESET_TIMEOUT = 60
+
+
+class CircuitBreaker(object):
+
+    def __init__(self, server, max_failures=DEFAULT_MAX_FAILURES, reset_timeout=DEFAULT_RESET_TIMEOUT,
+                 clock=time.time):
+        """
+        Circuit breaker of one whois server
+
+        :param max_failures: number of failures in a row which open the circuit
+        :param reset_timeout: seconds to wait before probing the server
+        :param clock: function returning current time in seconds
+        """
+        self.server = server
+        self.max_failures = max_failures
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = None
+        self.lock = threading.Lock()
+
+    def check(self):
+        """
+        Check whether the server can be queried
+
+        :raises: CircuitOpenError
+        """
+        with self.lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN and self.clock() - self.opened >= self.reset_timeout:
+                # let this query probe the server, others fail until it's done
+                self.state = HALF_OPEN
+                return
+            raise CircuitOpenError('{0} > circuit is open after {1} failures'.format(self.server, self.failures))
+
+    def success(self):
+        with self.lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.max_failures:
+                self.state = OPEN
+                self.opened = self.clock()
+
+    def abandon(self):
+        """
+        Record that the query let through by check() was not sent, so if it
+        was to probe the server, the next query probes it instead
+        """
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+
+    def record(self, error):
+        """
+        Record the result of a query, which failed with the error, or
+        succeeded if the error is None
+
+        Only connection errors and timeouts of the server count as failures,
+        not WhoisTimeout of queries which were not sent before the deadline.
+        """
+        if isinstance(error, WhoisConnectionError):
+            self.failure()
+        elif error is None:
+            self.success()
+        else:
+            self.abandon()
+
+
+class CircuitBreakers(object):
+
+    def __init__(self, **options):
+        """
+        Circuit breakers of whois servers
+
+        :param options: options of every CircuitBreaker
+        """
+        self.options = options
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def get(self, server):
+        """
+        Return CircuitBreaker of the server
+        """
+        breaker = self.breakers.get(server)
+        if breaker is None:
+            with self.lock:
+                breaker = self.breakers.get(server)
+                if breaker is None:
+                    breaker = self.breakers[server] = CircuitBreaker(server, **self.options)
+        return breaker
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+In-process cache of whois responses.
+
+LocalCache has get(key) and set(key, value, timeout) methods, like
+memcache.Client, so it can be passed as cache to check(..), check_many(..),
+get_whois(..) and get_rdap(..) when there is no memcached.
+
+>>> cache = LocalCache(max_entries=10000)
+>>> check('google.com', cache=cache)
+"""
+import time
+import threading
+from collections import OrderedDict
+
+
+def get_size(key, value):
+    """
+    Return approximate size of the cache entry in bytes
+    """
+    if not isinstance(value, basestring):
+        value = repr(value)
+    return len(key) + len(value)
+
+
+class LocalCache(object):
+
+    def __init__(self, max_entries=10000, max_size=None, clock=time.time):
+        """
+        Thread-safe LRU cache with expiring entries
+
+        When the cache is full, least recently used entries are evicted.
+
+        :param max_entries: max number of entries, None for no limit
+        :param max_size: max total size of keys and values in bytes, None
+                         for no limit
+        :param clock: function returning current time in seconds
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.clock = clock
+        # key => (expiration time or None, value, size)
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Return the value, or None if it's missing or expired
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None and entry[0] is not None and entry[0] <= self.clock():
+                self.size -= entry[2]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries[key] = entry
+            return entry[1]
+
+    def set(self, key, value, timeout=0):
+        """
+        :param timeout: seconds to keep the value for, 0 to keep it until
+                        it's evicted
+        """
+        size = get_size(key, value)
+        expires = self.clock() + timeout if timeout else None
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[2]
+            if self.max_size is not None and size > self.max_size:
+                return
+            self.entries[key] = (expires, value, size)
+            self.size += size
+            while ((self.max_entries is not None and len(self.entries) > self.max_entries) or
+                   (self.max_size is not None and self.size > self.max_size)):
+                key, entry = self.entries.popitem(last=False)
+                self.size -= entry[2]
+
+    def delete(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[2]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            self.hits = self.misses = 0
@@ -1529,7 +1529,11 @@ zones = ['aaa',
  'zm',
  'zone',
  'zuerich',
- 'zw',
+ 'zw']
 
- 'com.ru',
- 'ru.net']
+# blocks of the PRIVATE section of the Public Suffix List, which belong to
+# registries with their own whois service for the second level domains
+psl_private_registries = [
+    'FAITID',  # ru.net, spb.ru, msk.ru, msk.su and other geographic domains
+    'MSK-IX',  # net.ru, org.ru, pp.ru
+]
@@ -26,19 +26,55 @@ class Registrar(object):
 
     def __init__(self):
         self.registry = defaultdict(lambda: [])
+        self.frozen = None
 
     def __call__(self, *keys):
         def wrapper(obj):
             for key in keys:
                 self.registry[key].append(obj)
+            self.frozen = None
             return obj
         return wrapper
 
+    def freeze(self):
+        """
+        Precompute tuples of objects for every key, so that get() is a single
+        dict lookup. Registering a new object drops the precomputed tuples,
+        and they are built again on the next get()
+        """
+        common = tuple(self.registry.get('__all__', []))
+        frozen = dict((key, common + tuple(objects))
+                      for key, objects in self.registry.items() if key != '__all__')
+        self.frozen = frozen, common
+        return self.frozen
+
     def get(self, key):
-        return self.registry['__all__'] + self.registry[key]
+        # read self.frozen once, registering from another thread resets it
+        frozen = self.frozen
+        if frozen is None:
+            frozen = self.freeze()
+        frozen, common = frozen
+        return frozen.get(key, common)
 
     def get_keys(self):
         keys = self.registry.keys()
         if '__all__' in keys:
             keys.remove('__all__')
         return keys
+
+
+class cached_property(object):
+    """
+    Property which is computed on first access and then stored in the instance
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.__name__] = self.func(obj)
+        return value
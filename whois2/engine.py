@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+"""
+Non-blocking whois engine.
+
+One loop keeps many RFC 3912 queries in flight in one thread: sockets are
+non-blocking and polled for readiness, so the number of simultaneous
+lookups is not limited by the number of processes or threads.
+
+>>> loop = Loop(concurrency=100)
+>>> futures = [whois_async(loop, default_client, domain) for domain in domains]
+>>> loop.run()
+>>> [future.result() for future in futures]
+
+Results are delivered through Future objects, their callbacks are called by
+the loop. Future.result() runs the loop until the future is done.
+"""
+import math
+import time
+import errno
+import socket
+import heapq
+import select
+import itertools
+
+from .errors import WhoisError, WhoisConnectionError, WhoisTimeout, WhoisServerTimeout
+from .transport import QUERY_FORMATS, FULL_REFERRALS, THIN_SERVERS, RECV_SIZE, is_throttled
+from .resolver import interleave, get_family, CONNECTION_ATTEMPT_DELAY
+
+DEFAULT_CONCURRENCY = 100
+# max time to wait for events, so that timeouts are checked
+POLL_INTERVAL = 1.0
+
+
+class Future(object):
+
+    def __init__(self, loop=None):
+        """
+        Result of an operation which is not finished yet
+
+        :param loop: Loop which finishes the operation, None for futures
+                     which are done right away
+        """
+        self.loop = loop
+        self.done = False
+        self.value = None
+        self.error = None
+        self.callbacks = []
+
+    def set_result(self, value):
+        self.value = value
+        self._finish()
+
+    def set_error(self, error):
+        self.error = error
+        self._finish()
+
+    def _finish(self):
+        self.done = True
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback):
+        if self.done:
+            callback(self)
+        else:
+            self.callbacks.append(callback)
+
+    def result(self):
+        """
+        Return the result, run the loop until the future is done if needed
+
+        :raises: the error the operation failed with
+        """
+        if not self.done:
+            self.loop.run_until(self)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def then(self, func):
+        """
+        Return the future of func(result), func may return a future itself.
+        Errors, including errors raised by func, are passed through.
+        """
+        future = Future(self.loop)
+
+        def callback(done):
+            if done.error is not None:
+                future.set_error(done.error)
+                return
+            try:
+                value = func(done.value)
+            except Exception as e:
+                future.set_error(e)
+                return
+            if isinstance(value, Future):
+                value.add_done_callback(lambda chained: chain(chained, future))
+            else:
+                future.set_result(value)
+
+        self.add_done_callback(callback)
+        return future
+
+
+def chain(source, target):
+    if source.error is not None:
+        target.set_error(source.error)
+    else:
+        target.set_result(source.value)
+
+
+def completed(value, loop=None):
+    """
+    Return future which is done with the value
+    """
+    future = Future(loop)
+    future.set_result(value)
+    return future
+
+
+def failed(error, loop=None):
+    """
+    Return future which is done with the error
+    """
+    future = Future(loop)
+    future.set_error(error)
+    return future
+
+
+class Query(object):
+
+    def __init__(self, future, query, server, port, timeout, limit=None, deadline=None, source=None,
+                 resolver=None, bucket=None):
+        """
+        State of one whois query: connecting, sending, or receiving
+
+        Addresses of the server are connected to Happy Eyeballs style (RFC
+        8305), address families taking turns: a new attempt starts every
+        CONNECTION_ATTEMPT_DELAY seconds, or right away when one fails, and
+        the first connected socket is used.
+
+        :param limit: AdaptiveLimit of concurrent queries to the server
+        :param deadline: time (time.time() value) the query must be done by
+        :param source: local address to connect from
+        :param resolver: Resolver caching addresses of the server
+        :param bucket: TokenBucket the rate limit token of the query was taken
+                       from, the token is refunded if the query is not sent
+        """
+        self.future = future
+        self.source = source
+        self.resolver = resolver
+        self.bucket = bucket
+        self.addresses = []
+        self.limit = limit
+        self.server = server
+        self.port = port
+        self.timeout = timeout
+        self.data = '{0}\r\n'.format(query)
+        self.chunks = []
+        self.sock = None
+        # sockets of connection attempts, by filenos
+        self.attempts = {}
+        self.next_attempt = None
+        self.error = None
+        self.connecting = True
+        self.started = None
+        self.cut_short = False
+        self.deadline = deadline
+
+    def start(self):
+        self.started = time.time()
+        # True if the deadline, not the timeout of the server, limits the query
+        self.cut_short = self.deadline is not None and self.deadline < self.started + self.timeout
+        self.deadline = min(self.deadline or float('inf'), self.started + self.timeout)
+        try:
+            if self.resolver is None:
+                addresses = interleave(socket.getaddrinfo(self.server, self.port, 0, socket.SOCK_STREAM))
+            else:
+                addresses = self.resolver.resolve(self.server, self.port)
+        except socket.error as e:
+            return self.fail(e)
+        if self.source:
+            addresses = [address for address in addresses if address[0] == get_family(self.source)]
+        self.addresses = list(addresses)
+        self.connect()
+
+    def connect(self):
+        """
+        Start connecting to the next address of the server, fail if there
+        are no addresses and attempts left
+        """
+        while self.addresses:
+            family, socktype, proto, canonname, address = self.addresses.pop(0)
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.setblocking(0)
+                if self.source:
+                    sock.bind((self.source, 0))
+                status = sock.connect_ex(address)
+                if status not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    raise socket.error(status, errno.errorcode.get(status, status))
+            except socket.error as e:
+                sock.close()
+                self.error = e
+                continue
+            self.attempts[sock.fileno()] = sock
+            self.next_attempt = time.time() + CONNECTION_ATTEMPT_DELAY
+            return
+        if not self.attempts:
+            self.fail(self.error or socket.error('no addresses to connect to'))
+
+    def wants_next_attempt(self, now):
+        return self.connecting and bool(self.addresses) and self.next_attempt <= now
+
+    def get_filenos(self):
+        """
+        Return filenos of sockets to poll
+        """
+        if self.connecting:
+            return list(self.attempts)
+        return [self.sock.fileno()]
+
+    def wants_write(self):
+        return self.connecting or bool(self.data)
+
+    def on_connect(self, fileno):
+        """
+        Handle an event of the connection attempt, the first connected socket
+        is used, and the other attempts are given up
+        """
+        sock = self.attempts.pop(fileno, None)
+        if sock is None:
+            return
+        status = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if status:
+            sock.close()
+            self.error = socket.error(status, errno.errorcode.get(status, status))
+            # a failed attempt doesn't hold back the next one
+            return self.connect()
+        self.close_attempts()
+        self.sock = sock
+        self.connecting = False
+        self.on_writable()
+
+    def on_writable(self):
+        try:
+            sent = self.sock.send(self.data)
+            self.data = self.data[sent:]
+        except socket.error as e:
+            if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                self.fail(e)
+
+    def on_readable(self):
+        try:
+            chunk = self.sock.recv(RECV_SIZE)
+        except socket.error as e:
+            if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                self.fail(e)
+            return
+        if chunk:
+            self.chunks.append(chunk)
+        else:
+            response = ''.join(self.chunks)
+            self.close(success=not is_throttled(response))
+            self.future.set_result(response)
+
+    def fail(self, error, error_class=WhoisConnectionError):
+        # only errors of the server adapt its concurrency limit
+        self.close(False if issubclass(error_class, WhoisConnectionError) else None)
+        self.future.set_error(error_class('{0}:{1} > {2}'.format(self.server, self.port, error)))
+
+    def close_attempts(self):
+        for sock in self.attempts.values():
+            sock.close()
+        self.attempts = {}
+
+    def close(self, success=False):
+        self.close_attempts()
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        if self.limit is not None and self.started is not None:
+            self.limit.release(self.started, success)
+            self.limit = None
+        if self.bucket is not None and self.started is None:
+            self.bucket.refund()
+        self.bucket = None
+
+    @property
+    def finished(self):
+        return self.future.done
+
+
+class Loop(object):
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Loop running whois queries, at most concurrency of them at once
+
+        :param concurrency: max number of open connections
+        """
+        self.concurrency = concurrency
+        # heap of (start time, sequence number, query)
+        self.pending = []
+        self.sequence = itertools.count()
+        self.active = set()
+        # queries waiting for concurrency limits of their servers, by limits
+        self.waiting = {}
+        # True while queries are failed by abort(), not by their servers
+        self.aborting = False
+
+    def query(self, query, server, port, timeout, delay=0, limit=None, deadline=None, source=None, resolver=None,
+              bucket=None):
+        """
+        Return future of the response of the whois server
+
+        :param delay: seconds to wait before sending the query, such as the
+                      delay imposed by the rate limit of the server
+        :param limit: AdaptiveLimit of concurrent queries to the server
+        :param deadline: time (time.time() value) the query must be done by,
+                         including the delay
+        :param source: local address to connect from
+        :param resolver: Resolver caching addresses of the server
+        :param bucket: TokenBucket the rate limit token of the query was taken
+                       from, the token is refunded if the query is not sent
+        """
+        future = Future(self)
+        start = time.time() + delay
+        query = Query(future, query, server, port, timeout, limit, deadline, source, resolver, bucket)
+        if deadline is not None and start >= deadline:
+            query.fail('rate limit delay exceeds the deadline', WhoisTimeout)
+            return future
+        self.schedule(query, start)
+        return future
+
+    def schedule(self, query, start):
+        heapq.heappush(self.pending, (start, next(self.sequence), query))
+
+    def run(self, deadline=None):
+        """
+        Run until all queries are done
+
+        :param deadline: time (time.time() value) to stop at, queries which
+                         are not done by then fail with WhoisTimeout
+        """
+        while self.pending or self.active or self.waiting:
+            if deadline is not None and time.time() >= deadline:
+                self.abort('deadline exceeded')
+                break
+            self.step(deadline)
+
+    def abort(self, reason):
+        """
+        Fail all queries which are not done yet with WhoisTimeout
+        """
+        queries = [query for start, sequence, query in self.pending] + list(self.active)
+        for waiting in self.waiting.values():
+            queries.extend(waiting)
+        self.pending, self.active, self.waiting = [], set(), {}
+        self.aborting = True
+        try:
+            for query in queries:
+                if not query.finished:
+                    query.fail(reason, WhoisTimeout)
+        finally:
+            self.aborting = False
+
+    def run_until(self, future):
+        while not future.done:
+            if not (self.pending or self.active or self.waiting):
+                raise RuntimeError('the future will never be done')
+            self.step()
+
+    def step(self, deadline=None):
+        now = time.time()
+        # queries waiting for freed slots go back to the queue, in order
+        for limit, queries in self.waiting.items():
+            free = int(limit.limit) - limit.in_flight
+            if free > 0:
+                for query in queries[:free]:
+                    self.schedule(query, now)
+                del queries[:free]
+                if not queries:
+                    del self.waiting[limit]
+        while self.pending and self.pending[0][0] <= now and len(self.active) < self.concurrency:
+            start, sequence, query = heapq.heappop(self.pending)
+            if query.deadline is not None and query.deadline <= now:
+                # nothing is sent, so the server is not to blame
+                query.fail('deadline exceeded', WhoisTimeout)
+                continue
+            if query.limit is not None and not query.limit.try_acquire():
+                self.waiting.setdefault(query.limit, []).append(query)
+                continue
+            query.start()
+            if not query.finished:
+                self.active.add(query)
+        timeout = POLL_INTERVAL
+        if deadline is not None:
+            timeout = min(timeout, deadline - now)
+        if self.pending and len(self.active) < self.concurrency:
+            timeout = min(timeout, self.pending[0][0] - now)
+        if not self.active:
+            time.sleep(max(timeout, 0))
+            return
+        for query in self.active:
+            timeout = min(query.deadline - now, timeout)
+            if query.connecting and query.addresses:
+                timeout = min(query.next_attempt - now, timeout)
+        sockets = {}
+        for query in self.active:
+            for fileno in query.get_filenos():
+                sockets[fileno] = query
+        for fileno, readable, writable in self.poll(sockets, max(timeout, 0)):
+            query = sockets[fileno]
+            if query.finished:
+                continue
+            if query.connecting:
+                # errors of connection attempts are read with SO_ERROR
+                query.on_connect(fileno)
+                continue
+            if writable and query.wants_write():
+                query.on_writable()
+            if readable and not query.finished:
+                query.on_readable()
+        now = time.time()
+        for query in self.active:
+            if not query.finished and query.wants_next_attempt(now):
+                query.connect()
+            if not query.finished and query.deadline <= now:
+                if query.cut_short:
+                    query.fail('deadline exceeded', WhoisTimeout)
+                else:
+                    query.fail('timed out', WhoisServerTimeout)
+        self.active = set(query for query in self.active if not query.finished)
+
+    def poll(self, sockets, timeout):
+        """
+        Return list of (fileno, readable, writable) of the sockets
+
+        :param sockets: dict of filenos and their queries
+        """
+        if hasattr(select, 'poll'):
+            poller = select.poll()
+            for fileno, query in sockets.items():
+                poller.register(fileno, select.POLLOUT if query.wants_write() else select.POLLIN)
+            events = []
+            for fileno, event in poller.poll(math.ceil(timeout * 1000)):
+                # errors and hangups are handled by the following recv()
+                readable = bool(event & (select.POLLIN | select.POLLERR | select.POLLHUP))
+                events.append((fileno, readable, bool(event & select.POLLOUT)))
+            return events
+        writers = [fileno for fileno, query in sockets.items() if query.wants_write()]
+        readers = [fileno for fileno in sockets if fileno not in writers]
+        readable, writable, errors = select.select(readers, writers, writers, timeout)
+        return ([(fileno, True, False) for fileno in readable] +
+                [(fileno, False, True) for fileno in set(writable + errors)])
+
+
+def whois_async(loop, client, domain, whois_server=None, referrals=FULL_REFERRALS, deadline=None):
+    """
+    Return future of whois data of the domain, see WhoisClient.whois(..)
+
+    Whois servers of unknown top level domains are learned synchronously.
+
+    :param deadline: time (time.time() value) all queries must be done by
+    """
+    try:
+        server = whois_server or client.get_server(domain, deadline)
+    except WhoisError as e:
+        return failed(e, loop)
+
+    def query(server):
+        breaker = client.breakers.get(server)
+        try:
+            breaker.check()
+        except WhoisError as e:
+            return failed(e, loop)
+        source = client.choose_source(server)
+        delay = client.rate_limiter.reserve(server, source, None if deadline is None else deadline - time.time())
+        if delay is None:
+            breaker.abandon()
+            return failed(WhoisTimeout('{0} > rate limit delay exceeds the deadline'.format(server)), loop)
+        future = loop.query(QUERY_FORMATS.get(server, '{0}').format(domain), server, client.port, client.timeout,
+                            delay, client.concurrency_limiter.get(server), deadline, source, client.resolver,
+                            client.rate_limiter.get_bucket(server, source))
+
+        def callback(done):
+            if loop.aborting:
+                # the server is not to blame, but an aborted probe must not
+                # keep the circuit half-open
+                breaker.abandon()
+                return
+            breaker.record(done.error)
+            if source is not None and done.error is None and is_throttled(done.value):
+                client.source_addresses.throttled(source, server)
+
+        future.add_done_callback(callback)
+        return future
+
+    def follow_referral(response):
+        referral = client.get_registrar_server(server, response)
+        if not referral:
+            return response
+        future = Future(loop)
+
+        def callback(registrar):
+            if registrar.error is not None:
+                future.set_result(response)
+            else:
+                future.set_result('{0}\n{1}'.format(response, registrar.value))
+
+        query(referral).add_done_callback(callback)
+        return future
+
+    future = query(server)
+    if referrals == FULL_REFERRALS and server in THIN_SERVERS:
+        future = future.then(follow_referral)
+    return future
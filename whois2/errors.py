@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Exceptions raised while getting whois data.
+
+All of them are subclasses of RuntimeError, which has always been raised by
+whois2.get_whois(..), so existing "except RuntimeError" clauses catch them.
+"""
+
+
+class WhoisError(RuntimeError):
+    """
+    Base class of whois2 errors
+    """
+
+
+class WhoisConnectionError(WhoisError):
+    """
+    Connection to whois server failed or was broken
+    """
+
+
+class WhoisTimeout(WhoisError):
+    """
+    Whois data was not got before the deadline, including queries which were
+    never sent, because waiting for rate limits would take too long
+    """
+
+
+class WhoisServerTimeout(WhoisTimeout, WhoisConnectionError):
+    """
+    Connecting to whois server or reading its answer timed out
+    """
+
+
+class WhoisServerNotFound(WhoisError):
+    """
+    There is no known whois server for the domain
+    """
+
+
+class WhoisThrottled(WhoisError):
+    """
+    Whois server refused to answer because of too many queries, and kept
+    refusing after retries
+    """
+
+
+class CircuitOpenError(WhoisError):
+    """
+    Whois server failed too many times in a row, it's not queried for a while
+    """
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
+import re
+import hashlib
+import datetime
+import threading
+from collections import OrderedDict
 from dateutil import parser
+from .decorators import cached_property
 
 def register(registry, parser):
     """
@@ -10,6 +16,18 @@ def register(registry, parser):
     registry(parser)
 
 
+def provides(*fields):
+    """
+    Declare attributes of whois object the parser sets
+
+    Parsers without declared attributes are expected to set any of them.
+    """
+    def wrapper(parser):
+        parser.fields = fields
+        return parser
+    return wrapper
+
+
 def clean_nameserver(nserver):
     """
     Cleanup function for nameserver name
@@ -24,9 +42,126 @@ def clean_datetime(value):
     return parser.parse(value)
 
 
+class DatetimeFormat(object):
+
+    # strptime-like directives supported by the fast path
+    directives = {
+        'Y': r'(?P<year>\d{4})',
+        'm': r'(?P<month>\d{1,2})',
+        'd': r'(?P<day>\d{1,2})',
+        'H': r'(?P<hour>\d{1,2})',
+        'M': r'(?P<minute>\d{1,2})',
+        'S': r'(?P<second>\d{1,2})',
+    }
+
+    def __init__(self, format):
+        """
+        Cleanup function for datetime values of the known format
+
+        The format is compiled to a regular expression once, so values are
+        parsed without guessing. Values which don't match the format are
+        passed to dateutil parser.
+
+        >>> DatetimeFormat('%Y.%m.%d')('2013.03.05')
+        datetime.datetime(2013, 3, 5, 0, 0)
+
+        :param format: format with %Y, %m, %d, %H, %M and %S directives
+        """
+        self.format = format
+        pattern = []
+        parts = iter(format.split('%'))
+        pattern.append(re.escape(next(parts)))
+        for part in parts:
+            pattern.append(self.directives[part[:1]])
+            pattern.append(re.escape(part[1:]))
+        self.regexp = re.compile(''.join(pattern) + '$')
+        # group names in the order of groups
+        self.names = sorted(self.regexp.groupindex, key=self.regexp.groupindex.get)
+
+    def __call__(self, value):
+        match = self.regexp.match(value.strip())
+        if match:
+            try:
+                return datetime.datetime(**dict(zip(self.names, map(int, match.groups()))))
+            except ValueError:
+                pass
+        return clean_datetime(value)
+
+
+def normalize_key(key):
+    return ' '.join(key.lower().split())
+
+
+# the last text normalized by every thread, see normalize_text(..)
+_normalized = threading.local()
+
+
+def normalize_text(text):
+    """
+    Return the text normalized like WhoisRecord.normalized_text
+
+    The result for the last text is kept per thread, so a response checked
+    for throttling by the transport and then by check(..) is normalized once.
+    """
+    last = getattr(_normalized, 'last', None)
+    if last is not None and last[0] is text:
+        return last[1]
+    normalized = '\n'.join(' '.join(line.lower().split()) for line in text.splitlines())
+    _normalized.last = (text, normalized)
+    return normalized
+
+
+class WhoisRecord(object):
+
+    def __init__(self, whois_data):
+        """
+        Index of whois response, shared by all parsers
+
+        Every part of the index is built in one pass on first access, so
+        parsers which need only the normalized text don't pay for the rest
+
+        :param whois_data: whois response as a string
+
+        Attributes:
+
+        - lines: list of lines of the response
+        - normalized_lines: list of lines in lower case, with stripped and
+          collapsed whitespaces
+        - normalized_text: normalized lines joined with newlines
+        - fields: dict of lines which look like "key: value", the key is
+          normalized as a line, and the value is the list of lines with the key
+        """
+        self.lines = whois_data.splitlines()
+
+    @cached_property
+    def normalized_lines(self):
+        return [' '.join(line.lower().split()) for line in self.lines]
+
+    @cached_property
+    def normalized_text(self):
+        return '\n'.join(self.normalized_lines)
+
+    @cached_property
+    def fields(self):
+        fields = {}
+        for line in self.lines:
+            key, sep, value = line.partition(':')
+            if sep:
+                fields.setdefault(normalize_key(key), []).append(line)
+        return fields
+
+    def get_lines(self, key=None):
+        """
+        Return lines with the key, or all lines if the key is None
+        """
+        if key is None:
+            return self.lines
+        return self.fields.get(key, [])
+
+
 class RegexpMatcher(object):
 
-    def __init__(self, attribute_name, regexp, multi_value=False, clean=None):
+    def __init__(self, attribute_name, regexp, multi_value=False, clean=None, key=None, date_format=None):
         """
         Check every whois line against regular expression
 
@@ -37,15 +172,23 @@ class RegexpMatcher(object):
                             more than one value
         :param clean: optional callable object accepting value extracted from whois text
                       and cleaning it up before passing as a whois object
+        :param key: optional key of "key: value" lines the regexp can match,
+                    if set, only lines with the key are checked
+        :param date_format: optional format of datetime values, if set, and
+                            clean is not, values are cleaned with DatetimeFormat
         """
         self.attribute_name = attribute_name
+        self.fields = (attribute_name, )
         self.regexp = regexp
         self.multi_value = multi_value
+        if clean is None and date_format is not None:
+            clean = DatetimeFormat(date_format)
         self.clean = clean
+        self.key = key and normalize_key(key)
 
     def __call__(self, whois, name, tld):
         self.prepare_whois(whois)
-        for line in  whois.whois_data.splitlines():
+        for line in whois.record.get_lines(self.key):
             match = self.regexp.match(line)
             if match:
                 value = match.group(self.attribute_name)
@@ -70,3 +213,173 @@ class RegexpMatcher(object):
             getattr(whois, self.attribute_name).append(value)
         else:
             setattr(whois, self.attribute_name, value)
+
+
+class TemplateMatcher(object):
+
+    def __init__(self, templates):
+        """
+        Search normalized whois text for any of the templates at once
+
+        Literal templates are compiled into a trie, and the trie into one
+        regular expression, so the text is scanned once, whatever the number
+        of templates is.
+
+        :param templates: list of strings to search for, or compiled regular
+                          expressions for templates which can't be expressed
+                          as a substring. Templates never span several lines.
+        """
+        literals = [template for template in templates if isinstance(template, basestring)]
+        patterns = [template.pattern for template in templates if not isinstance(template, basestring)]
+        if literals:
+            patterns.insert(0, trie_pattern(literals))
+        self.regexp = re.compile('|'.join(patterns))
+
+    def search(self, text, extra_templates=()):
+        """
+        Return True if the text contains any of the templates
+
+        :param text: normalized whois text, see WhoisRecord.normalized_text
+        :param extra_templates: strings to search in addition to the compiled
+                                templates, such as templates with the domain name
+        """
+        if self.regexp.search(text):
+            return True
+        for template in extra_templates:
+            if template in text:
+                return True
+        return False
+
+
+class TemplateFlag(object):
+
+    def __init__(self, attribute_name, templates):
+        """
+        Set the attribute of whois object to True if normalized whois text
+        contains any of the templates
+
+        :param attribute_name: attribute name the matcher sets
+        :param templates: templates of TemplateMatcher, or TemplateMatcher
+        """
+        self.attribute_name = attribute_name
+        self.fields = (attribute_name, )
+        if isinstance(templates, TemplateMatcher):
+            self.matcher = templates
+        else:
+            self.matcher = TemplateMatcher(templates)
+
+    def __call__(self, whois, name, tld):
+        if self.matcher.search(whois.record.normalized_text):
+            setattr(whois, self.attribute_name, True)
+
+
+def trie_pattern(literals):
+    """
+    Build regular expression matching any of the literals, with common
+    prefixes of literals shared
+
+    >>> trie_pattern(['foo', 'foobar', 'fox'])
+    'fo(?:o|x)'
+    """
+    trie = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            if '' in node:
+                # a shorter literal matches already
+                break
+            node = node.setdefault(char, {})
+        else:
+            node.clear()
+            node[''] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node):
+    if '' in node:
+        return ''
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in sorted(node.items())]
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:{0})'.format('|'.join(branches))
+
+
+class ParsedValues(dict):
+    """
+    Attributes parsed from whois data, shared by all whois objects with the
+    same data (see ParseCache)
+    """
+
+    def store(self, attr, value, domain):
+        """
+        Store the parsed value, unless it contains the domain name, because
+        whois data differing only in domain names share the same values
+        """
+        if isinstance(value, basestring):
+            if domain in value.lower():
+                return
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, basestring) and domain in item.lower():
+                    return
+            if isinstance(value, list):
+                # the whois object keeps the value it parsed, and may change it
+                value = list(value)
+        self[attr] = value
+
+    def restore(self):
+        """
+        Yield stored attributes, with lists copied
+        """
+        for attr, value in self.items():
+            if isinstance(value, list):
+                value = list(value)
+            yield attr, value
+
+
+class ParseCache(object):
+
+    def __init__(self, max_entries=1024):
+        """
+        LRU cache of parsed attributes, keyed by hash of tld and whois data,
+        with echoed domain name removed from the data
+
+        Identical responses, like "not found" answers for free domains, are
+        parsed once.
+
+        :param max_entries: max number of cached responses, 0 disables the cache
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, domain, tld, whois_data):
+        whois_data = whois_data.replace(domain, '\0').replace(domain.upper(), '\0')
+        return hashlib.sha1('{0}\0{1}'.format(tld, whois_data)).digest()
+
+    def get(self, domain, tld, whois_data):
+        """
+        Return ParsedValues for the whois data, empty ones on the first call,
+        or None if the cache is disabled
+        """
+        if not self.max_entries or whois_data is None:
+            return None
+        key = self.get_key(domain, tld, whois_data)
+        with self.lock:
+            values = self.entries.pop(key, None)
+            if values is None:
+                self.misses += 1
+                values = ParsedValues()
+            else:
+                self.hits += 1
+            self.entries[key] = values
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return values
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
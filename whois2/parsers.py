@@ -1,79 +1,88 @@
 # -*- coding: utf-8 -*-
 import re
-import types
 
 from .decorators import Registrar
 from .utils import RU_SUBDOMAINS
-from .parser_utils import register, clean_nameserver, clean_datetime, RegexpMatcher
+from .transport import THROTTLED_TEMPLATES
+from .parser_utils import register, provides, clean_nameserver, RegexpMatcher, TemplateMatcher, TemplateFlag
 tld_parser = Registrar()
 
 
+def get_parsers(tld, fields=None):
+    """
+    Return parsers for the tld, which set any of the fields
+
+    :param fields: names of whois object attributes, None means all of them
+    """
+    parsers = tld_parser.get(tld)
+    if fields is None:
+        return parsers
+    return tuple(parser for parser in parsers
+                 if getattr(parser, 'fields', None) is None or set(parser.fields).intersection(fields))
+
+
 #------------------------------------------------------------------------------
 # getting 'registered' attribute
 #------------------------------------------------------------------------------
 
 
-def _check_whois_response(whois_response, templates):
-    for line in whois_response.splitlines():
-        line = re.sub(r'\s+', ' ', line.lower().strip())
-        for template in templates:
-            if isinstance(template, basestring):
-                if template in line:
-                    return True
-            elif isinstance(template, types.FunctionType):
-                if template(line):
-                    return True
-    return False
+NOT_FOUND_TEMPLATES = TemplateMatcher([
+    'not found',
+    'no found',
+    'no entries found for the selected source(s).',
+    'no match',
+    'no match.',
+    'not registered',
+    'domain not found',
+    'nothing found for this query',
+    'status: free',
+    'status: available',
+    'no matching record',
+    'no entries found',
+    'no object found',
+    'no matching objects found',
+    'no data found',
+    'nothing found for this query',
+    'available for registration',
+    'do not have an entry in our database',
+    'domain name has not been registered',
+    'no domain exists for the search string',
+    'the queried object does not exist',
+    'no_se_encontro_el_objeto/object_not_found' # .mx domains
+])
 
 
 @tld_parser('__all__')
+@provides('registered')
 def not_found(whois, name, tld):
     """
     Define whether a domain is found or not
     """
-    templates = [
-        'not found',
-        'not found: %s' % whois.domain,
-        'no match for "%s".' % whois.domain,
-        'no found',
-        'no entries found for the selected source(s).',
-        'no match',
-        'no match.',
-        'not registered',
-        'domain not found',
-        'nothing found for this query',
-        'status: free',
-        'status: available',
-        'no matching record',
-        'no entries found',
-        'no object found',
-        'no matching objects found',
-        'no data found',
-        'nothing found for this query',
-        'available for registration',
-        'do not have an entry in our database',
-        'domain name has not been registered',
-        'no domain exists for the search string',
-        'the queried object does not exist',
-        'no_se_encontro_el_objeto/object_not_found' # .mx domains
-    ]
     registered = getattr(whois, 'registered', None)
     if registered is None:
-        whois.registered = not _check_whois_response(whois.whois_data, templates)
+        domain_templates = [
+            'not found: %s' % whois.domain,
+            'no match for "%s".' % whois.domain,
+        ]
+        whois.registered = not NOT_FOUND_TEMPLATES.search(whois.record.normalized_text, domain_templates)
+
+
+REGISTERED_TEMPLATES = TemplateMatcher([
+    re.compile(r'available for registration[^\n]*is a governmental reserved name'),
+    re.compile(r'is a governmental reserved name[^\n]*available for registration'),
+    'this domain has been reserved by the registry',
+])
 
 
 @tld_parser('__all__')
+@provides('registered')
 def registered(whois, name, tld):
-    templates = [
-        lambda line:
-            'available for registration' in line and 'is a governmental reserved name' in line,
-        'this domain has been reserved by the registry'
-    ]
-    if _check_whois_response(whois.whois_data, templates):
+    if REGISTERED_TEMPLATES.search(whois.record.normalized_text):
         whois.registered = True
 
 
 @tld_parser('com', 'net', 'org', 'ru')
+@provides('registered')
 def expiration_date(whois, name, tld):
     """
     Define whether a domain has expiration date or no
@@ -89,6 +98,24 @@ def expiration_date(whois, name, tld):
             whois.registered = True
             break
 
+#------------------------------------------------------------------------------
+# getting 'throttled' attribute
+#------------------------------------------------------------------------------
+
+
+register(
+    tld_parser('__all__'),
+    TemplateFlag('throttled', THROTTLED_TEMPLATES)
+)
+register(
+    tld_parser('de'),
+    TemplateFlag('throttled', ['access control limit reached'])
+)
+register(
+    tld_parser('eu'),
+    TemplateFlag('throttled', ['excessive querying'])
+)
+
 #------------------------------------------------------------------------------
 # getting 'nameservers' attribute
 #------------------------------------------------------------------------------
@@ -99,23 +126,24 @@ register(
         'aero', 'com', 'bz', 'tv', 'xxx', 'pro', 'travel', 'biz', 'mn', 'vc',
         'info'
     ),
-    RegexpMatcher('nameservers', re.compile(r'^\s*Name Server:\s*(?P<nameservers>\S+)'), multi_value=True, clean=clean_nameserver)
+    RegexpMatcher('nameservers', re.compile(r'^\s*Name Server:\s*(?P<nameservers>\S+)'), multi_value=True, clean=clean_nameserver, key='name server')
 )
 register(
     tld_parser('me'),
-    RegexpMatcher('nameservers', re.compile(r'^\s*Nameservers:\s*(?P<nameservers>\S+)'), multi_value=True, clean=clean_nameserver)
+    RegexpMatcher('nameservers', re.compile(r'^\s*Nameservers:\s*(?P<nameservers>\S+)'), multi_value=True, clean=clean_nameserver, key='nameservers')
 )
 register(
     tld_parser('ru', 'su', *RU_SUBDOMAINS),
-    RegexpMatcher('nameservers', re.compile(r'^\s*nserver:\s*(?P<nameservers>\S+)'), multi_value=True, clean=clean_nameserver)
+    RegexpMatcher('nameservers', re.compile(r'^\s*nserver:\s*(?P<nameservers>\S+)'), multi_value=True, clean=clean_nameserver, key='nserver')
 )
 
 
 @tld_parser('co.uk')
+@provides('nameservers')
 def co_uk_nameservers(whois, name, tld):
     in_nameservers = False
     whois.nameservers = []
-    for line in whois.whois_data.splitlines():
+    for line in whois.record.lines:
         line = line.strip()
         if not in_nameservers:
             if line == 'Name servers:':
@@ -132,9 +160,9 @@ def co_uk_nameservers(whois, name, tld):
 #------------------------------------------------------------------------------
 register(
     tld_parser('ru', 'su', *RU_SUBDOMAINS),
-    RegexpMatcher('paid_till', re.compile(r'^paid-till:\s*(?P<paid_till>\d{4}\.\d{2}.\d{2})'), clean=clean_datetime)
+    RegexpMatcher('paid_till', re.compile(r'^paid-till:\s*(?P<paid_till>\d{4}\.\d{2}.\d{2})'), key='paid-till', date_format='%Y.%m.%d')
 )
 register(
     tld_parser('ru', 'su', *RU_SUBDOMAINS),
-    RegexpMatcher('created', re.compile(r'^created:\s*(?P<created>\d{4}\.\d{2}.\d{2})'), clean=clean_datetime)
+    RegexpMatcher('created', re.compile(r'^created:\s*(?P<created>\d{4}\.\d{2}.\d{2})'), key='created', date_format='%Y.%m.%d')
 )
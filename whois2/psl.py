@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Public Suffix List support.
+
+The list (https://publicsuffix.org/list/) is compiled into a compact binary
+index, which is memory-mapped on load, so it is ready in microseconds and its
+pages are shared between all worker processes.
+
+Keys are stored with reversed labels ("co.uk" as "uk.co") and sorted, so all
+suffixes under the same zone are neighbours in the index.
+
+>>> index = PublicSuffixIndex(compile_index(['uk', 'co.uk', '*.ck', '!www.ck']))
+>>> index.split('google.co.uk')
+('google', 'co.uk')
+>>> index.split('foo.bar.ck')
+('foo', 'bar.ck')
+>>> index.split('www.ck')
+('www', 'ck')
+>>> index.split('linux.nonexistent')
+('linux.nonexistent', None)
+
+Binary format (all integers are little-endian):
+
+- header: 8 bytes of MAGIC, the number of records and the number of hash
+  table slots (uint32 both)
+- records: offset (uint32) and length (uint16) of the key in the blob, and
+  rule flags (uint16), sorted by key
+- hash table: record number plus one (uint32) for every slot, zero for empty
+  slots. Slot of the key is crc32(key) modulo the number of slots, collisions
+  are resolved with linear probing
+- blob: concatenated keys
+"""
+import os
+import mmap
+import zlib
+import struct
+
+from .data import psl_private_registries
+
+MAGIC = 'W2PSL\x00\x00\x02'
+HEADER = struct.Struct('<8sII')
+RECORD = struct.Struct('<IHH')
+SLOT = struct.Struct('<I')
+
+# rule flags
+RULE = 1
+WILDCARD = 2
+EXCEPTION = 4
+# there are longer keys under this one
+CHILDREN = 8
+
+PSL_PATH = os.path.join(os.path.dirname(__file__), 'public_suffix_list.dat')
+INDEX_PATH = os.path.join(os.path.dirname(__file__), 'public_suffix_list.idx')
+
+
+def parse_rules(lines, private_registries=None):
+    """
+    Parse the Public Suffix List and yield rules as strings, in IDNA encoding
+
+    Every rule of the ICANN section is used. Rules of the PRIVATE section are
+    used only if they belong to one of `private_registries`, the names of the
+    list blocks ("// FAITID : https://faitid.org/" is the "FAITID" block)
+
+    :param lines: iterable of lines of the list, in utf-8
+    :param private_registries: names of PRIVATE section blocks to use
+    """
+    private_registries = set(private_registries or [])
+    private = False
+    block = None
+    new_block = True
+    for line in lines:
+        line = line.strip()
+        if not line:
+            new_block = True
+            continue
+        if line.startswith('//'):
+            if '===BEGIN PRIVATE DOMAINS===' in line:
+                private = True
+            elif new_block:
+                block = line[2:].split(' : ', 1)[0].strip()
+            new_block = False
+            continue
+        new_block = False
+        if private and block not in private_registries:
+            continue
+        rule = line.split()[0]
+        if isinstance(rule, str):
+            rule = rule.decode('utf-8')
+        try:
+            yield encode_rule(rule)
+        except UnicodeError:
+            continue
+
+
+def encode_rule(rule):
+    prefix = ''
+    if rule.startswith('!'):
+        prefix, rule = '!', rule[1:]
+    elif rule.startswith('*.'):
+        prefix, rule = '*.', rule[2:]
+    return prefix + rule.lower().encode('idna')
+
+
+def compile_index(rules):
+    """
+    Compile the list of rules to the binary index
+
+    :param rules: iterable of rules ('co.uk', '*.ck', '!www.ck', ...)
+    :returns: index as a string
+    """
+    keys = {}
+    for rule in rules:
+        flag = RULE
+        if rule.startswith('!'):
+            flag, rule = EXCEPTION, rule[1:]
+        elif rule.startswith('*.'):
+            flag, rule = WILDCARD, rule[2:]
+        if '*' in rule or '!' in rule:
+            # wildcards in the middle of the rule are not used in the list
+            continue
+        key = reverse_labels(rule)
+        keys[key] = keys.get(key, 0) | flag
+        dot = key.rfind('.')
+        while dot != -1:
+            key = key[:dot]
+            keys[key] = keys.get(key, 0) | CHILDREN
+            dot = key.rfind('.')
+
+    records = []
+    blob = []
+    offset = 0
+    slot_count = 1
+    while slot_count < len(keys) * 2:
+        slot_count *= 2
+    slots = [0] * slot_count
+    for number, key in enumerate(sorted(keys)):
+        records.append(RECORD.pack(offset, len(key), keys[key]))
+        blob.append(key)
+        offset += len(key)
+        slot = slot_hash(key) % slot_count
+        while slots[slot]:
+            slot = (slot + 1) % slot_count
+        slots[slot] = number + 1
+    header = HEADER.pack(MAGIC, len(records), slot_count)
+    return ''.join([header] + records + [SLOT.pack(slot) for slot in slots] + blob)
+
+
+def compile_file(psl_path=PSL_PATH, index_path=INDEX_PATH,
+                 private_registries=psl_private_registries):
+    """
+    Compile the Public Suffix List file to the binary index file
+    """
+    with open(psl_path) as fd:
+        index = compile_index(parse_rules(fd, private_registries))
+    tmp_path = '{0}.tmp'.format(index_path)
+    with open(tmp_path, 'wb') as fd:
+        fd.write(index)
+    os.rename(tmp_path, index_path)
+
+
+def load_index(index_path=INDEX_PATH, psl_path=PSL_PATH):
+    """
+    Memory-map the binary index
+
+    If there is no index file, or it has been compiled by another version of
+    whois2, the list is compiled in memory instead
+    """
+    try:
+        with open(index_path, 'rb') as fd:
+            return PublicSuffixIndex(mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ))
+    except (IOError, ValueError):
+        with open(psl_path) as fd:
+            return PublicSuffixIndex(compile_index(parse_rules(fd, psl_private_registries)))
+
+
+def reverse_labels(domain):
+    return '.'.join(reversed(domain.split('.')))
+
+
+def slot_hash(key):
+    return zlib.crc32(key) & 0xffffffff
+
+
+class PublicSuffixIndex(object):
+
+    def __init__(self, buf):
+        """
+        :param buf: compiled index, either a string or a memory-mapped file
+        """
+        magic, self.count, self.slot_count = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('Invalid public suffix index')
+        self.buf = buf
+        self.slots_offset = HEADER.size + self.count * RECORD.size
+        self.blob_offset = self.slots_offset + self.slot_count * SLOT.size
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, suffix):
+        return self.get_flags(suffix) & RULE != 0
+
+    def record(self, position):
+        offset, length, flags = RECORD.unpack_from(self.buf, HEADER.size + position * RECORD.size)
+        start = self.blob_offset + offset
+        return self.buf[start:start + length], flags
+
+    def bisect(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.record(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, key):
+        """
+        Return flags of the reversed key, or zero if there is no such key
+        """
+        slot = slot_hash(key) % self.slot_count
+        while True:
+            number, = SLOT.unpack_from(self.buf, self.slots_offset + slot * SLOT.size)
+            if not number:
+                return 0
+            found, flags = self.record(number - 1)
+            if found == key:
+                return flags
+            slot = (slot + 1) % self.slot_count
+
+    def get_flags(self, suffix):
+        return self.find(reverse_labels(suffix))
+
+    def suffixes(self, zone=None):
+        """
+        Yield public suffixes, either all or only those under the zone
+        """
+        if zone is None:
+            position, prefix = 0, ''
+        else:
+            prefix = reverse_labels(zone) + '.'
+            position = self.bisect(prefix)
+        while position < self.count:
+            key, flags = self.record(position)
+            if not key.startswith(prefix):
+                break
+            if flags & RULE:
+                yield reverse_labels(key)
+            position += 1
+
+    def split(self, domain):
+        """
+        Split the domain to the name and the public suffix.
+
+        Labels are checked starting from the rightmost one, until there are
+        no more rules under the checked suffix. The longest matching rule
+        wins, exception rules win over any other. The suffix is never the
+        whole domain. If there is no such suffix, return ('full_domain.tld', None)
+        """
+        labels = domain.split('.')
+        count = len(labels)
+        suffix_length = None
+        key = ''
+        for length in xrange(1, count + 1):
+            label = labels[count - length]
+            key = key and '{0}.{1}'.format(key, label) or label
+            flags = self.find(key)
+            if flags & EXCEPTION:
+                suffix_length = length - 1 or None
+                break
+            if flags & RULE and length < count:
+                suffix_length = length
+            if flags & WILDCARD and length + 1 < count:
+                suffix_length = length + 1
+            if not flags & CHILDREN:
+                break
+        if suffix_length is None:
+            return domain, None
+        return '.'.join(labels[:count - suffix_length]), '.'.join(labels[count - suffix_length:])
+
+
+public_suffixes = load_index()
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Rate limits of whois servers.
+
+Every whois server has its own token bucket, so queries wait only when
+their own server's bucket is empty, and a batch of domains of different
+zones runs at the combined rate of all servers.
+
+Every whois server has its own limit of concurrent queries too, which is
+adapted to the server: raised while it answers fast, and cut when it fails
+or throttles queries.
+"""
+import time
+import threading
+
+from .errors import WhoisTimeout
+
+# queries per second and burst size of strict registries, which ban clients
+# querying them too often
+DEFAULT_RATE_LIMITS = {
+    'whois.tcinet.ru': (1.0, 5),
+    'whois.nic.ru': (1.0, 5),
+    'whois.ripn.net': (1.0, 5),
+}
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate, burst, clock=time.time):
+        """
+        Token bucket, which is refilled with rate tokens per second, up to
+        burst tokens
+
+        :param rate: queries per second
+        :param burst: max number of queries sent at once
+        :param clock: function returning current time in seconds
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self, timeout=None):
+        """
+        Take a token and return the number of seconds to wait before using it
+
+        Tokens are taken in advance, so queries waiting for the bucket are
+        served in order.
+
+        :param timeout: max seconds to wait, if the wait would be longer, the
+                        token is not taken and None is returned
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            delay = max(0.0, (1 - self.tokens) / self.rate)
+            if timeout is not None and delay > timeout:
+                return None
+            self.tokens -= 1
+            return delay
+
+    def refund(self):
+        """
+        Return a token taken for a query which was not sent
+        """
+        with self.lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+    def try_take(self):
+        """
+        Take a token if there is one right now, return True if it's taken
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RateLimiter(object):
+
+    def __init__(self, limits=None, default=None, clock=time.time):
+        """
+        Token buckets of whois servers
+
+        :param limits: dict of servers and their (rate, burst) limits, by
+                       default DEFAULT_RATE_LIMITS
+        :param default: (rate, burst) limit of other servers, None for no limit
+        :param clock: function returning current time in seconds
+        """
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self.default = default
+        self.clock = clock
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, server, source=None):
+        """
+        Return token bucket of the server, or None if it's not limited
+
+        :param source: local address the server is queried from, every
+                       address has its own bucket (see whois2.sources)
+        """
+        key = (server, source)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            limit = self.limits.get(server, self.default)
+            if limit is None:
+                return None
+            with self.lock:
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    bucket = self.buckets[key] = TokenBucket(limit[0], limit[1], self.clock)
+        return bucket
+
+    def set_limit(self, server, rate, burst):
+        with self.lock:
+            self.limits[server] = (rate, burst)
+            for key in list(self.buckets):
+                if key[0] == server:
+                    del self.buckets[key]
+
+    def set_default(self, rate, burst):
+        """
+        Limit all servers which have no limits of their own
+        """
+        with self.lock:
+            self.default = (rate, burst)
+            for key in list(self.buckets):
+                if key[0] not in self.limits:
+                    del self.buckets[key]
+
+    def reserve(self, server, source=None, timeout=None):
+        """
+        Return the number of seconds to wait before querying the server, or
+        None if it's longer than timeout (no token is taken then)
+        """
+        bucket = self.get_bucket(server, source)
+        if bucket is None:
+            return 0.0
+        return bucket.reserve(timeout)
+
+    def refund(self, server, source=None):
+        """
+        Return the token taken for a query to the server, which was not sent
+        """
+        bucket = self.get_bucket(server, source)
+        if bucket is not None:
+            bucket.refund()
+
+    def try_acquire(self, server, source=None):
+        """
+        Take a token of the server if it can be queried right now, return
+        True if it's taken
+        """
+        bucket = self.get_bucket(server, source)
+        if bucket is None:
+            return True
+        return bucket.try_take()
+
+    def acquire(self, server, timeout=None, source=None):
+        """
+        Wait until the server can be queried
+
+        :param timeout: max seconds to wait, if the wait would be longer,
+                        WhoisTimeout is raised right away
+        """
+        delay = self.reserve(server, source, timeout)
+        if delay is None:
+            raise WhoisTimeout('{0} > rate limit delay exceeds the deadline'.format(server))
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AdaptiveLimit(object):
+
+    def __init__(self, initial=4, minimum=1, maximum=64, decrease=0.5, latency_tolerance=2.0, clock=time.time):
+        """
+        Limit of concurrent queries to one whois server, adapted in TCP
+        congestion control style (AIMD)
+
+        The limit grows by one per limit of successful queries, as long as
+        their latency stays within latency_tolerance times the lowest latency
+        seen. Failed or throttled queries cut the limit by decrease factor,
+        once per round: failures of queries started before the last cut
+        don't cut it again.
+
+        :param initial: initial limit
+        :param minimum: the limit never goes lower
+        :param maximum: the limit never goes higher
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.clock = clock
+        self.in_flight = 0
+        self.min_latency = None
+        self.decreased = None
+        self.condition = threading.Condition()
+
+    def try_acquire(self):
+        """
+        Take a slot if there is a free one, return True if it's taken
+        """
+        with self.condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self, timeout=None):
+        """
+        Wait for a free slot and take it, return False if there was no free
+        slot for timeout seconds
+        """
+        with self.condition:
+            if timeout is not None:
+                deadline = time.time() + timeout
+            while self.in_flight >= int(self.limit):
+                if timeout is None:
+                    self.condition.wait()
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+            self.in_flight += 1
+            return True
+
+    def release(self, started, success):
+        """
+        Free the slot taken by the query
+
+        :param started: time the query was started at
+        :param success: False if the query failed or the server throttled it,
+                        None if it was given up for reasons of its own, such
+                        as the deadline, so the limit is not adapted
+        """
+        with self.condition:
+            self.in_flight -= 1
+            now = self.clock()
+            if success:
+                latency = now - started
+                if self.min_latency is None or latency < self.min_latency:
+                    self.min_latency = latency
+                if latency <= self.min_latency * self.latency_tolerance:
+                    self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            elif success is not None and (self.decreased is None or started > self.decreased):
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self.decreased = now
+            self.condition.notify_all()
+
+
+class ConcurrencyLimiter(object):
+
+    def __init__(self, **options):
+        """
+        Adaptive limits of concurrent queries of whois servers
+
+        :param options: options of every AdaptiveLimit
+        """
+        self.options = options
+        self.limits = {}
+        self.lock = threading.Lock()
+
+    def get(self, server):
+        """
+        Return AdaptiveLimit of the server
+        """
+        limit = self.limits.get(server)
+        if limit is None:
+            with self.lock:
+                limit = self.limits.get(server)
+                if limit is None:
+                    limit = self.limits[server] = AdaptiveLimit(**self.options)
+        return limit
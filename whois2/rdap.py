@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+RDAP transport.
+
+Registries which serve RDAP (RFC 7480-7484) answer domain lookups with JSON
+over HTTP, so no regular expressions are needed to parse the answer, and
+connections to the server are kept alive between lookups.
+
+Base URLs of RDAP servers of zones are taken from the bootstrap table (see
+RFC 7484 and https://data.iana.org/rdap/dns.json).
+"""
+import json
+import socket
+import httplib
+import threading
+import urlparse
+
+from .errors import WhoisError, WhoisConnectionError, WhoisServerNotFound
+from .servers import ServerTable
+from .utils import DEFAULT_CACHE_TIMEOUT
+from .parser_utils import clean_nameserver, DatetimeFormat
+
+DEFAULT_TIMEOUT = 30
+# idle connections kept per host
+DEFAULT_POOL_SIZE = 4
+
+rdap_servers = {
+    'com': 'https://rdap.verisign.com/com/v1/',
+    'net': 'https://rdap.verisign.com/net/v1/',
+    'cc': 'https://tld-rdap.verisign.com/cc/v1/',
+    'tv': 'https://tld-rdap.verisign.com/tv/v1/',
+    'name': 'https://tld-rdap.verisign.com/name/v1/',
+    'org': 'https://rdap.publicinterestregistry.org/rdap/',
+    'info': 'https://rdap.identitydigital.services/rdap/',
+    'biz': 'https://rdap.nic.biz/',
+    'mobi': 'https://rdap.identitydigital.services/rdap/',
+    'pro': 'https://rdap.identitydigital.services/rdap/',
+    'xyz': 'https://rdap.centralnic.com/xyz/',
+    'app': 'https://pubapi.registry.google/rdap/',
+    'dev': 'https://pubapi.registry.google/rdap/',
+}
+
+# RDAP event actions and WhoisDomain attributes they set
+EVENT_FIELDS = {
+    'registration': 'created',
+    'expiration': 'paid_till',
+}
+
+clean_event_date = DatetimeFormat('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ConnectionPool(object):
+
+    def __init__(self, max_connections=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+        """
+        Pool of persistent HTTP connections, per host
+
+        Connections are taken from the pool for the time of a request, so the
+        pool is safe to share between threads. At most max_connections idle
+        connections are kept per host, the rest are closed.
+        """
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, scheme, netloc):
+        with self.lock:
+            connections = self.idle.get((scheme, netloc))
+            if connections:
+                return connections.pop(), True
+        if scheme == 'https':
+            return httplib.HTTPSConnection(netloc, timeout=self.timeout), False
+        return httplib.HTTPConnection(netloc, timeout=self.timeout), False
+
+    def release(self, scheme, netloc, connection):
+        with self.lock:
+            connections = self.idle.setdefault((scheme, netloc), [])
+            if len(connections) < self.max_connections:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def request(self, url):
+        """
+        GET the url and return the status and the body of the response
+
+        A connection taken from the pool may have been closed by the server
+        meanwhile, then the request is sent again over a new connection.
+
+        :raises: WhoisConnectionError
+        """
+        scheme, netloc, path, query, fragment = urlparse.urlsplit(url)
+        if query:
+            path = '{0}?{1}'.format(path, query)
+        while True:
+            connection, reused = self.acquire(scheme, netloc)
+            try:
+                connection.request('GET', path, headers={'Accept': 'application/rdap+json'})
+                response = connection.getresponse()
+                body = response.read()
+            except (socket.error, httplib.HTTPException) as e:
+                connection.close()
+                if reused:
+                    continue
+                raise WhoisConnectionError('{0} > {1}'.format(url, e))
+            if response.will_close:
+                connection.close()
+            else:
+                self.release(scheme, netloc, connection)
+            return response.status, body
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class RdapClient(object):
+
+    def __init__(self, servers=None, pool=None):
+        """
+        RDAP client
+
+        :param servers: ServerTable of base URLs of RDAP servers, by default
+                        the bundled bootstrap table
+        :param pool: ConnectionPool, shared by all lookups of the client
+        """
+        if servers is None:
+            servers = ServerTable(rdap_servers, cache_path=None)
+        self.servers = servers
+        self.pool = pool or ConnectionPool()
+
+    def get_server(self, domain):
+        """
+        Return base URL of RDAP server for the domain
+
+        :raises: WhoisServerNotFound
+        """
+        server = self.servers.get(domain)
+        if not server:
+            raise WhoisServerNotFound('there is no known RDAP server for {0}'.format(domain))
+        return server
+
+    def rdap(self, domain):
+        """
+        Return RDAP response for the domain as a string, empty string if the
+        domain is not found
+
+        :raises: WhoisError
+        """
+        url = urlparse.urljoin(self.get_server(domain), 'domain/{0}'.format(domain))
+        status, body = self.pool.request(url)
+        if status == httplib.NOT_FOUND:
+            return ''
+        if status != httplib.OK:
+            raise WhoisError('{0} > {1} {2}'.format(url, status, body[:200]))
+        return body
+
+
+default_rdap_client = RdapClient()
+
+
+def get_rdap(domain, cache=None, cache_timeout=None):
+    """
+    Get RDAP response of the domain, empty string if the domain is not found
+
+    :param cache: a cache object having two methods: set(key, value, timeout)
+                  and get(key), see get_whois(..)
+    :param cache_timeout: cache timeout (in seconds)
+
+    :raises: WhoisError
+    """
+    cache_key = ':'.join((domain, 'rdap'))
+    out = None
+    if cache:
+        out = cache.get(cache_key)
+    if out is None:
+        out = default_rdap_client.rdap(domain)
+        if cache:
+            cache.set(cache_key, out, cache_timeout or DEFAULT_CACHE_TIMEOUT)
+    return out
+
+
+def parse_rdap(whois, rdap_data):
+    """
+    Set attributes of the whois object from the RDAP response
+
+    :raises: WhoisError if the response is not an RDAP object
+    """
+    if not rdap_data:
+        whois.registered = False
+        return
+    try:
+        data = json.loads(rdap_data)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        raise WhoisError('{0} > invalid RDAP response: {1}'.format(whois.domain, rdap_data[:200]))
+    whois.registered = True
+    whois.nameservers = [
+        clean_nameserver(nameserver['ldhName'].encode('idna'))
+        for nameserver in data.get('nameservers', ()) if nameserver.get('ldhName')
+    ]
+    for event in data.get('events', ()):
+        field = EVENT_FIELDS.get(event.get('eventAction'))
+        if field and event.get('eventDate'):
+            setattr(whois, field, clean_event_date(event['eventDate']))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Resolving and connecting to whois servers.
+
+Addresses of whois servers are cached, so queries don't repeat DNS lookups
+of the same few servers again and again. getaddrinfo() doesn't expose TTLs
+of DNS records, so entries live for a configured TTL.
+
+Connections are made Happy Eyeballs style (RFC 8305): IPv6 and IPv4
+addresses are interleaved and tried one after another with a short delay,
+without waiting for the previous attempt to fail, and the first connected
+socket wins. A host with broken IPv6 connects over IPv4 after the delay,
+instead of the full connect timeout.
+"""
+import time
+import errno
+import socket
+import select
+import threading
+from collections import OrderedDict
+
+DEFAULT_TTL = 300
+# RFC 8305 recommended Connection Attempt Delay
+CONNECTION_ATTEMPT_DELAY = 0.25
+
+
+def interleave(addresses):
+    """
+    Reorder getaddrinfo() results so address families alternate, starting
+    with the family of the first address (RFC 8305, section 4)
+    """
+    families = OrderedDict()
+    for address in addresses:
+        families.setdefault(address[0], []).append(address)
+    ordered = []
+    queues = families.values()
+    while any(queues):
+        for queue in queues:
+            if queue:
+                ordered.append(queue.pop(0))
+    return ordered
+
+
+class Resolver(object):
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=1000, clock=time.time):
+        """
+        Cache of addresses of whois servers
+
+        :param ttl: seconds to keep resolved addresses for
+        :param max_entries: max number of hosts kept, least recently resolved
+                            ones are dropped first
+        :param clock: function returning current time in seconds
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        # (host, port) => (expiration time, addresses)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def resolve(self, host, port):
+        """
+        Return getaddrinfo() results for TCP connections to the host, with
+        address families interleaved
+
+        :raises: socket.gaierror
+        """
+        key = (host, port)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and entry[0] > self.clock():
+            return entry[1]
+        addresses = interleave(socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM))
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (self.clock() + self.ttl, addresses)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return addresses
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+def get_family(host):
+    return socket.AF_INET6 if ':' in host else socket.AF_INET
+
+
+def connect(addresses, timeout=None, source_address=None, delay=CONNECTION_ATTEMPT_DELAY):
+    """
+    Connect to the first address which accepts the connection, starting a
+    new attempt every delay seconds, or right away when an attempt fails
+
+    :param addresses: getaddrinfo() results, see Resolver.resolve(..)
+    :param timeout: seconds to wait for all attempts
+    :param source_address: (host, port) to bind sockets to, only addresses
+                           of its family are tried
+    :returns: blocking socket
+    :raises: socket.timeout, socket.error
+    """
+    if source_address:
+        family = get_family(source_address[0])
+        addresses = [address for address in addresses if address[0] == family]
+    if not addresses:
+        raise socket.error('no addresses to connect to')
+    addresses = list(addresses)
+    deadline = None if timeout is None else time.time() + timeout
+    attempts = {}
+    error = None
+    next_attempt = time.time()
+    try:
+        while True:
+            now = time.time()
+            if addresses and now >= next_attempt:
+                family, socktype, proto, canonname, address = addresses.pop(0)
+                sock = socket.socket(family, socktype, proto)
+                try:
+                    sock.setblocking(0)
+                    if source_address:
+                        sock.bind(source_address)
+                    status = sock.connect_ex(address)
+                    if status not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        raise socket.error(status, errno.errorcode.get(status, status))
+                except socket.error as e:
+                    sock.close()
+                    error = e
+                    next_attempt = now
+                    continue
+                attempts[sock.fileno()] = sock
+                next_attempt = now + delay
+            if not attempts:
+                if addresses:
+                    continue
+                raise error
+            wait = next_attempt - now if addresses else None
+            if deadline is not None:
+                wait = deadline - now if wait is None else min(wait, deadline - now)
+                if wait <= 0:
+                    raise socket.timeout('timed out')
+            readable, writable, errors = select.select([], attempts.keys(), attempts.keys(), wait)
+            for fileno in set(writable + errors):
+                sock = attempts.pop(fileno)
+                status = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if not status:
+                    sock.setblocking(1)
+                    return sock
+                sock.close()
+                error = socket.error(status, errno.errorcode.get(status, status))
+                # a failed attempt doesn't hold back the next one
+                next_attempt = time.time()
+    finally:
+        for sock in attempts.values():
+            sock.close()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Whois servers of zones.
+
+Servers of top level domains are bundled in servers_data module. Servers
+learned from IANA referrals are stored in a persistent cache, so that every
+zone costs at most one query to whois.iana.org, ever.
+
+The bundled table can be refreshed offline from a dump of IANA root zone
+database, that is IANA whois responses for all zones, one after another
+(see "make servers").
+"""
+import os
+import json
+import threading
+
+from .servers_data import whois_servers
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'whois2', 'servers.json')
+SERVERS_DATA_PATH = os.path.join(os.path.dirname(__file__), 'servers_data.py')
+
+
+class ServerTable(object):
+
+    def __init__(self, servers=None, cache_path=DEFAULT_CACHE_PATH):
+        """
+        Table of whois servers of zones
+
+        :param servers: dict of zones and their whois servers, empty string
+                        for zones without whois server. Bundled table by default
+        :param cache_path: path to file with servers learned from referrals,
+                           None to keep them in memory only
+        """
+        self.servers = dict(whois_servers if servers is None else servers)
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.learned = self.load()
+
+    def load(self):
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path) as fd:
+                return dict((str(zone), str(server)) for zone, server in json.load(fd).items())
+        except (IOError, ValueError, AttributeError):
+            return {}
+
+    def save(self):
+        if not self.cache_path:
+            return
+        tmp_path = '{0}.{1}.tmp'.format(self.cache_path, os.getpid())
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(tmp_path, 'w') as fd:
+                json.dump(self.learned, fd, indent=0, sort_keys=True)
+            os.rename(tmp_path, self.cache_path)
+        except (IOError, OSError):
+            pass
+
+    def get(self, domain):
+        """
+        Return whois server of the longest zone of the domain, '' if the zone
+        has no whois server, or None if the server is unknown
+        """
+        dot = domain.find('.')
+        while dot != -1:
+            zone = domain[dot + 1:]
+            server = self.learned.get(zone)
+            if server is None:
+                server = self.servers.get(zone)
+            if server is not None:
+                return server
+            dot = domain.find('.', dot + 1)
+        return None
+
+    def learn(self, zone, server):
+        """
+        Remember whois server of the zone learned from a referral
+        """
+        with self.lock:
+            self.learned[zone] = server or ''
+            self.save()
+
+
+def parse_iana_dump(lines):
+    """
+    Parse IANA whois responses for top level domains
+
+    :returns: dict of zones and their whois servers ('' if there is none)
+    """
+    servers = {}
+    zone = None
+    for line in lines:
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        key, value = key.strip().lower(), value.strip().lower()
+        if key == 'domain':
+            zone = value
+            servers.setdefault(zone, '')
+        elif key == 'whois' and zone and value:
+            servers[zone] = value
+    return servers
+
+
+def write_servers_data(servers, path=SERVERS_DATA_PATH, source='IANA root zone database'):
+    """
+    Write servers_data module with the table of servers
+    """
+    lines = [
+        '# -*- coding: utf-8 -*-',
+        '# Whois servers of top level domains, generated by',
+        '# whois2.servers.write_servers_data from {0}.'.format(source),
+        '# Empty string means the zone has no whois server.',
+        'whois_servers = {',
+    ]
+    for zone in sorted(servers):
+        lines.append('    {0!r}: {1!r},'.format(zone, servers[zone]))
+    lines.append('}')
+    with open(path, 'w') as fd:
+        fd.write('\n'.join(lines) + '\n')
+
+
+def update_servers_data(dump_path, path=SERVERS_DATA_PATH):
+    """
+    Refresh servers_data module from the dump of IANA root zone database
+    """
+    with open(dump_path) as fd:
+        servers = parse_iana_dump(fd)
+    write_servers_data(servers, path, 'IANA root zone database dump')
@@ -0,0 +1,1537 @@
+# -*- coding: utf-8 -*-
+# Whois servers of top level domains, generated by
+# whois2.servers.write_servers_data from IANA root zone database (2024-09-20).
+# Empty string means the zone has no whois server.
+whois_servers = {
+    'aaa': '',
+    'aarp': 'whois.nic.aarp',
+    'abarth': '',
+    'abb': 'whois.nic.abb',
+    'abbott': 'whois.nic.abbott',
+    'abbvie': 'whois.nic.abbvie',
+    'abc': 'whois.nic.abc',
+    'able': '',
+    'abogado': 'whois.nic.abogado',
+    'abudhabi': 'whois.nic.abudhabi',
+    'ac': 'whois.nic.ac',
+    'academy': 'whois.nic.academy',
+    'accenture': 'whois.nic.accenture',
+    'accountant': 'whois.nic.accountant',
+    'accountants': 'whois.nic.accountants',
+    'aco': 'whois.nic.aco',
+    'active': '',
+    'actor': 'whois.nic.actor',
+    'ad': 'whois.nic.ad',
+    'adac': '',
+    'ads': 'whois.nic.google',
+    'adult': 'whois.nic.adult',
+    'ae': 'whois.aeda.net.ae',
+    'aeg': 'whois.nic.aeg',
+    'aero': 'whois.aero',
+    'aetna': '',
+    'af': 'whois.nic.af',
+    'afamilycompany': '',
+    'afl': 'whois.nic.afl',
+    'africa': 'whois.nic.africa',
+    'ag': 'whois.nic.ag',
+    'agakhan': 'whois.nic.agakhan',
+    'agency': 'whois.nic.agency',
+    'ai': 'whois.nic.ai',
+    'aig': '',
+    'aigo': '',
+    'airbus': 'whois.nic.airbus',
+    'airforce': 'whois.nic.airforce',
+    'airtel': 'whois.nic.airtel',
+    'akdn': 'whois.nic.akdn',
+    'al': '',
+    'alfaromeo': '',
+    'alibaba': 'whois.nic.alibaba',
+    'alipay': 'whois.nic.alipay',
+    'allfinanz': 'whois.nic.allfinanz',
+    'allstate': 'whois.nic.allstate',
+    'ally': 'whois.nic.ally',
+    'alsace': 'whois.nic.alsace',
+    'alstom': 'whois.nic.alstom',
+    'am': 'whois.amnic.net',
+    'americanexpress': '',
+    'americanfamily': 'whois.nic.americanfamily',
+    'amex': '',
+    'amfam': 'whois.nic.amfam',
+    'amica': '',
+    'amsterdam': 'whois.nic.amsterdam',
+    'analytics': '',
+    'android': 'whois.nic.google',
+    'anquan': 'whois.teleinfo.cn',
+    'anz': 'whois.nic.anz',
+    'ao': '',
+    'aol': 'whois.nic.aol',
+    'apartments': 'whois.nic.apartments',
+    'app': 'whois.nic.google',
+    'apple': 'whois.nic.apple',
+    'aq': '',
+    'aquarelle': 'whois.nic.aquarelle',
+    'ar': 'whois.nic.ar',
+    'aramco': '',
+    'archi': 'whois.nic.archi',
+    'army': 'whois.nic.army',
+    'arpa': 'whois.iana.org',
+    'art': 'whois.nic.art',
+    'arte': 'whois.nic.arte',
+    'as': 'whois.nic.as',
+    'asda': 'whois.nic.asda',
+    'asia': 'whois.nic.asia',
+    'associates': 'whois.nic.associates',
+    'at': 'whois.nic.at',
+    'athleta': '',
+    'attorney': 'whois.nic.attorney',
+    'au': 'whois.auda.org.au',
+    'auction': 'whois.nic.auction',
+    'audi': 'whois.nic.audi',
+    'audible': 'whois.nic.audible',
+    'audio': 'whois.nic.audio',
+    'auspost': 'whois.nic.auspost',
+    'author': 'whois.nic.author',
+    'auto': 'whois.nic.auto',
+    'autos': 'whois.nic.autos',
+    'avianca': '',
+    'aw': 'whois.nic.aw',
+    'aws': 'whois.nic.aws',
+    'ax': 'whois.ax',
+    'axa': '',
+    'az': '',
+    'azure': 'whois.nic.azure',
+    'ba': '',
+    'baby': 'whois.nic.baby',
+    'baidu': 'whois.gtld.knet.cn',
+    'banamex': '',
+    'bananarepublic': '',
+    'band': 'whois.nic.band',
+    'bank': 'whois.nic.bank',
+    'bar': 'whois.nic.bar',
+    'barcelona': 'whois.nic.barcelona',
+    'barclaycard': 'whois.nic.barclaycard',
+    'barclays': 'whois.nic.barclays',
+    'barefoot': 'whois.nic.barefoot',
+    'bargains': 'whois.nic.bargains',
+    'baseball': 'whois.nic.baseball',
+    'basketball': 'whois.nic.basketball',
+    'bauhaus': 'whois.nic.bauhaus',
+    'bayern': 'whois.nic.bayern',
+    'bb': '',
+    'bbc': 'whois.nic.bbc',
+    'bbt': 'whois.nic.bbt',
+    'bbva': 'whois.nic.bbva',
+    'bcg': 'whois.nic.bcg',
+    'bcn': 'whois.nic.bcn',
+    'bd': '',
+    'be': 'whois.dns.be',
+    'beats': 'whois.nic.beats',
+    'beauty': 'whois.nic.beauty',
+    'beer': 'whois.nic.beer',
+    'bentley': 'whois.nic.bentley',
+    'berlin': 'whois.nic.berlin',
+    'best': 'whois.nic.best',
+    'bestbuy': 'whois.nic.bestbuy',
+    'bet': 'whois.nic.bet',
+    'bf': 'whois.registre.bf',
+    'bg': 'whois.register.bg',
+    'bh': 'whois.nic.bh',
+    'bharti': '',
+    'bi': 'whois1.nic.bi',
+    'bible': 'whois.nic.bible',
+    'bid': 'whois.nic.bid',
+    'bike': 'whois.nic.bike',
+    'bing': 'whois.nic.bing',
+    'bingo': 'whois.nic.bingo',
+    'bio': 'whois.nic.bio',
+    'biz': 'whois.nic.biz',
+    'bj': 'whois.nic.bj',
+    'black': 'whois.nic.black',
+    'blackfriday': 'whois.nic.blackfriday',
+    'blanco': '',
+    'blockbuster': 'whois.nic.blockbuster',
+    'blog': 'whois.nic.blog',
+    'bloomberg': 'whois.nic.bloomberg',
+    'blue': 'whois.nic.blue',
+    'bm': 'whois.nic.bm',
+    'bms': 'whois.nic.bms',
+    'bmw': 'whois.nic.bmw',
+    'bn': 'whois.bnnic.bn',
+    'bnl': '',
+    'bnpparibas': 'whois.nic.bnpparibas',
+    'bo': 'whois.nic.bo',
+    'boats': 'whois.nic.boats',
+    'boehringer': 'whois.nic.boehringer',
+    'bofa': 'whois.nic.bofa',
+    'bom': 'whois.gtlds.nic.br',
+    'bond': 'whois.nic.bond',
+    'boo': 'whois.nic.google',
+    'book': 'whois.nic.book',
+    'booking': '',
+    'boots': '',
+    'bosch': 'whois.nic.bosch',
+    'bostik': 'whois.nic.bostik',
+    'boston': 'whois.nic.boston',
+    'bot': 'whois.nic.bot',
+    'boutique': 'whois.nic.boutique',
+    'box': 'whois.nic.box',
+    'br': 'whois.registro.br',
+    'bradesco': 'whois.nic.bradesco',
+    'bridgestone': 'whois.nic.bridgestone',
+    'broadway': 'whois.nic.broadway',
+    'broker': 'whois.nic.broker',
+    'brother': 'whois.nic.brother',
+    'brussels': 'whois.nic.brussels',
+    'bs': '',
+    'bt': '',
+    'budapest': '',
+    'bugatti': '',
+    'build': 'whois.nic.build',
+    'builders': 'whois.nic.builders',
+    'business': 'whois.nic.business',
+    'buy': 'whois.nic.buy',
+    'buzz': 'whois.nic.buzz',
+    'bv': '',
+    'bw': 'whois.nic.net.bw',
+    'by': 'whois.cctld.by',
+    'bz': '',
+    'bzh': 'whois.nic.bzh',
+    'ca': 'whois.cira.ca',
+    'cab': 'whois.nic.cab',
+    'cafe': 'whois.nic.cafe',
+    'cal': 'whois.nic.google',
+    'call': 'whois.nic.call',
+    'calvinklein': '',
+    'cam': 'whois.nic.cam',
+    'camera': 'whois.nic.camera',
+    'camp': 'whois.nic.camp',
+    'cancerresearch': '',
+    'canon': 'whois.nic.canon',
+    'capetown': 'whois.nic.capetown',
+    'capital': 'whois.nic.capital',
+    'capitalone': 'whois.nic.capitalone',
+    'car': 'whois.nic.car',
+    'caravan': '',
+    'cards': 'whois.nic.cards',
+    'care': 'whois.nic.care',
+    'career': 'whois.nic.career',
+    'careers': 'whois.nic.careers',
+    'cars': 'whois.nic.cars',
+    'cartier': '',
+    'casa': 'whois.nic.casa',
+    'case': 'whois.nic.case',
+    'caseih': '',
+    'cash': 'whois.nic.cash',
+    'casino': 'whois.nic.casino',
+    'cat': 'whois.nic.cat',
+    'catering': 'whois.nic.catering',
+    'catholic': 'whois.nic.catholic',
+    'cba': 'whois.nic.cba',
+    'cbn': '',
+    'cbre': '',
+    'cbs': '',
+    'cc': 'ccwhois.verisign-grs.com',
+    'cd': '',
+    'ceb': '',
+    'center': 'whois.nic.center',
+    'ceo': 'whois.nic.ceo',
+    'cern': 'whois.nic.cern',
+    'cf': 'whois.dot.cf',
+    'cfa': 'whois.nic.cfa',
+    'cfd': 'whois.nic.cfd',
+    'cg': '',
+    'ch': 'whois.nic.ch',
+    'chanel': 'whois.nic.chanel',
+    'channel': 'whois.nic.google',
+    'chase': '',
+    'chat': 'whois.nic.chat',
+    'cheap': 'whois.nic.cheap',
+    'chintai': 'whois.nic.chintai',
+    'chloe': '',
+    'christmas': 'whois.nic.christmas',
+    'chrome': 'whois.nic.google',
+    'chrysler': '',
+    'church': 'whois.nic.church',
+    'ci': 'whois.nic.ci',
+    'cipriani': 'whois.nic.cipriani',
+    'circle': 'whois.nic.circle',
+    'cisco': '',
+    'citadel': 'whois.nic.citadel',
+    'citi': '',
+    'citic': '',
+    'city': 'whois.nic.city',
+    'cityeats': '',
+    'ck': '',
+    'cl': 'whois.nic.cl',
+    'claims': 'whois.nic.claims',
+    'cleaning': 'whois.nic.cleaning',
+    'click': 'whois.nic.click',
+    'clinic': 'whois.nic.clinic',
+    'clinique': 'whois.nic.clinique',
+    'clothing': 'whois.nic.clothing',
+    'cloud': 'whois.nic.cloud',
+    'club': 'whois.nic.club',
+    'clubmed': 'whois.nic.clubmed',
+    'cm': '',
+    'cn': 'whois.cnnic.cn',
+    'co': 'whois.nic.co',
+    'coach': 'whois.nic.coach',
+    'codes': 'whois.nic.codes',
+    'coffee': 'whois.nic.coffee',
+    'college': 'whois.nic.college',
+    'cologne': 'whois.ryce-rsp.com',
+    'com': 'whois.verisign-grs.com',
+    'comcast': '',
+    'commbank': 'whois.nic.commbank',
+    'community': 'whois.nic.community',
+    'company': 'whois.nic.company',
+    'compare': 'whois.nic.compare',
+    'computer': 'whois.nic.computer',
+    'comsec': 'whois.nic.comsec',
+    'condos': 'whois.nic.condos',
+    'construction': 'whois.nic.construction',
+    'consulting': 'whois.nic.consulting',
+    'contact': 'whois.nic.contact',
+    'contractors': 'whois.nic.contractors',
+    'cooking': 'whois.nic.cooking',
+    'cookingchannel': '',
+    'cool': 'whois.nic.cool',
+    'coop': 'whois.nic.coop',
+    'corsica': 'whois.nic.corsica',
+    'country': 'whois.nic.country',
+    'coupon': '',
+    'coupons': 'whois.nic.coupons',
+    'courses': 'whois.nic.courses',
+    'cr': 'whois.nic.cr',
+    'credit': 'whois.nic.credit',
+    'creditcard': 'whois.nic.creditcard',
+    'creditunion': 'whois.nic.creditunion',
+    'cricket': 'whois.nic.cricket',
+    'crown': 'whois.nic.crown',
+    'crs': 'whois.nic.crs',
+    'cruise': 'whois.nic.cruise',
+    'cruises': 'whois.nic.cruises',
+    'csc': '',
+    'cu': '',
+    'cuisinella': 'whois.nic.cuisinella',
+    'cv': 'whois.nic.cv',
+    'cw': '',
+    'cx': 'whois.nic.cx',
+    'cy': '',
+    'cymru': 'whois.nic.cymru',
+    'cyou': 'whois.nic.cyou',
+    'cz': 'whois.nic.cz',
+    'dabur': 'whois.nic.dabur',
+    'dad': 'whois.nic.google',
+    'dance': 'whois.nic.dance',
+    'data': 'whois.nic.data',
+    'date': 'whois.nic.date',
+    'dating': 'whois.nic.dating',
+    'datsun': 'whois.nic.gmo',
+    'day': 'whois.nic.google',
+    'dclk': 'whois.nic.google',
+    'dds': 'whois.nic.dds',
+    'de': 'whois.denic.de',
+    'deal': 'whois.nic.deal',
+    'dealer': 'whois.nic.dealer',
+    'deals': 'whois.nic.deals',
+    'degree': 'whois.nic.degree',
+    'delivery': 'whois.nic.delivery',
+    'dell': '',
+    'deloitte': 'whois.nic.deloitte',
+    'delta': 'whois.nic.delta',
+    'democrat': 'whois.nic.democrat',
+    'dental': 'whois.nic.dental',
+    'dentist': 'whois.nic.dentist',
+    'desi': 'whois.nic.desi',
+    'design': 'whois.nic.design',
+    'dev': 'whois.nic.google',
+    'dhl': '',
+    'diamonds': 'whois.nic.diamonds',
+    'diet': 'whois.nic.diet',
+    'digital': 'whois.nic.digital',
+    'direct': 'whois.nic.direct',
+    'directory': 'whois.nic.directory',
+    'discount': 'whois.nic.discount',
+    'discover': '',
+    'dish': 'whois.nic.dish',
+    'diy': 'whois.nic.diy',
+    'dj': '',
+    'dk': 'whois.punktum.dk',
+    'dm': 'whois.dmdomains.dm',
+    'dnp': 'whois.nic.dnp',
+    'do': 'whois.nic.do',
+    'docs': 'whois.nic.google',
+    'doctor': 'whois.nic.doctor',
+    'dodge': '',
+    'dog': 'whois.nic.dog',
+    'doha': '',
+    'domains': 'whois.nic.domains',
+    'dot': 'whois.nic.dot',
+    'download': 'whois.nic.download',
+    'drive': 'whois.nic.google',
+    'dtv': 'whois.nic.dtv',
+    'dubai': 'whois.nic.dubai',
+    'duck': '',
+    'dunlop': 'whois.nic.dunlop',
+    'duns': '',
+    'dupont': '',
+    'durban': 'whois.nic.durban',
+    'dvag': 'whois.nic.dvag',
+    'dvr': 'whois.nic.dvr',
+    'dz': 'whois.nic.dz',
+    'earth': 'whois.nic.earth',
+    'eat': 'whois.nic.google',
+    'ec': 'whois.nic.ec',
+    'eco': 'whois.nic.eco',
+    'edeka': 'whois.nic.edeka',
+    'edu': 'whois.educause.edu',
+    'education': 'whois.nic.education',
+    'ee': 'whois.tld.ee',
+    'eg': '',
+    'email': 'whois.nic.email',
+    'emerck': 'whois.nic.emerck',
+    'energy': 'whois.nic.energy',
+    'engineer': 'whois.nic.engineer',
+    'engineering': 'whois.nic.engineering',
+    'enterprises': 'whois.nic.enterprises',
+    'epost': '',
+    'epson': 'whois.nic.epson',
+    'equipment': 'whois.nic.equipment',
+    'er': '',
+    'ericsson': 'whois.nic.ericsson',
+    'erni': 'whois.nic.erni',
+    'es': 'whois.nic.es',
+    'esq': 'whois.nic.google',
+    'estate': 'whois.nic.estate',
+    'esurance': '',
+    'et': '',
+    'eu': 'whois.eu',
+    'eurovision': 'whois.nic.eurovision',
+    'eus': 'whois.nic.eus',
+    'events': 'whois.nic.events',
+    'everbank': '',
+    'exchange': 'whois.nic.exchange',
+    'expert': 'whois.nic.expert',
+    'exposed': 'whois.nic.exposed',
+    'express': 'whois.nic.express',
+    'extraspace': 'whois.nic.extraspace',
+    'fage': 'whois.nic.fage',
+    'fail': 'whois.nic.fail',
+    'fairwinds': 'whois.nic.fairwinds',
+    'faith': 'whois.nic.faith',
+    'family': 'whois.nic.family',
+    'fan': 'whois.nic.fan',
+    'fans': 'whois.nic.fans',
+    'farm': 'whois.nic.farm',
+    'farmers': '',
+    'fashion': 'whois.nic.fashion',
+    'fast': 'whois.nic.fast',
+    'fedex': 'whois.nic.fedex',
+    'feedback': 'whois.nic.feedback',
+    'ferrari': 'whois.nic.ferrari',
+    'ferrero': '',
+    'fi': 'whois.fi',
+    'fiat': '',
+    'fidelity': 'whois.nic.fidelity',
+    'fido': 'whois.nic.fido',
+    'film': 'whois.nic.film',
+    'final': 'whois.gtlds.nic.br',
+    'finance': 'whois.nic.finance',
+    'financial': 'whois.nic.financial',
+    'fire': 'whois.nic.fire',
+    'firestone': 'whois.nic.firestone',
+    'firmdale': 'whois.nic.firmdale',
+    'fish': 'whois.nic.fish',
+    'fishing': 'whois.nic.fishing',
+    'fit': 'whois.nic.fit',
+    'fitness': 'whois.nic.fitness',
+    'fj': 'www.whois.fj',
+    'fk': '',
+    'flickr': '',
+    'flights': 'whois.nic.flights',
+    'flir': '',
+    'florist': 'whois.nic.florist',
+    'flowers': 'whois.nic.flowers',
+    'fly': 'whois.nic.google',
+    'fm': 'whois.nic.fm',
+    'fo': 'whois.nic.fo',
+    'foo': 'whois.nic.google',
+    'food': '',
+    'foodnetwork': '',
+    'football': 'whois.nic.football',
+    'ford': '',
+    'forex': 'whois.nic.forex',
+    'forsale': 'whois.nic.forsale',
+    'forum': 'whois.nic.forum',
+    'foundation': 'whois.nic.foundation',
+    'fox': 'whois.nic.fox',
+    'fr': 'whois.nic.fr',
+    'free': 'whois.nic.free',
+    'fresenius': 'whois.nic.fresenius',
+    'frl': 'whois.nic.frl',
+    'frogans': 'whois.nic.frogans',
+    'frontdoor': '',
+    'frontier': '',
+    'ftr': '',
+    'fujitsu': 'whois.nic.gmo',
+    'fujixerox': '',
+    'fun': 'whois.nic.fun',
+    'fund': 'whois.nic.fund',
+    'furniture': 'whois.nic.furniture',
+    'futbol': 'whois.nic.futbol',
+    'fyi': 'whois.nic.fyi',
+    'ga': '',
+    'gal': 'whois.nic.gal',
+    'gallery': 'whois.nic.gallery',
+    'gallo': 'whois.nic.gallo',
+    'gallup': 'whois.nic.gallup',
+    'game': 'whois.nic.game',
+    'games': 'whois.nic.games',
+    'gap': '',
+    'garden': 'whois.nic.garden',
+    'gb': '',
+    'gbiz': 'whois.nic.google',
+    'gd': 'whois.nic.gd',
+    'gdn': 'whois.nic.gdn',
+    'ge': 'whois.nic.ge',
+    'gea': 'whois.nic.gea',
+    'gent': 'whois.nic.gent',
+    'genting': 'whois.nic.genting',
+    'george': 'whois.nic.george',
+    'gf': 'whois.mediaserv.net',
+    'gg': 'whois.gg',
+    'ggee': 'whois.nic.ggee',
+    'gh': 'whois.nic.gh',
+    'gi': 'whois.identitydigital.services',
+    'gift': 'whois.uniregistry.net',
+    'gifts': 'whois.nic.gifts',
+    'gives': 'whois.nic.gives',
+    'giving': 'whois.nic.giving',
+    'gl': 'whois.nic.gl',
+    'glade': '',
+    'glass': 'whois.nic.glass',
+    'gle': 'whois.nic.google',
+    'global': 'whois.nic.global',
+    'globo': 'whois.gtlds.nic.br',
+    'gm': '',
+    'gmail': 'whois.nic.google',
+    'gmbh': 'whois.nic.gmbh',
+    'gmo': 'whois.nic.gmo',
+    'gmx': 'whois.nic.gmx',
+    'gn': 'whois.ande.gov.gn',
+    'godaddy': 'whois.nic.godaddy',
+    'gold': 'whois.nic.gold',
+    'goldpoint': 'whois.nic.goldpoint',
+    'golf': 'whois.nic.golf',
+    'goo': 'whois.nic.gmo',
+    'goodhands': '',
+    'goodyear': 'whois.nic.goodyear',
+    'goog': 'whois.nic.google',
+    'google': 'whois.nic.google',
+    'gop': 'whois.nic.gop',
+    'got': 'whois.nic.got',
+    'gov': 'whois.dotgov.gov',
+    'gp': 'whois.nic.gp',
+    'gq': 'whois.dominio.gq',
+    'gr': '',
+    'grainger': '',
+    'graphics': 'whois.nic.graphics',
+    'gratis': 'whois.nic.gratis',
+    'green': 'whois.nic.green',
+    'gripe': 'whois.nic.gripe',
+    'group': 'whois.nic.group',
+    'gs': 'whois.nic.gs',
+    'gt': '',
+    'gu': '',
+    'guardian': '',
+    'gucci': 'whois.nic.gucci',
+    'guge': 'whois.nic.google',
+    'guide': 'whois.nic.guide',
+    'guitars': 'whois.nic.guitars',
+    'guru': 'whois.nic.guru',
+    'gw': '',
+    'gy': 'whois.registry.gy',
+    'hair': 'whois.nic.hair',
+    'hamburg': 'whois.nic.hamburg',
+    'hangout': 'whois.nic.google',
+    'haus': 'whois.nic.haus',
+    'hbo': '',
+    'hdfc': 'whois.nic.hdfc',
+    'hdfcbank': 'whois.nic.hdfcbank',
+    'health': '',
+    'healthcare': 'whois.nic.healthcare',
+    'help': 'whois.nic.help',
+    'helsinki': 'whois.nic.helsinki',
+    'here': 'whois.nic.google',
+    'hermes': 'whois.nic.hermes',
+    'hgtv': '',
+    'hiphop': 'whois.nic.hiphop',
+    'hisamitsu': 'whois.nic.gmo',
+    'hitachi': 'whois.nic.gmo',
+    'hiv': 'whois.nic.hiv',
+    'hk': 'whois.hkirc.hk',
+    'hkt': 'whois.nic.hkt',
+    'hm': 'whois.registry.hm',
+    'hn': 'whois.nic.hn',
+    'hockey': 'whois.nic.hockey',
+    'holdings': 'whois.nic.holdings',
+    'holiday': 'whois.nic.holiday',
+    'homedepot': 'whois.nic.homedepot',
+    'homegoods': '',
+    'homes': 'whois.nic.homes',
+    'homesense': '',
+    'honda': 'whois.nic.honda',
+    'honeywell': '',
+    'horse': 'whois.nic.horse',
+    'hospital': 'whois.nic.hospital',
+    'host': 'whois.nic.host',
+    'hosting': 'whois.nic.hosting',
+    'hot': 'whois.nic.hot',
+    'hoteles': '',
+    'hotmail': 'whois.nic.hotmail',
+    'house': 'whois.nic.house',
+    'how': 'whois.nic.google',
+    'hr': 'whois.dns.hr',
+    'hsbc': '',
+    'ht': 'whois.nic.ht',
+    'htc': '',
+    'hu': 'whois.nic.hu',
+    'hughes': 'whois.nic.hughes',
+    'hyatt': '',
+    'hyundai': 'whois.nic.hyundai',
+    'ibm': 'whois.nic.ibm',
+    'icbc': 'whois.nic.icbc',
+    'ice': 'whois.nic.ice',
+    'icu': 'whois.nic.icu',
+    'id': 'whois.id',
+    'ie': 'whois.weare.ie',
+    'ieee': '',
+    'ifm': 'whois.nic.ifm',
+    'ikano': 'whois.nic.ikano',
+    'il': 'whois.isoc.org.il',
+    'im': 'whois.nic.im',
+    'imamat': 'whois.nic.imamat',
+    'imdb': 'whois.nic.imdb',
+    'immo': 'whois.nic.immo',
+    'immobilien': 'whois.nic.immobilien',
+    'in': 'whois.registry.in',
+    'industries': 'whois.nic.industries',
+    'infiniti': 'whois.nic.gmo',
+    'info': 'whois.nic.info',
+    'ing': 'whois.nic.google',
+    'ink': 'whois.nic.ink',
+    'institute': 'whois.nic.institute',
+    'insurance': 'whois.nic.insurance',
+    'insure': 'whois.nic.insure',
+    'int': 'whois.iana.org',
+    'intel': '',
+    'international': 'whois.nic.international',
+    'intuit': '',
+    'investments': 'whois.nic.investments',
+    'io': 'whois.nic.io',
+    'ipiranga': '',
+    'iq': 'whois.cmc.iq',
+    'ir': 'whois.nic.ir',
+    'irish': 'whois.nic.irish',
+    'is': 'whois.isnic.is',
+    'iselect': '',
+    'ismaili': 'whois.nic.ismaili',
+    'ist': 'whois.nic.ist',
+    'istanbul': 'whois.nic.istanbul',
+    'it': 'whois.nic.it',
+    'itau': '',
+    'itv': 'whois.nic.itv',
+    'iveco': '',
+    'iwc': '',
+    'jaguar': 'whois.nic.jaguar',
+    'java': 'whois.nic.java',
+    'jcb': 'whois.nic.gmo',
+    'jcp': '',
+    'je': 'whois.je',
+    'jeep': 'whois.nic.jeep',
+    'jetzt': 'whois.nic.jetzt',
+    'jewelry': 'whois.nic.jewelry',
+    'jio': 'whois.nic.jio',
+    'jlc': '',
+    'jll': 'whois.nic.jll',
+    'jm': '',
+    'jmp': '',
+    'jnj': '',
+    'jo': '',
+    'jobs': 'whois.nic.jobs',
+    'joburg': 'whois.nic.joburg',
+    'jot': 'whois.nic.jot',
+    'joy': 'whois.nic.joy',
+    'jp': 'whois.jprs.jp',
+    'jpmorgan': '',
+    'jprs': '',
+    'juegos': 'whois.uniregistry.net',
+    'juniper': 'whois.nic.juniper',
+    'kaufen': 'whois.nic.kaufen',
+    'kddi': 'whois.nic.kddi',
+    'ke': 'whois.kenic.or.ke',
+    'kerryhotels': 'whois.nic.kerryhotels',
+    'kerrylogistics': 'whois.nic.kerrylogistics',
+    'kerryproperties': 'whois.nic.kerryproperties',
+    'kfh': 'whois.nic.kfh',
+    'kg': 'whois.kg',
+    'kh': '',
+    'ki': 'whois.nic.ki',
+    'kia': 'whois.nic.kia',
+    'kim': 'whois.nic.kim',
+    'kinder': '',
+    'kindle': 'whois.nic.kindle',
+    'kitchen': 'whois.nic.kitchen',
+    'kiwi': 'whois.nic.kiwi',
+    'km': '',
+    'kn': 'whois.nic.kn',
+    'koeln': 'whois.ryce-rsp.com',
+    'komatsu': 'whois.nic.komatsu',
+    'kosher': 'whois.nic.kosher',
+    'kp': '',
+    'kpmg': '',
+    'kpn': '',
+    'kr': 'whois.kr',
+    'krd': 'whois.nic.krd',
+    'kred': '',
+    'kuokgroup': 'whois.nic.kuokgroup',
+    'kw': '',
+    'ky': 'whois.kyregistry.ky',
+    'kyoto': 'whois.nic.kyoto',
+    'kz': 'whois.nic.kz',
+    'la': 'whois.nic.la',
+    'lacaixa': 'whois.nic.lacaixa',
+    'ladbrokes': '',
+    'lamborghini': 'whois.nic.lamborghini',
+    'lamer': 'whois.nic.lamer',
+    'lancaster': 'whois.nic.lancaster',
+    'lancia': '',
+    'lancome': '',
+    'land': 'whois.nic.land',
+    'landrover': 'whois.nic.landrover',
+    'lanxess': '',
+    'lasalle': 'whois.nic.lasalle',
+    'lat': 'whois.nic.lat',
+    'latino': 'whois.nic.latino',
+    'latrobe': 'whois.nic.latrobe',
+    'law': 'whois.nic.law',
+    'lawyer': 'whois.nic.lawyer',
+    'lb': 'whois.lbdr.org.lb',
+    'lc': '',
+    'lds': 'whois.nic.lds',
+    'lease': 'whois.nic.lease',
+    'leclerc': 'whois.nic.leclerc',
+    'lefrak': 'whois.nic.lefrak',
+    'legal': 'whois.nic.legal',
+    'lego': 'whois.nic.lego',
+    'lexus': 'whois.nic.lexus',
+    'lgbt': 'whois.nic.lgbt',
+    'li': 'whois.nic.li',
+    'liaison': '',
+    'lidl': 'whois.nic.lidl',
+    'life': 'whois.nic.life',
+    'lifeinsurance': 'whois.nic.lifeinsurance',
+    'lifestyle': 'whois.nic.lifestyle',
+    'lighting': 'whois.nic.lighting',
+    'like': 'whois.nic.like',
+    'lilly': '',
+    'limited': 'whois.nic.limited',
+    'limo': 'whois.nic.limo',
+    'lincoln': '',
+    'linde': '',
+    'link': 'whois.uniregistry.net',
+    'lipsy': 'whois.nic.lipsy',
+    'live': 'whois.nic.live',
+    'living': '',
+    'lixil': '',
+    'lk': '',
+    'loan': 'whois.nic.loan',
+    'loans': 'whois.nic.loans',
+    'locker': 'whois.nic.locker',
+    'locus': 'whois.nic.locus',
+    'loft': '',
+    'lol': 'whois.nic.lol',
+    'london': 'whois.nic.london',
+    'lotte': 'whois.nic.lotte',
+    'lotto': 'whois.nic.lotto',
+    'love': 'whois.nic.love',
+    'lpl': 'whois.nic.lpl',
+    'lplfinancial': 'whois.nic.lplfinancial',
+    'lr': '',
+    'ls': 'whois.nic.ls',
+    'lt': 'whois.domreg.lt',
+    'ltd': 'whois.nic.ltd',
+    'ltda': 'whois.nic.ltda',
+    'lu': 'whois.dns.lu',
+    'lundbeck': 'whois.nic.lundbeck',
+    'lupin': '',
+    'luxe': 'whois.nic.luxe',
+    'luxury': 'whois.nic.luxury',
+    'lv': 'whois.nic.lv',
+    'ly': 'whois.nic.ly',
+    'ma': 'whois.registre.ma',
+    'macys': '',
+    'madrid': 'whois.nic.madrid',
+    'maif': 'whois.nic.maif',
+    'maison': 'whois.nic.maison',
+    'makeup': 'whois.nic.makeup',
+    'man': 'whois.nic.man',
+    'management': 'whois.nic.management',
+    'mango': 'whois.nic.mango',
+    'market': 'whois.nic.market',
+    'marketing': 'whois.nic.marketing',
+    'markets': 'whois.nic.markets',
+    'marriott': 'whois.nic.marriott',
+    'marshalls': '',
+    'maserati': '',
+    'mattel': '',
+    'mba': 'whois.nic.mba',
+    'mc': '',
+    'mcd': '',
+    'mcdonalds': '',
+    'mckinsey': 'whois.nic.mckinsey',
+    'md': 'whois.nic.md',
+    'me': 'whois.nic.me',
+    'med': 'whois.nic.med',
+    'media': 'whois.nic.media',
+    'meet': 'whois.nic.google',
+    'melbourne': 'whois.nic.melbourne',
+    'meme': 'whois.nic.google',
+    'memorial': 'whois.nic.memorial',
+    'men': 'whois.nic.men',
+    'menu': 'whois.nic.menu',
+    'meo': '',
+    'metlife': '',
+    'mg': 'whois.nic.mg',
+    'mh': '',
+    'miami': 'whois.nic.miami',
+    'microsoft': 'whois.nic.microsoft',
+    'mil': '',
+    'mini': 'whois.nic.mini',
+    'mint': '',
+    'mit': 'whois.nic.mit',
+    'mitsubishi': 'whois.nic.gmo',
+    'mk': 'whois.marnet.mk',
+    'ml': 'whois.nic.ml',
+    'mlb': '',
+    'mls': 'whois.nic.mls',
+    'mm': 'whois.registry.gov.mm',
+    'mma': 'whois.nic.mma',
+    'mn': 'whois.nic.mn',
+    'mo': 'whois.monic.mo',
+    'mobi': 'whois.nic.mobi',
+    'mobile': 'whois.nic.mobile',
+    'mobily': '',
+    'moda': 'whois.nic.moda',
+    'moe': 'whois.nic.moe',
+    'moi': 'whois.nic.moi',
+    'mom': 'whois.nic.mom',
+    'monash': 'whois.nic.monash',
+    'money': 'whois.nic.money',
+    'monster': 'whois.nic.monster',
+    'montblanc': '',
+    'mopar': '',
+    'mormon': 'whois.nic.mormon',
+    'mortgage': 'whois.nic.mortgage',
+    'moscow': 'whois.nic.moscow',
+    'moto': 'whois.nic.moto',
+    'motorcycles': 'whois.nic.motorcycles',
+    'mov': 'whois.nic.google',
+    'movie': 'whois.nic.movie',
+    'movistar': '',
+    'mp': '',
+    'mq': 'whois.mediaserv.net',
+    'mr': 'whois.nic.mr',
+    'ms': 'whois.nic.ms',
+    'msd': 'whois.nic.msd',
+    'mt': '',
+    'mtn': 'whois.nic.mtn',
+    'mtpc': '',
+    'mtr': 'whois.nic.mtr',
+    'mu': 'whois.nic.mu',
+    'museum': 'whois.nic.museum',
+    'mutual': '',
+    'mv': '',
+    'mw': 'whois.nic.mw',
+    'mx': 'whois.mx',
+    'my': 'whois.mynic.my',
+    'mz': 'whois.nic.mz',
+    'na': 'whois.na-nic.com.na',
+    'nab': 'whois.nic.nab',
+    'nadex': '',
+    'nagoya': 'whois.nic.nagoya',
+    'name': 'whois.nic.name',
+    'nationwide': '',
+    'natura': '',
+    'navy': 'whois.nic.navy',
+    'nba': '',
+    'nc': 'whois.nc',
+    'ne': '',
+    'nec': 'whois.nic.nec',
+    'net': 'whois.verisign-grs.com',
+    'netbank': 'whois.nic.netbank',
+    'netflix': '',
+    'network': 'whois.nic.network',
+    'neustar': '',
+    'new': 'whois.nic.google',
+    'newholland': '',
+    'news': 'whois.nic.news',
+    'next': 'whois.nic.next',
+    'nextdirect': 'whois.nic.nextdirect',
+    'nexus': 'whois.nic.google',
+    'nf': 'whois.nic.nf',
+    'nfl': '',
+    'ng': 'whois.nic.net.ng',
+    'ngo': 'whois.nic.ngo',
+    'nhk': 'whois.nic.nhk',
+    'ni': '',
+    'nico': 'whois.nic.nico',
+    'nike': '',
+    'nikon': 'whois.nic.nikon',
+    'ninja': 'whois.nic.ninja',
+    'nissan': 'whois.nic.gmo',
+    'nissay': 'whois.nic.nissay',
+    'nl': 'whois.domain-registry.nl',
+    'no': 'whois.norid.no',
+    'nokia': 'whois.nic.nokia',
+    'northwesternmutual': '',
+    'norton': 'whois.nic.norton',
+    'now': 'whois.nic.now',
+    'nowruz': 'whois.nic.nowruz',
+    'nowtv': 'whois.nic.nowtv',
+    'np': '',
+    'nr': '',
+    'nra': 'whois.nic.nra',
+    'nrw': 'whois.nic.nrw',
+    'ntt': '',
+    'nu': 'whois.iis.nu',
+    'nyc': 'whois.nic.nyc',
+    'nz': 'whois.irs.net.nz',
+    'obi': 'whois.nic.obi',
+    'observer': 'whois.nic.observer',
+    'off': '',
+    'office': 'whois.nic.office',
+    'okinawa': 'whois.nic.okinawa',
+    'olayan': 'whois.nic.olayan',
+    'olayangroup': 'whois.nic.olayangroup',
+    'oldnavy': '',
+    'ollo': 'whois.nic.ollo',
+    'om': 'whois.registry.om',
+    'omega': 'whois.nic.omega',
+    'one': 'whois.nic.one',
+    'ong': 'whois.nic.ong',
+    'onl': 'whois.nic.onl',
+    'online': 'whois.nic.online',
+    'onyourside': '',
+    'ooo': 'whois.nic.ooo',
+    'open': 'whois.nic.open',
+    'oracle': 'whois.nic.oracle',
+    'orange': 'whois.nic.orange',
+    'org': 'whois.publicinterestregistry.org',
+    'organic': 'whois.nic.organic',
+    'orientexpress': '',
+    'origins': 'whois.nic.origins',
+    'osaka': 'whois.nic.osaka',
+    'otsuka': 'whois.nic.otsuka',
+    'ott': 'whois.nic.ott',
+    'ovh': 'whois.nic.ovh',
+    'pa': '',
+    'page': 'whois.nic.google',
+    'pamperedchef': '',
+    'panasonic': 'whois.nic.gmo',
+    'panerai': '',
+    'paris': 'whois.nic.paris',
+    'pars': 'whois.nic.pars',
+    'partners': 'whois.nic.partners',
+    'parts': 'whois.nic.parts',
+    'party': 'whois.nic.party',
+    'passagens': '',
+    'pay': 'whois.nic.pay',
+    'pccw': 'whois.nic.pccw',
+    'pe': 'kero.yachay.pe',
+    'pet': 'whois.nic.pet',
+    'pf': 'whois.registry.pf',
+    'pfizer': '',
+    'pg': '',
+    'ph': '',
+    'pharmacy': 'whois.nic.pharmacy',
+    'philips': 'whois.nic.philips',
+    'phone': 'whois.nic.phone',
+    'photo': 'whois.nic.photo',
+    'photography': 'whois.nic.photography',
+    'photos': 'whois.nic.photos',
+    'physio': 'whois.nic.physio',
+    'piaget': '',
+    'pics': 'whois.nic.pics',
+    'pictet': 'whois.nic.pictet',
+    'pictures': 'whois.nic.pictures',
+    'pid': 'whois.nic.pid',
+    'pin': 'whois.nic.pin',
+    'ping': 'whois.nic.ping',
+    'pink': 'whois.nic.pink',
+    'pioneer': 'whois.nic.pioneer',
+    'pizza': 'whois.nic.pizza',
+    'pk': 'whois.pknic.net.pk',
+    'pl': 'whois.dns.pl',
+    'place': 'whois.nic.place',
+    'play': 'whois.nic.google',
+    'playstation': 'whois.nic.playstation',
+    'plumbing': 'whois.nic.plumbing',
+    'plus': 'whois.nic.plus',
+    'pm': 'whois.nic.pm',
+    'pn': '',
+    'pnc': 'whois.nic.pnc',
+    'pohl': 'whois.nic.pohl',
+    'poker': 'whois.nic.poker',
+    'politie': 'whois.nic.politie',
+    'porn': 'whois.nic.porn',
+    'post': 'whois.dotpostregistry.net',
+    'pr': 'whois.afilias-srs.net',
+    'pramerica': '',
+    'praxi': '',
+    'press': 'whois.nic.press',
+    'prime': 'whois.nic.prime',
+    'pro': 'whois.nic.pro',
+    'prod': 'whois.nic.google',
+    'productions': 'whois.nic.productions',
+    'prof': 'whois.nic.google',
+    'progressive': 'whois.nic.progressive',
+    'promo': 'whois.nic.promo',
+    'properties': 'whois.nic.properties',
+    'property': 'whois.nic.property',
+    'protection': 'whois.nic.protection',
+    'pru': '',
+    'prudential': '',
+    'ps': '',
+    'pt': 'whois.dns.pt',
+    'pub': 'whois.nic.pub',
+    'pw': 'whois.nic.pw',
+    'pwc': 'whois.nic.pwc',
+    'py': '',
+    'qa': 'whois.registry.qa',
+    'qpon': 'whois.nic.qpon',
+    'quebec': 'whois.nic.quebec',
+    'quest': 'whois.nic.quest',
+    'qvc': '',
+    'racing': 'whois.nic.racing',
+    'radio': 'whois.nic.radio',
+    'raid': '',
+    're': 'whois.nic.re',
+    'read': 'whois.nic.read',
+    'realestate': 'whois.nic.realestate',
+    'realtor': 'whois.nic.realtor',
+    'realty': 'whois.nic.realty',
+    'recipes': 'whois.nic.recipes',
+    'red': 'whois.nic.red',
+    'redstone': 'whois.nic.redstone',
+    'redumbrella': 'whois.nic.redumbrella',
+    'rehab': 'whois.nic.rehab',
+    'reise': 'whois.nic.reise',
+    'reisen': 'whois.nic.reisen',
+    'reit': 'whois.nic.reit',
+    'reliance': 'whois.nic.reliance',
+    'ren': 'whois.nic.ren',
+    'rent': 'whois.nic.rent',
+    'rentals': 'whois.nic.rentals',
+    'repair': 'whois.nic.repair',
+    'report': 'whois.nic.report',
+    'republican': 'whois.nic.republican',
+    'rest': 'whois.nic.rest',
+    'restaurant': 'whois.nic.restaurant',
+    'review': 'whois.nic.review',
+    'reviews': 'whois.nic.reviews',
+    'rexroth': 'whois.nic.rexroth',
+    'rich': 'whois.nic.rich',
+    'richardli': 'whois.nic.richardli',
+    'ricoh': 'whois.nic.ricoh',
+    'rightathome': '',
+    'ril': 'whois.nic.ril',
+    'rio': 'whois.gtlds.nic.br',
+    'rip': 'whois.nic.rip',
+    'rmit': '',
+    'ro': 'whois.rotld.ro',
+    'rocher': '',
+    'rocks': 'whois.nic.rocks',
+    'rodeo': 'whois.nic.rodeo',
+    'rogers': 'whois.nic.rogers',
+    'room': 'whois.nic.room',
+    'rs': 'whois.rnids.rs',
+    'rsvp': 'whois.nic.google',
+    'ru': 'whois.tcinet.ru',
+    'ruhr': 'whois.nic.ruhr',
+    'run': 'whois.nic.run',
+    'rw': 'whois.ricta.org.rw',
+    'rwe': 'whois.nic.rwe',
+    'ryukyu': 'whois.nic.ryukyu',
+    'sa': 'whois.nic.net.sa',
+    'saarland': 'whois.nic.saarland',
+    'safe': 'whois.nic.safe',
+    'safety': 'whois.nic.safety',
+    'sakura': '',
+    'sale': 'whois.nic.sale',
+    'salon': 'whois.nic.salon',
+    'samsclub': 'whois.nic.samsclub',
+    'samsung': 'whois.nic.samsung',
+    'sandvik': 'whois.nic.sandvik',
+    'sandvikcoromant': 'whois.nic.sandvikcoromant',
+    'sanofi': 'whois.nic.sanofi',
+    'sap': 'whois.nic.sap',
+    'sapo': '',
+    'sarl': 'whois.nic.sarl',
+    'sas': '',
+    'save': 'whois.nic.save',
+    'saxo': 'whois.nic.saxo',
+    'sb': 'whois.nic.net.sb',
+    'sbi': 'whois.nic.sbi',
+    'sbs': 'whois.nic.sbs',
+    'sc': 'whois.nic.sc',
+    'sca': '',
+    'scb': 'whois.nic.scb',
+    'schaeffler': 'whois.afilias-srs.net',
+    'schmidt': 'whois.nic.schmidt',
+    'scholarships': 'whois.nic.scholarships',
+    'school': 'whois.nic.school',
+    'schule': 'whois.nic.schule',
+    'schwarz': 'whois.nic.schwarz',
+    'science': 'whois.nic.science',
+    'scjohnson': '',
+    'scor': '',
+    'scot': 'whois.nic.scot',
+    'sd': 'whois.nic.sd',
+    'se': 'whois.iis.se',
+    'seat': 'whois.nic.seat',
+    'secure': 'whois.nic.secure',
+    'security': 'whois.nic.security',
+    'seek': 'whois.nic.seek',
+    'select': 'whois.nic.select',
+    'sener': 'whois.nic.rwe',
+    'services': 'whois.nic.services',
+    'ses': '',
+    'seven': 'whois.nic.seven',
+    'sew': 'whois.nic.sew',
+    'sex': 'whois.nic.sex',
+    'sexy': 'whois.nic.sexy',
+    'sfr': 'whois.nic.sfr',
+    'sg': 'whois.sgnic.sg',
+    'sh': 'whois.nic.sh',
+    'shangrila': 'whois.nic.shangrila',
+    'sharp': 'whois.nic.gmo',
+    'shaw': '',
+    'shell': 'whois.nic.shell',
+    'shia': 'whois.nic.shia',
+    'shiksha': 'whois.nic.shiksha',
+    'shoes': 'whois.nic.shoes',
+    'shop': 'whois.nic.shop',
+    'shopping': 'whois.nic.shopping',
+    'shouji': 'whois.teleinfo.cn',
+    'show': 'whois.nic.show',
+    'showtime': '',
+    'shriram': '',
+    'si': 'whois.register.si',
+    'silk': 'whois.nic.silk',
+    'sina': 'whois.nic.sina',
+    'singles': 'whois.nic.singles',
+    'site': 'whois.nic.site',
+    'sj': '',
+    'sk': 'whois.sk-nic.sk',
+    'ski': 'whois.nic.ski',
+    'skin': 'whois.nic.skin',
+    'sky': 'whois.nic.sky',
+    'skype': 'whois.nic.skype',
+    'sl': '',
+    'sling': 'whois.nic.sling',
+    'sm': 'whois.nic.sm',
+    'smart': 'whois.nic.smart',
+    'smile': 'whois.nic.smile',
+    'sn': 'whois.nic.sn',
+    'sncf': 'whois.nic.sncf',
+    'so': 'whois.nic.so',
+    'soccer': 'whois.nic.soccer',
+    'social': 'whois.nic.social',
+    'softbank': 'whois.nic.softbank',
+    'software': 'whois.nic.software',
+    'sohu': '',
+    'solar': 'whois.nic.solar',
+    'solutions': 'whois.nic.solutions',
+    'song': '',
+    'sony': 'whois.nic.sony',
+    'soy': 'whois.nic.google',
+    'space': 'whois.nic.space',
+    'spiegel': '',
+    'sport': 'whois.nic.sport',
+    'spot': 'whois.nic.spot',
+    'spreadbetting': '',
+    'sr': '',
+    'srl': 'whois.nic.srl',
+    'srt': '',
+    'st': 'whois.nic.st',
+    'stada': 'whois.nic.stada',
+    'staples': '',
+    'star': 'whois.nic.star',
+    'starhub': '',
+    'statebank': 'whois.nic.statebank',
+    'statefarm': '',
+    'statoil': '',
+    'stc': 'whois.nic.stc',
+    'stcgroup': 'whois.nic.stcgroup',
+    'stockholm': 'whois.nic.stockholm',
+    'storage': 'whois.nic.storage',
+    'store': 'whois.nic.store',
+    'stream': 'whois.nic.stream',
+    'studio': 'whois.nic.studio',
+    'study': 'whois.nic.study',
+    'style': 'whois.nic.style',
+    'su': 'whois.tcinet.ru',
+    'sucks': 'whois.nic.sucks',
+    'supplies': 'whois.nic.supplies',
+    'supply': 'whois.nic.supply',
+    'support': 'whois.nic.support',
+    'surf': 'whois.nic.surf',
+    'surgery': 'whois.nic.surgery',
+    'suzuki': 'whois.nic.suzuki',
+    'sv': '',
+    'swatch': 'whois.nic.swatch',
+    'swiftcover': '',
+    'swiss': 'whois.nic.swiss',
+    'sx': 'whois.sx',
+    'sy': 'whois.tld.sy',
+    'sydney': 'whois.nic.sydney',
+    'symantec': '',
+    'systems': 'whois.nic.systems',
+    'sz': '',
+    'tab': 'whois.nic.tab',
+    'taipei': 'whois.nic.taipei',
+    'talk': 'whois.nic.talk',
+    'taobao': 'whois.nic.taobao',
+    'target': '',
+    'tatamotors': 'whois.nic.tatamotors',
+    'tatar': 'whois.nic.tatar',
+    'tattoo': 'whois.nic.tattoo',
+    'tax': 'whois.nic.tax',
+    'taxi': 'whois.nic.taxi',
+    'tc': 'whois.nic.tc',
+    'tci': 'whois.nic.tci',
+    'td': 'whois.nic.td',
+    'tdk': 'whois.nic.tdk',
+    'team': 'whois.nic.team',
+    'tech': 'whois.nic.tech',
+    'technology': 'whois.nic.technology',
+    'tel': 'whois.nic.tel',
+    'telecity': '',
+    'telefonica': '',
+    'temasek': 'whois.nic.temasek',
+    'tennis': 'whois.nic.tennis',
+    'teva': 'whois.nic.teva',
+    'tf': 'whois.nic.tf',
+    'tg': 'whois.nic.tg',
+    'th': 'whois.thnic.co.th',
+    'thd': 'whois.nic.thd',
+    'theater': 'whois.nic.theater',
+    'theatre': 'whois.nic.theatre',
+    'tiaa': 'whois.nic.tiaa',
+    'tickets': 'whois.nic.tickets',
+    'tienda': 'whois.nic.tienda',
+    'tiffany': '',
+    'tips': 'whois.nic.tips',
+    'tires': 'whois.nic.tires',
+    'tirol': 'whois.nic.tirol',
+    'tj': '',
+    'tjmaxx': '',
+    'tjx': '',
+    'tk': 'whois.dot.tk',
+    'tkmaxx': '',
+    'tl': 'whois.nic.tl',
+    'tm': 'whois.nic.tm',
+    'tmall': 'whois.nic.tmall',
+    'tn': 'whois.ati.tn',
+    'to': 'whois.tonic.to',
+    'today': 'whois.nic.today',
+    'tokyo': 'whois.nic.tokyo',
+    'tools': 'whois.nic.tools',
+    'top': 'whois.nic.top',
+    'toray': 'whois.nic.toray',
+    'toshiba': 'whois.nic.toshiba',
+    'total': 'whois.nic.total',
+    'tours': 'whois.nic.tours',
+    'town': 'whois.nic.town',
+    'toyota': 'whois.nic.toyota',
+    'toys': 'whois.nic.toys',
+    'tr': 'whois.trabis.gov.tr',
+    'trade': 'whois.nic.trade',
+    'trading': 'whois.nic.trading',
+    'training': 'whois.nic.training',
+    'travel': 'whois.nic.travel',
+    'travelchannel': '',
+    'travelers': 'whois.nic.travelers',
+    'travelersinsurance': 'whois.nic.travelersinsurance',
+    'trust': 'whois.nic.trust',
+    'trv': 'whois.nic.trv',
+    'tt': '',
+    'tube': 'whois.nic.tube',
+    'tui': 'whois.nic.tui',
+    'tunes': 'whois.nic.tunes',
+    'tushu': 'whois.nic.tushu',
+    'tv': 'whois.nic.tv',
+    'tvs': 'whois.nic.tvs',
+    'tw': 'whois.twnic.net.tw',
+    'tz': 'whois.tznic.or.tz',
+    'ua': 'whois.ua',
+    'ubank': 'whois.nic.ubank',
+    'ubs': 'whois.nic.ubs',
+    'uconnect': '',
+    'ug': 'whois.co.ug',
+    'uk': 'whois.nic.uk',
+    'unicom': 'whois.nic.unicom',
+    'university': 'whois.nic.university',
+    'uno': 'whois.nic.uno',
+    'uol': 'whois.gtlds.nic.br',
+    'ups': 'whois.nic.ups',
+    'us': 'whois.nic.us',
+    'uy': 'whois.nic.org.uy',
+    'uz': 'whois.cctld.uz',
+    'va': '',
+    'vacations': 'whois.nic.vacations',
+    'vana': 'whois.nic.vana',
+    'vanguard': 'whois.nic.vanguard',
+    'vc': 'whois.identitydigital.services',
+    've': 'whois.nic.ve',
+    'vegas': 'whois.nic.vegas',
+    'ventures': 'whois.nic.ventures',
+    'verisign': 'whois.nic.verisign',
+    'versicherung': 'whois.nic.versicherung',
+    'vet': 'whois.nic.vet',
+    'vg': 'whois.nic.vg',
+    'vi': 'virgil.nic.vi',
+    'viajes': 'whois.nic.viajes',
+    'video': 'whois.nic.video',
+    'vig': 'whois.nic.vig',
+    'viking': 'whois.nic.viking',
+    'villas': 'whois.nic.villas',
+    'vin': 'whois.nic.vin',
+    'vip': 'whois.nic.vip',
+    'virgin': 'whois.nic.virgin',
+    'visa': 'whois.nic.visa',
+    'vision': 'whois.nic.vision',
+    'vista': '',
+    'vistaprint': '',
+    'viva': 'whois.nic.viva',
+    'vivo': '',
+    'vlaanderen': 'whois.nic.vlaanderen',
+    'vn': '',
+    'vodka': 'whois.nic.vodka',
+    'volkswagen': '',
+    'volvo': 'whois.nic.volvo',
+    'vote': 'whois.nic.vote',
+    'voting': 'whois.nic.voting',
+    'voto': 'whois.nic.voto',
+    'voyage': 'whois.nic.voyage',
+    'vu': 'whois.dnrs.vu',
+    'vuelos': '',
+    'wales': 'whois.nic.wales',
+    'walmart': 'whois.nic.walmart',
+    'walter': 'whois.nic.walter',
+    'wang': 'whois.gtld.knet.cn',
+    'wanggou': 'whois.nic.wanggou',
+    'warman': '',
+    'watch': 'whois.nic.watch',
+    'watches': 'whois.nic.watches',
+    'weather': '',
+    'weatherchannel': '',
+    'webcam': 'whois.nic.webcam',
+    'weber': 'whois.nic.weber',
+    'website': 'whois.nic.website',
+    'wed': 'whois.nic.wed',
+    'wedding': 'whois.nic.wedding',
+    'weibo': 'whois.nic.weibo',
+    'weir': 'whois.nic.weir',
+    'wf': 'whois.nic.wf',
+    'whoswho': 'whois.nic.whoswho',
+    'wien': 'whois.nic.wien',
+    'wiki': 'whois.nic.wiki',
+    'williamhill': '',
+    'win': 'whois.nic.win',
+    'windows': 'whois.nic.windows',
+    'wine': 'whois.nic.wine',
+    'winners': '',
+    'wme': 'whois.nic.wme',
+    'wolterskluwer': 'whois.nic.wolterskluwer',
+    'woodside': 'whois.nic.woodside',
+    'work': 'whois.nic.work',
+    'works': 'whois.nic.works',
+    'world': 'whois.nic.world',
+    'wow': 'whois.nic.wow',
+    'ws': 'whois.website.ws',
+    'wtc': 'whois.nic.wtc',
+    'wtf': 'whois.nic.wtf',
+    'xbox': 'whois.nic.xbox',
+    'xerox': 'whois.nic.xerox',
+    'xfinity': '',
+    'xihuan': 'whois.teleinfo.cn',
+    'xin': 'whois.nic.xin',
+    'xn--11b4c3d': 'whois.nic.xn--11b4c3d',
+    'xn--1ck2e1b': '',
+    'xn--1qqw23a': 'whois.ngtld.cn',
+    'xn--30rr7y': 'whois.gtld.knet.cn',
+    'xn--3bst00m': 'whois.gtld.knet.cn',
+    'xn--3ds443g': 'whois.teleinfo.cn',
+    'xn--3e0b707e': 'whois.kr',
+    'xn--3oq18vl8pn36a': '',
+    'xn--3pxu8k': 'whois.nic.xn--3pxu8k',
+    'xn--42c2d9a': 'whois.nic.xn--42c2d9a',
+    'xn--45brj9c': 'whois.registry.in',
+    'xn--45q11c': 'whois.gtld.knet.cn',
+    'xn--4gbrim': 'whois.nic.xn--4gbrim',
+    'xn--54b7fta0cc': '',
+    'xn--55qw42g': 'whois.conac.cn',
+    'xn--55qx5d': 'whois.ngtld.cn',
+    'xn--5su34j936bgsg': 'whois.nic.xn--5su34j936bgsg',
+    'xn--5tzm5g': 'whois.nic.xn--5tzm5g',
+    'xn--6frz82g': 'whois.nic.xn--6frz82g',
+    'xn--6qq986b3xl': 'whois.gtld.knet.cn',
+    'xn--80adxhks': 'whois.nic.xn--80adxhks',
+    'xn--80ao21a': 'whois.nic.kz',
+    'xn--80aqecdr1a': 'whois.nic.xn--80aqecdr1a',
+    'xn--80asehdb': 'whois.nic.xn--80asehdb',
+    'xn--80aswg': 'whois.nic.xn--80aswg',
+    'xn--8y0a063a': 'whois.nic.xn--8y0a063a',
+    'xn--90a3ac': 'whois.rnids.rs',
+    'xn--90ae': 'whois.imena.bg',
+    'xn--90ais': 'whois.cctld.by',
+    'xn--9dbq2a': 'whois.nic.xn--9dbq2a',
+    'xn--9et52u': 'whois.gtld.knet.cn',
+    'xn--9krt00a': 'whois.nic.xn--9krt00a',
+    'xn--b4w605ferd': 'whois.nic.xn--b4w605ferd',
+    'xn--bck1b9a5dre4c': '',
+    'xn--c1avg': 'whois.nic.xn--c1avg',
+    'xn--c2br7g': 'whois.nic.xn--c2br7g',
+    'xn--cck2b3b': '',
+    'xn--cg4bki': 'whois.kr',
+    'xn--clchc0ea0b2g2a9gcd': 'whois.ta.sgnic.sg',
+    'xn--czr694b': '',
+    'xn--czrs0t': 'whois.nic.xn--czrs0t',
+    'xn--czru2d': 'whois.gtld.knet.cn',
+    'xn--d1acj3b': 'whois.nic.xn--d1acj3b',
+    'xn--d1alf': 'whois.marnet.mk',
+    'xn--e1a4c': 'whois.eu',
+    'xn--eckvdtc9d': '',
+    'xn--efvy88h': 'whois.nic.xn--efvy88h',
+    'xn--estv75g': '',
+    'xn--fct429k': '',
+    'xn--fhbei': 'whois.nic.xn--fhbei',
+    'xn--fiq228c5hs': 'whois.teleinfo.cn',
+    'xn--fiq64b': 'whois.gtld.knet.cn',
+    'xn--fiqs8s': 'cwhois.cnnic.cn',
+    'xn--fiqz9s': 'cwhois.cnnic.cn',
+    'xn--fjq720a': 'whois.nic.xn--fjq720a',
+    'xn--flw351e': 'whois.nic.google',
+    'xn--fpcrj9c3d': 'whois.registry.in',
+    'xn--fzc2c9e2c': '',
+    'xn--fzys8d69uvgm': 'whois.nic.xn--fzys8d69uvgm',
+    'xn--g2xx48c': '',
+    'xn--gckr3f0f': '',
+    'xn--gecrj9c': 'whois.registry.in',
+    'xn--gk3at1e': '',
+    'xn--h2brj9c': 'whois.registry.in',
+    'xn--hxt814e': 'whois.gtld.knet.cn',
+    'xn--i1b6b1a6a2e': 'whois.nic.xn--i1b6b1a6a2e',
+    'xn--imr513n': '',
+    'xn--io0a7i': 'whois.ngtld.cn',
+    'xn--j1aef': 'whois.nic.xn--j1aef',
+    'xn--j1amh': 'whois.dotukr.com',
+    'xn--j6w193g': 'whois.hkirc.hk',
+    'xn--jlq61u9w7b': '',
+    'xn--jvr189m': '',
+    'xn--kcrx77d1x4a': 'whois.nic.xn--kcrx77d1x4a',
+    'xn--kprw13d': 'whois.twnic.net.tw',
+    'xn--kpry57d': 'whois.twnic.net.tw',
+    'xn--kpu716f': '',
+    'xn--kput3i': 'whois.nic.xn--kput3i',
+    'xn--l1acc': '',
+    'xn--lgbbat1ad8j': 'whois.nic.dz',
+    'xn--mgb9awbf': 'whois.registry.om',
+    'xn--mgba3a3ejt': '',
+    'xn--mgba3a4f16a': 'whois.nic.ir',
+    'xn--mgba7c0bbn0a': 'whois.nic.xn--mgba7c0bbn0a',
+    'xn--mgbaam7a8h': 'whois.aeda.net.ae',
+    'xn--mgbab2bd': 'whois.nic.xn--mgbab2bd',
+    'xn--mgbai9azgqp6j': '',
+    'xn--mgbayh7gpa': '',
+    'xn--mgbb9fbpob': '',
+    'xn--mgbbh1a71e': 'whois.registry.in',
+    'xn--mgbc0a9azcg': '',
+    'xn--mgbca7dzdo': 'whois.nic.xn--mgbca7dzdo',
+    'xn--mgberp4a5d4ar': 'whois.nic.net.sa',
+    'xn--mgbi4ecexp': 'whois.nic.xn--mgbi4ecexp',
+    'xn--mgbpl2fh': '',
+    'xn--mgbt3dhd': 'whois.nic.xn--mgbt3dhd',
+    'xn--mgbtx2b': 'whois.cmc.iq',
+    'xn--mgbx4cd0ab': 'whois.mynic.my',
+    'xn--mix891f': 'whois.monic.mo',
+    'xn--mk1bu44c': 'whois.nic.xn--mk1bu44c',
+    'xn--mxtq1m': 'whois.nic.xn--mxtq1m',
+    'xn--ngbc5azd': 'whois.nic.xn--ngbc5azd',
+    'xn--ngbe9e0a': 'whois.nic.xn--ngbe9e0a',
+    'xn--node': '',
+    'xn--nqv7f': 'whois.nic.xn--nqv7f',
+    'xn--nqv7fs00ema': 'whois.nic.xn--nqv7fs00ema',
+    'xn--nyqy26a': '',
+    'xn--o3cw4h': 'whois.thnic.co.th',
+    'xn--ogbpf8fl': 'whois.tld.sy',
+    'xn--p1acf': 'whois.nic.xn--p1acf',
+    'xn--p1ai': 'whois.tcinet.ru',
+    'xn--pbt977c': '',
+    'xn--pgbs0dh': 'whois.ati.tn',
+    'xn--pssy2u': 'whois.nic.xn--pssy2u',
+    'xn--q9jyb4c': 'whois.nic.google',
+    'xn--qcka1pmc': 'whois.nic.google',
+    'xn--qxam': '',
+    'xn--rhqv96g': '',
+    'xn--rovu88b': '',
+    'xn--s9brj9c': 'whois.registry.in',
+    'xn--ses554g': 'whois.nic.xn--ses554g',
+    'xn--t60b56a': 'whois.nic.xn--t60b56a',
+    'xn--tckwe': 'whois.nic.xn--tckwe',
+    'xn--tiq49xqyj': 'whois.nic.xn--tiq49xqyj',
+    'xn--unup4y': 'whois.nic.xn--unup4y',
+    'xn--vermgensberater-ctb': 'whois.nic.xn--vermgensberater-ctb',
+    'xn--vermgensberatung-pwb': 'whois.nic.xn--vermgensberatung-pwb',
+    'xn--vhquv': 'whois.nic.xn--vhquv',
+    'xn--vuq861b': 'whois.teleinfo.cn',
+    'xn--w4r85el8fhu5dnra': 'whois.nic.xn--w4r85el8fhu5dnra',
+    'xn--w4rs40l': 'whois.nic.xn--w4rs40l',
+    'xn--wgbh1c': '',
+    'xn--wgbl6a': 'whois.registry.qa',
+    'xn--xhq521b': 'whois.ngtld.cn',
+    'xn--xkc2al3hye2a': '',
+    'xn--xkc2dl3a5ee0h': 'whois.registry.in',
+    'xn--y9a3aq': 'whois.amnic.net',
+    'xn--yfro4i67o': 'whois.zh.sgnic.sg',
+    'xn--ygbi2ammx': 'whois.pnina.ps',
+    'xn--zfr164b': 'whois.conac.cn',
+    'xperia': '',
+    'xxx': 'whois.nic.xxx',
+    'xyz': 'whois.nic.xyz',
+    'yachts': 'whois.nic.yachts',
+    'yahoo': 'whois.nic.yahoo',
+    'yamaxun': 'whois.nic.yamaxun',
+    'yandex': '',
+    'ye': 'whois.y.net.ye',
+    'yodobashi': 'whois.nic.gmo',
+    'yoga': 'whois.nic.yoga',
+    'yokohama': 'whois.nic.yokohama',
+    'you': 'whois.nic.you',
+    'youtube': 'whois.nic.google',
+    'yt': 'whois.nic.yt',
+    'yun': 'whois.teleinfo.cn',
+    'za': '',
+    'zappos': 'whois.nic.zappos',
+    'zara': 'whois.nic.zara',
+    'zero': '',
+    'zip': 'whois.nic.google',
+    'zippo': '',
+    'zm': 'whois.zicta.zm',
+    'zone': 'whois.nic.zone',
+    'zuerich': 'whois.nic.zuerich',
+    'zw': '',
+}
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Pool of local addresses to send whois queries from.
+
+Registries throttle clients by IP address, so on a host with several
+addresses queries are spread across them, and every address gets its own
+quota. Throttling is tracked for every (address, server) pair, so an address
+throttled by one server is still used for the others.
+
+The pool is passed to WhoisClient, which check(..) and others use once it's
+made the default client:
+
+>>> pool = SourceAddressPool(['192.0.2.1', '192.0.2.2'], LEAST_THROTTLED)
+>>> set_default_client(WhoisClient(source_addresses=pool))
+"""
+import time
+import threading
+
+ROUND_ROBIN = 'round-robin'
+LEAST_THROTTLED = 'least-throttled'
+
+
+class SourceAddressPool(object):
+
+    def __init__(self, addresses, strategy=ROUND_ROBIN, clock=time.time):
+        """
+        :param addresses: list of local IP addresses
+        :param strategy: ROUND_ROBIN to use addresses in turn, or
+                         LEAST_THROTTLED to use the address which was
+                         throttled by the server least recently (addresses
+                         never throttled by it go first, in turn)
+        :param clock: function returning current time in seconds
+        """
+        if not addresses:
+            raise ValueError('source address pool is empty')
+        if strategy not in (ROUND_ROBIN, LEAST_THROTTLED):
+            raise ValueError('unknown source address strategy: {0}'.format(strategy))
+        self.addresses = list(addresses)
+        self.strategy = strategy
+        self.clock = clock
+        self.next = 0
+        # time of the last throttled answer, by (address, server)
+        self.throttled_at = {}
+        self.lock = threading.Lock()
+
+    def choose(self, server):
+        """
+        Return local address to query the server from
+        """
+        with self.lock:
+            count = len(self.addresses)
+            turn = [self.addresses[(self.next + i) % count] for i in range(count)]
+            if self.strategy == LEAST_THROTTLED:
+                # sort is stable, so addresses throttled at the same time keep their turn
+                turn.sort(key=lambda address: self.throttled_at.get((address, server), 0))
+            address = turn[0]
+            self.next = (self.addresses.index(address) + 1) % count
+            return address
+
+    def throttled(self, address, server):
+        """
+        Record that the server throttled queries from the address
+        """
+        with self.lock:
+            self.throttled_at[(address, server)] = self.clock()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Indexes of registry suffixes used to split domain names into name and tld.
+
+>>> index = SuffixIndex(['ru', 'org.ru'])
+>>> index.split('linux.org.ru')
+('linux', 'org.ru')
+>>> index.split('linux.nonexistent')
+('linux.nonexistent', None)
+"""
+
+
+class SuffixIndex(object):
+
+    def __init__(self, suffixes):
+        """
+        Build the index once, so that every lookup costs one hash probe
+        per label of the domain name instead of a scan over all suffixes
+
+        :param suffixes: iterable of registry suffixes ('ru', 'org.ru', ...)
+        """
+        self.suffixes = frozenset(suffixes)
+
+    def __contains__(self, suffix):
+        return suffix in self.suffixes
+
+    def __len__(self):
+        return len(self.suffixes)
+
+    def split(self, domain):
+        """
+        Split the domain by the longest matching suffix.
+
+        Candidate suffixes are checked starting from the leftmost dot, so the
+        first one found is the longest one. If there is no such suffix, return
+        ('full_domain.tld', None)
+        """
+        suffixes = self.suffixes
+        dot = domain.find('.')
+        while dot != -1:
+            suffix = domain[dot + 1:]
+            if suffix in suffixes:
+                return domain[:dot], suffix
+            dot = domain.find('.', dot + 1)
+        return domain, None
@@ -0,0 +1,579 @@
+# -*- coding: utf-8 -*-
+"""
+Transports getting whois data from whois servers.
+
+The native transport is a RFC 3912 client: it connects to the whois server
+port 43, sends the query and reads the response until the server closes the
+connection. The "whois" command line utility is used as a fallback transport.
+"""
+import time
+import Queue
+import socket
+import threading
+import subprocess
+from collections import OrderedDict, deque
+from multiprocessing.pool import ThreadPool
+
+from .errors import WhoisError, WhoisConnectionError, WhoisServerNotFound, WhoisThrottled, WhoisTimeout
+from .errors import WhoisServerTimeout
+from .servers import ServerTable, parse_iana_dump
+from .ratelimit import RateLimiter, ConcurrencyLimiter
+from .breaker import CircuitBreakers
+from .resolver import Resolver, connect, interleave
+from .parser_utils import TemplateMatcher, normalize_text
+
+SOCKET_TRANSPORT = 'socket'
+SUBPROCESS_TRANSPORT = 'subprocess'
+
+# referral modes: answer of the registry only (enough to get registration
+# status), or answers of both the registry and the registrar
+REGISTRY_REFERRALS = 'registry'
+FULL_REFERRALS = 'full'
+
+WHOIS_PORT = 43
+IANA_SERVER = 'whois.iana.org'
+DEFAULT_TIMEOUT = 30
+RECV_SIZE = 4096
+
+# query formats of servers, which don't treat a bare domain name as a domain
+# lookup (see also "whois" command line utility sources)
+QUERY_FORMATS = {
+    'whois.verisign-grs.com': 'domain {0}',
+    'whois.denic.de': '-T dn,ace {0}',
+    'whois.dk-hostmaster.dk': '--show-handles {0}',
+}
+
+# servers of thin registries, which refer to registrar whois servers
+THIN_SERVERS = set([
+    'whois.verisign-grs.com',
+])
+REGISTRAR_REFERRAL_KEYS = ('registrar whois server', 'whois server')
+# seconds a remembered registrar server is trusted for querying it in
+# parallel with the registry, domains change registrars now and then
+REGISTRAR_SERVER_TTL = 24 * 60 * 60
+
+# answers of servers which refuse to answer because of too many queries
+THROTTLED_TEMPLATES = TemplateMatcher([
+    'limit exceeded',
+    'exceeded allowed connection rate',
+    'too many requests',
+    'too many queries',
+    'try again later',
+])
+
+# servers which answer for the same zones as primary servers, see hedging
+# in WhoisClient.whois(..)
+ALTERNATE_SERVERS = {
+    'ru': ('whois.nic.ru', ),
+    'su': ('whois.nic.ru', ),
+    'xn--p1ai': ('whois.nic.ru', ),
+}
+# primary server is hedged when it hasn't answered within this percentile of
+# its recent latencies
+DEFAULT_HEDGE_PERCENTILE = 0.95
+# delay of hedging until enough latencies of the server are known
+DEFAULT_HEDGE_DELAY = 2.0
+
+DEFAULT_WORKERS = 8
+
+
+def get_remaining(deadline, timeout=None, server=None):
+    """
+    Return seconds left before the deadline (time.time() value), limited by
+    the timeout
+
+    :raises: WhoisTimeout if the deadline has passed
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        raise WhoisTimeout('{0} > deadline exceeded'.format(server or 'whois'))
+    if timeout is not None:
+        return min(timeout, remaining)
+    return remaining
+
+
+def get_timeout_error(address, error, wait, timeout):
+    """
+    Return WhoisServerTimeout if the server didn't answer within the timeout,
+    or WhoisTimeout if the wait was cut short by the deadline, so the server
+    is not to blame
+    """
+    if timeout is None or wait < timeout:
+        return WhoisTimeout('{0} > {1} (deadline exceeded)'.format(address, error))
+    return WhoisServerTimeout('{0} > {1}'.format(address, error))
+
+
+def query_server(query, server, port=WHOIS_PORT, timeout=DEFAULT_TIMEOUT, deadline=None, source_address=None,
+                 resolver=None):
+    """
+    Send the query to the whois server and return the response
+
+    :param timeout: timeout of every socket operation (in seconds)
+    :param deadline: time (time.time() value) the whole query, including
+                     connecting, sending and reading, must be done by
+    :param source_address: local IP address to connect from
+    :param resolver: Resolver caching addresses of the server, by default
+                     the server is resolved on every query
+    :raises: WhoisConnectionError, WhoisServerTimeout, WhoisTimeout if the
+             deadline has passed or cut a wait for the server short
+    """
+    address = '{0}:{1}'.format(server, port)
+    if source_address:
+        source_address = (source_address, 0)
+    wait = get_remaining(deadline, timeout, address)
+    try:
+        if resolver is None:
+            addresses = interleave(socket.getaddrinfo(server, port, 0, socket.SOCK_STREAM))
+        else:
+            addresses = resolver.resolve(server, port)
+        sock = connect(addresses, wait, source_address)
+    except socket.timeout as e:
+        raise get_timeout_error(address, e, wait, timeout)
+    except socket.error as e:
+        raise WhoisConnectionError('{0} > {1}'.format(address, e))
+    try:
+        wait = get_remaining(deadline, timeout, address)
+        sock.settimeout(wait)
+        sock.sendall('{0}\r\n'.format(query))
+        chunks = []
+        while True:
+            wait = get_remaining(deadline, timeout, address)
+            sock.settimeout(wait)
+            chunk = sock.recv(RECV_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except socket.timeout as e:
+        raise get_timeout_error(address, e, wait, timeout)
+    except socket.error as e:
+        raise WhoisConnectionError('{0} > {1}'.format(address, e))
+    finally:
+        sock.close()
+    return ''.join(chunks)
+
+
+def subprocess_whois(domain, whois_server=None, deadline=None):
+    """
+    Get whois data with "whois" command line utility
+
+    :param deadline: time (time.time() value) the utility is killed at
+    :raises: WhoisError (if the utility returns with non-zero and non-one
+             status), WhoisTimeout if it's killed
+    """
+    cmd = ['whois', '-H', domain]
+    if whois_server:
+        cmd += ['-h', whois_server]
+    remaining = get_remaining(deadline)
+    try:
+        pipe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise WhoisError('cmd > {0}\nerr > {1}'.format(' '.join(cmd), e))
+    killed = []
+
+    def kill():
+        killed.append(True)
+        try:
+            pipe.kill()
+        except OSError:
+            pass
+
+    killer = None
+    if remaining is not None:
+        killer = threading.Timer(remaining, kill)
+        killer.start()
+    try:
+        out, err = pipe.communicate()
+    finally:
+        if killer is not None:
+            killer.cancel()
+    if killed:
+        raise WhoisTimeout('cmd > {0}\nerr > deadline exceeded'.format(' '.join(cmd)))
+    if pipe.returncode in (0, 1):
+        return out
+    error_text = ['cmd > {0}'.format(' '.join(cmd)), ]
+    if out:
+        error_text += ['out > {0}'.format(line) for line in out.splitlines()]
+    if err:
+        error_text += ['err > {0}'.format(line) for line in err.splitlines()]
+    raise WhoisError('\n'.join(error_text))
+
+
+def is_throttled(response):
+    """
+    Return True if the server refused to answer because of too many queries
+    """
+    return THROTTLED_TEMPLATES.search(normalize_text(response))
+
+
+def parse_referral(response, keys=('refer', 'whois')):
+    """
+    Return the whois server referred to in the response, or None
+    """
+    for line in response.splitlines():
+        key, sep, value = line.partition(':')
+        if sep and key.strip().lower() in keys and value.strip():
+            return value.strip().lower()
+    return None
+
+
+class RegistrarServers(object):
+
+    def __init__(self, max_entries=10000, ttl=REGISTRAR_SERVER_TTL, clock=time.time):
+        """
+        LRU map of domains to whois servers of their registrars
+
+        :param max_entries: max number of domains kept
+        :param ttl: seconds to keep the server for since the registry
+                    referred to it last time
+        :param clock: function returning current time in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        # domain => (expiration time, server)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, domain):
+        """
+        Return registrar server of the domain, or None if it's unknown or
+        stale
+        """
+        with self.lock:
+            entry = self.entries.pop(domain, None)
+            if entry is None or entry[0] <= self.clock():
+                return None
+            self.entries[domain] = entry
+        return entry[1]
+
+    def set(self, domain, server):
+        with self.lock:
+            self.entries.pop(domain, None)
+            self.entries[domain] = (self.clock() + self.ttl, server)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def discard(self, domain):
+        with self.lock:
+            self.entries.pop(domain, None)
+
+
+class Latencies(object):
+
+    def __init__(self, window=100, min_samples=10):
+        """
+        Recent latencies of successful queries of whois servers
+
+        :param window: number of latencies kept per server
+        :param min_samples: number of latencies needed to compute percentiles
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def record(self, server, latency):
+        with self.lock:
+            samples = self.samples.get(server)
+            if samples is None:
+                samples = self.samples[server] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def percentile(self, server, percentile):
+        """
+        Return the percentile (0..1) of recent latencies of the server, or
+        None if there are not enough of them
+        """
+        with self.lock:
+            samples = sorted(self.samples.get(server, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(percentile * len(samples)))]
+
+
+class Prefetch(threading.Thread):
+
+    def __init__(self, func, *args, **kwargs):
+        """
+        Call the function in a separate thread, the result (or the exception)
+        is returned (or raised) by get()
+
+        :param done: optional Queue, the prefetch is put there when it's done
+        """
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.func = func
+        self.args = args
+        self.done = kwargs.get('done')
+        self.result = self.error = None
+        self.start()
+
+    def run(self):
+        try:
+            self.result = self.func(*self.args)
+        except Exception as e:
+            self.error = e
+        if self.done is not None:
+            self.done.put(self)
+
+    def get(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class WhoisClient(object):
+
+    def __init__(self, servers=None, timeout=DEFAULT_TIMEOUT, port=WHOIS_PORT, iana_server=IANA_SERVER,
+                 rate_limiter=None, concurrency_limiter=None, breakers=None,
+                 alternate_servers=None, hedge_percentile=DEFAULT_HEDGE_PERCENTILE, source_addresses=None,
+                 resolver=None):
+        """
+        Native whois client
+
+        Whois servers of zones are taken from the table of servers. Servers
+        of top level domains missing there are learned from IANA whois server
+        and stored in the table.
+
+        :param servers: ServerTable, by default the bundled table, which keeps
+                        learned servers in memory only
+        :param timeout: socket timeout (in seconds)
+        :param port: whois servers port
+        :param iana_server: whois server which refers to top level domains servers
+        :param rate_limiter: RateLimiter, by default strict registries are
+                             limited to their DEFAULT_RATE_LIMITS
+        :param concurrency_limiter: ConcurrencyLimiter, which adapts the
+                                    number of concurrent queries to every server
+        :param breakers: CircuitBreakers, which make queries to servers
+                         failing again and again fail right away
+        :param alternate_servers: dict of zones and servers, which answer for
+                                  the zone besides the primary server, by
+                                  default ALTERNATE_SERVERS
+        :param hedge_percentile: percentile of latencies of the primary server
+                                 to hedge it after
+        :param source_addresses: optional SourceAddressPool of local addresses
+                                 to spread queries across
+        :param resolver: Resolver caching addresses of whois servers
+        """
+        if servers is None:
+            servers = ServerTable(cache_path=None)
+        self.servers = servers
+        self.registrar_servers = RegistrarServers()
+        self.timeout = timeout
+        self.port = port
+        self.iana_server = iana_server
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.concurrency_limiter = concurrency_limiter or ConcurrencyLimiter()
+        self.breakers = breakers or CircuitBreakers()
+        self.alternate_servers = ALTERNATE_SERVERS if alternate_servers is None else alternate_servers
+        self.hedge_percentile = hedge_percentile
+        self.latencies = Latencies()
+        self.source_addresses = source_addresses
+        self.resolver = resolver or Resolver()
+
+    def choose_source(self, server):
+        """
+        Return local address to query the server from, None for any
+        """
+        if self.source_addresses is None:
+            return None
+        return self.source_addresses.choose(server)
+
+    def query(self, query, server, deadline=None, reserved=False, source=None):
+        """
+        Query the whois server, formatting the query for the server if needed,
+        and waiting for the rate and concurrency limits of the server
+
+        :param deadline: time (time.time() value) the query, including waiting
+                         for the limits, must be done by
+        :param reserved: True if the rate limit token is taken already
+        :param source: local address to query from, by default one of
+                       source_addresses
+        :raises: WhoisConnectionError, WhoisTimeout, CircuitOpenError
+        """
+        query = QUERY_FORMATS.get(server, '{0}').format(query)
+        breaker = self.breakers.get(server)
+        breaker.check()
+        try:
+            if source is None:
+                source = self.choose_source(server)
+            if not reserved:
+                self.rate_limiter.acquire(server, get_remaining(deadline, server=server), source)
+            limit = self.concurrency_limiter.get(server)
+            try:
+                if not limit.acquire(get_remaining(deadline, server=server)):
+                    raise WhoisTimeout('{0} > deadline exceeded'.format(server))
+            except WhoisTimeout:
+                # the query is not sent, so its rate limit token is not used
+                self.rate_limiter.refund(server, source)
+                raise
+            started = limit.clock()
+            # None if the query is cut short by the deadline, which says
+            # nothing about the server
+            success = None
+            try:
+                response = query_server(query, server, self.port, self.timeout, deadline, source, self.resolver)
+                success = not is_throttled(response)
+                if not success and source is not None:
+                    self.source_addresses.throttled(source, server)
+            except WhoisConnectionError:
+                success = False
+                raise
+            finally:
+                limit.release(started, success)
+        except WhoisConnectionError:
+            breaker.failure()
+            raise
+        except WhoisError:
+            # the query is not sent, if it was to probe the server, the next one does
+            breaker.abandon()
+            raise
+        breaker.success()
+        if success:
+            self.latencies.record(server, limit.clock() - started)
+        return response
+
+    def get_alternates(self, domain, server):
+        """
+        Return servers answering for the domain besides the server
+        """
+        return [alternate for alternate in self.alternate_servers.get(domain.rsplit('.', 1)[-1], ())
+                if alternate != server]
+
+    def hedged_query(self, domain, server, alternates, deadline=None):
+        """
+        Query the server for the domain, and if it hasn't answered within
+        hedge_percentile of its recent latencies, query alternate server too.
+        The first valid (not failed or throttled) answer is returned.
+
+        Alternate server is queried only if its rate limit allows querying it
+        right away.
+        """
+        delay = self.latencies.percentile(server, self.hedge_percentile)
+        if delay is None:
+            delay = DEFAULT_HEDGE_DELAY
+        done = Queue.Queue()
+        queries = [Prefetch(self.query, domain, server, deadline, done=done)]
+        try:
+            first = done.get(timeout=delay)
+        except Queue.Empty:
+            first = None
+        else:
+            if first.error is None and not is_throttled(first.result):
+                return first.result
+        for alternate in alternates:
+            source = self.choose_source(alternate)
+            if self.rate_limiter.try_acquire(alternate, source):
+                queries.append(Prefetch(self.query, domain, alternate, deadline, True, source, done=done))
+                break
+        finished = [first] if first is not None else []
+        while len(finished) < len(queries):
+            query = done.get()
+            if query.error is None and not is_throttled(query.result):
+                return query.result
+            finished.append(query)
+        # no valid answer, return the answer (or raise the error) of the primary server
+        return queries[0].get()
+
+    def get_server(self, domain, deadline=None):
+        """
+        Return whois server for the domain
+
+        Servers of top level domains are learned only from IANA answers with
+        a referral, or with a zone record without whois server, so errors and
+        throttled answers are not remembered.
+
+        :raises: WhoisServerNotFound, WhoisThrottled
+        """
+        server = self.servers.get(domain)
+        if server is None:
+            tld = domain.rsplit('.', 1)[-1]
+            response = self.query(tld, self.iana_server, deadline)
+            if is_throttled(response):
+                raise WhoisThrottled('{0} > {1}'.format(self.iana_server, response.strip()[:200]))
+            server = parse_referral(response)
+            if server or tld in parse_iana_dump(response.splitlines()):
+                self.servers.learn(tld, server)
+        if not server:
+            raise WhoisServerNotFound('there is no known whois server for {0}'.format(domain))
+        return server
+
+    def get_registrar_server(self, server, response):
+        """
+        Return registrar whois server referred to in the response of thin
+        registry, or None
+        """
+        if server not in THIN_SERVERS:
+            return None
+        referral = parse_referral(response, REGISTRAR_REFERRAL_KEYS)
+        if referral and referral != server:
+            return referral
+        return None
+
+    def whois(self, domain, whois_server=None, referrals=FULL_REFERRALS, deadline=None, hedge=False):
+        """
+        Return whois data of the domain
+
+        In FULL_REFERRALS mode, answers of thin registries are followed by
+        answers of the registrar whois servers they refer to. Registrar
+        server of every domain is remembered, and the next time it's queried
+        in parallel with the registry, unless the registry referred to it too
+        long ago (see RegistrarServers). If the registry refers to another
+        server, the parallel answer is dropped and that server is queried.
+
+        :param deadline: time (time.time() value) all queries must be done by
+        :param hedge: query alternate server of the zone, if the primary one
+                      is slow, see hedged_query(..)
+        """
+        server = whois_server or self.get_server(domain, deadline)
+        if hedge and not whois_server:
+            alternates = self.get_alternates(domain, server)
+            if alternates:
+                return self.hedged_query(domain, server, alternates, deadline)
+        if referrals != FULL_REFERRALS or server not in THIN_SERVERS:
+            return self.query(domain, server, deadline)
+        prefetch = None
+        registrar_server = self.registrar_servers.get(domain)
+        if registrar_server:
+            prefetch = Prefetch(self.query, domain, registrar_server, deadline)
+        response = self.query(domain, server, deadline)
+        referral = self.get_registrar_server(server, response)
+        if not referral:
+            self.registrar_servers.discard(domain)
+            return response
+        self.registrar_servers.set(domain, referral)
+        try:
+            if prefetch and referral == registrar_server:
+                registrar_response = prefetch.get()
+            else:
+                registrar_response = self.query(domain, referral, deadline)
+        except WhoisError:
+            # answer of the registry is enough to know the registration status
+            self.registrar_servers.discard(domain)
+            return response
+        return '{0}\n{1}'.format(response, registrar_response)
+
+    def whois_many(self, domains, referrals=FULL_REFERRALS, workers=DEFAULT_WORKERS):
+        """
+        Return dict of domains and their whois data, or WhoisError instances
+        for domains which failed
+
+        Lookups run in a pool of threads, so registry and registrar queries
+        of different domains overlap.
+        """
+        def lookup(domain):
+            try:
+                return domain, self.whois(domain, referrals=referrals)
+            except WhoisError as e:
+                return domain, e
+
+        pool = ThreadPool(max(1, min(workers, len(domains))))
+        try:
+            return dict(pool.map(lookup, domains))
+        finally:
+            pool.close()
+            pool.join()
+
@@ -1,22 +1,96 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import time
+import zlib
+import random
 import gettext
-import subprocess
 
-from .data import zones
+from .psl import public_suffixes
+from .errors import WhoisServerNotFound, WhoisThrottled
+from .servers import ServerTable, whois_servers
+from .transport import WhoisClient, subprocess_whois, is_throttled, SOCKET_TRANSPORT, SUBPROCESS_TRANSPORT, FULL_REFERRALS
+from .parser_utils import WhoisRecord
 
 gettext.textdomain('whois2')
 locale_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'locale')
 _ = gettext.translation('whois2', locale_path, fallback=True).gettext
 
 DEFAULT_CACHE_TIMEOUT = 600
+DEFAULT_TRANSPORT = SOCKET_TRANSPORT
 
-RU_SUBDOMAINS = filter(lambda zone: re.match(r'^(\w+\.(ru$|su$)|ru.net$)', zone), zones)
+# keep_raw option of whois2.check(..), to keep whois data compressed
+COMPRESS_RAW = 'compress'
+
+RU_SUBDOMAINS = [
+    suffix for zone in ('ru', 'su', 'net') for suffix in public_suffixes.suffixes(zone)
+    if re.match(r'^([\w\-]+\.(ru$|su$)|ru.net$)', suffix)
+]
+
+# second level domains of .ru and .su are served by RU-CENTER
+RU_SUBDOMAINS_SERVER = 'whois.nic.ru'
+
+
+
+class RetryPolicy(object):
+
+    def __init__(self, attempts=4, delay=1.0, max_delay=30.0, jitter=0.5, sleep=time.sleep):
+        """
+        Retries of throttled whois queries with exponential backoff
+
+        :param attempts: max number of queries, including the first one
+        :param delay: delay before the first retry (in seconds), doubled for
+                      every next retry
+        :param max_delay: max delay before a retry
+        :param jitter: share of the delay which is random, so that queries
+                       throttled at once are not retried at once
+        :param sleep: function to wait with
+        """
+        self.attempts = attempts
+        self.delay = delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.sleep = sleep
+
+    def get_delay(self, retry):
+        """
+        Return delay before the retry, retries are numbered from 0, so the
+        first one is delayed by about delay seconds
+        """
+        delay = min(self.max_delay, self.delay * 2 ** retry)
+        return delay * (1 - self.jitter * random.random())
+
+# retry policy of get_whois(..), NO_RETRY to fail on the first throttled answer
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY = RetryPolicy(attempts=1)
+
+default_client = WhoisClient(ServerTable(
+    dict(whois_servers, **dict((zone, RU_SUBDOMAINS_SERVER) for zone in RU_SUBDOMAINS))
+))
+
+
+def set_default_client(client):
+    """
+    Make the client the one used by get_whois(..), check(..), check_many(..)
+    and check_async(..), and return the previous one
+
+    For example, to spread queries across local addresses:
+
+    >>> set_default_client(WhoisClient(source_addresses=SourceAddressPool(['192.0.2.1', '192.0.2.2'])))
+
+    :param client: WhoisClient
+    """
+    global default_client
+    previous, default_client = default_client, client
+    return previous
 
 
 class WhoisDomainBase(object):
+    __slots__ = ()
     invalid = False
+    failed = False
+    # attributes returned by to_tuple() and to_dict()
+    result_fields = ('domain', 'invalid')
 
     def ascii_domain(self):
         """
@@ -36,27 +110,228 @@ class WhoisDomainBase(object):
         """
         return is_idna(self.ascii_domain())
 
+    def to_tuple(self):
+        """
+        Return values of result_fields, None for values which are not found
+        """
+        return tuple(getattr(self, field, None) for field in self.result_fields)
+
+    def to_dict(self):
+        """
+        Return dict of result_fields, None for values which are not found
+        """
+        return dict(zip(self.result_fields, self.to_tuple()))
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', None) or {})
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get('__slots__', ()):
+                if slot == '__dict__':
+                    continue
+                try:
+                    state[slot] = object.__getattribute__(self, slot)
+                except AttributeError:
+                    pass
+        return state
+
+    def __setstate__(self, state):
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
 
 class WhoisDomain(WhoisDomainBase):
     """
     whois2.check(..) result
+
+    Attributes set by parsers (registered, nameservers, paid_till, ...) are
+    parsed from whois data on first access, only by parsers which set them,
+    and then stored in the object.
+
+    Known attributes are stored in slots, attributes set by other parsers go
+    to __dict__, which is created only if such attributes are set.
     """
-    def __init__(self, domain, whois_data):
+    # '__dict__' is kept for attributes of custom parsers registered with
+    # tld_parser(..), CPython creates the dict on the first such attribute,
+    # so objects with known attributes only don't have it
+    __slots__ = (
+        'domain', 'registered', 'nameservers', 'paid_till', 'created',
+        '_whois_data', '_compressed', '_name', '_tld', '_parsers', '_parsed',
+        '_parsing', '_record', '_parsed_values', 'throttled', '__dict__',
+    )
+    result_fields = ('domain', 'invalid', 'registered', 'nameservers', 'paid_till', 'created')
+    # values of attributes which parsers found nothing for
+    parser_defaults = {'registered': True, 'throttled': False}
+
+    def __init__(self, domain, whois_data, name=None, tld=None, parsers=(), parsed_values=None):
+        """
+        :param domain: normalized domain name
+        :param whois_data: whois response as a string
+        :param name: domain name without the tld, passed to parsers
+        :param tld: domain tld, passed to parsers
+        :param parsers: parsers for the tld
+        :param parsed_values: optional ParsedValues, shared by objects with
+                              the same whois data, attributes are taken from
+                              there and stored there after parsing
+        """
         self.domain = domain
-        self.whois_data = whois_data
+        self._whois_data = whois_data
+        self._compressed = False
+        self._name = name
+        self._tld = tld
+        self._parsers = parsers
+        self._parsed = None
+        self._parsing = None
+        self._record = None
+        self._parsed_values = parsed_values
+        if parsed_values:
+            for attr, value in parsed_values.restore():
+                setattr(self, attr, value)
+
+    def __getattr__(self, attr):
+        # called only for attributes which are not set yet
+        if attr.startswith('_') or (self._parsing and attr in self._parsing):
+            raise AttributeError(attr)
+        parsed = self._parsed or ()
+        parsers = [parser for parser in self._parsers if parser not in parsed and
+                   (getattr(parser, 'fields', None) is None or attr in parser.fields)]
+        if not parsers and attr not in self.parser_defaults:
+            raise AttributeError(attr)
+        if self._parsed is None:
+            self._parsed = set()
+        if self._parsing is None:
+            self._parsing = set()
+        self._parsing.add(attr)
+        # the record is freed by the outermost call, which built it
+        keep_record = self._record is not None
+        try:
+            for parser in parsers:
+                self._parsed.add(parser)
+                parser(self, self._name, self._tld)
+                if attr == 'registered' and self.is_parsed('registered') and self.registered:
+                    # parsers never reset registration status once it's found
+                    break
+        finally:
+            self._parsing.discard(attr)
+            if not self._parsing:
+                self._parsing = None
+            if not keep_record:
+                self._record = None
+        if not self.is_parsed(attr):
+            if attr not in self.parser_defaults:
+                raise AttributeError(attr)
+            setattr(self, attr, self.parser_defaults[attr])
+        value = object.__getattribute__(self, attr)
+        if self._parsed_values is not None:
+            self._parsed_values.store(attr, value, self.domain)
+        return value
+
+    def is_parsed(self, attr):
+        """
+        Return True if the attribute is already set
+        """
+        try:
+            object.__getattribute__(self, attr)
+        except AttributeError:
+            return False
+        return True
+
+    def parse(self, fields=None):
+        """
+        Parse attributes right away
+
+        :param fields: names of attributes, by default all attributes which
+                       parsers for the tld set
+        """
+        if fields is None:
+            fields = set(self.parser_defaults)
+            for parser in self._parsers:
+                fields.update(getattr(parser, 'fields', None) or ())
+        keep_record = self._record is not None
+        if self._parsers and self._whois_data is not None:
+            # the record is shared by all fields
+            self.record
+        try:
+            for field in fields:
+                getattr(self, field, None)
+        finally:
+            if not keep_record:
+                self._record = None
+
+    def drop_raw(self, compress=False):
+        """
+        Free whois data and parser state, attributes which are not parsed yet
+        won't be parsed anymore
+
+        :param compress: keep whois data compressed with zlib instead, it's
+                         decompressed on every access to whois_data
+        """
+        if compress and self._whois_data is not None and not self._compressed:
+            self._whois_data = zlib.compress(self._whois_data)
+            self._compressed = True
+        elif not compress:
+            self._whois_data = None
+            self._compressed = False
+        self._parsers = ()
+        self._parsed = None
+        self._parsing = None
+        self._record = None
+        self._parsed_values = None
+
+    @property
+    def whois_data(self):
+        if self._compressed:
+            return zlib.decompress(self._whois_data)
+        return self._whois_data
+
+    @whois_data.setter
+    def whois_data(self, value):
+        self._whois_data = value
+        self._compressed = False
+        self._record = None
+
+    @property
+    def record(self):
+        """
+        Index of whois data shared by parsers, see parser_utils.WhoisRecord
+
+        It's built on demand and freed when parsing is done, because it takes
+        several times the memory of whois data.
+        """
+        if self._record is None:
+            self._record = WhoisRecord(self.whois_data)
+        return self._record
 
 
 class WhoisDomainInvalid(WhoisDomainBase):
     """
     whois2.check(..) result in case when domain name is invalid
     """
+    __slots__ = ('domain', 'validation_errors')
     invalid = True
+    result_fields = ('domain', 'invalid', 'validation_errors')
+
     def __init__(self, domain, validation_errors):
         self.domain = domain
         self.validation_errors = validation_errors
 
 
-def get_whois(domain, whois_server=None, cache=None, cache_timeout=None):
+class WhoisDomainError(WhoisDomainBase):
+    """
+    whois2.check_many(..) result in case when whois data of the domain can't
+    be received
+    """
+    __slots__ = ('domain', 'error')
+    failed = True
+    result_fields = ('domain', 'invalid', 'failed', 'error')
+
+    def __init__(self, domain, error):
+        self.domain = domain
+        self.error = error
+
+
+def get_whois(domain, whois_server=None, cache=None, cache_timeout=None, transport=None,
+              referrals=FULL_REFERRALS, retry=DEFAULT_RETRY, throttled=is_throttled, timeout=None,
+              deadline=None, hedge=False):
     """
     Get whois information from remote domain in plain text format
 
@@ -64,33 +339,70 @@ def get_whois(domain, whois_server=None, cache=None, cache_timeout=None):
     :param cache: a cache object having two methods: set(key, value, timeout)
                   and get(key), can be None, if you don't intend to use caching mechanism
     :param cache_timeout: cache timeout (in seconds)
+    :param transport: SOCKET_TRANSPORT (native whois client, default) or
+                      SUBPROCESS_TRANSPORT ("whois" command line utility).
+                      The native client falls back to the utility when it
+                      doesn't know whois server of the domain.
+    :param referrals: FULL_REFERRALS (default) to follow referrals of thin
+                      registries to registrar whois servers, or
+                      REGISTRY_REFERRALS to get answer of the registry only.
+                      The "whois" command line utility always follows them.
+    :param retry: RetryPolicy of throttled queries
+    :param throttled: function returning True if whois data is an answer of
+                      the server refusing to answer because of too many
+                      queries. Such answers are retried and never cached.
+    :param timeout: max number of seconds to get whois data in, including
+                    connecting, sending, reading, retries and waiting for
+                    rate limits
+    :param deadline: time (time.time() value) to get whois data by, the
+                     earliest of timeout and deadline is used
+    :param hedge: if the whois server is slow, query an alternate server of
+                  the zone too, and take the first valid answer (native
+                  transport only, see WhoisClient.hedged_query)
 
     :returns: the string with the whois information about the domain
-    :raises: RuntimeError (if "whois" command line utility returns with non-zero and non-one status)
+    :raises: WhoisError, subclass of RuntimeError (if connection fails, or
+             "whois" command line utility returns with non-zero and non-one
+             status), WhoisThrottled if the server kept refusing to answer,
+             WhoisTimeout if the deadline is exceeded
     """
-    cmd = ['whois', '-H', domain]
-    if whois_server:
-        cmd += ['-h', whois_server]
-    cache_key = ':'.join((domain, whois_server or ''))
-
+    if timeout is not None:
+        deadline = min(deadline or float('inf'), time.time() + timeout)
+    cache_key = get_cache_key(domain, whois_server, referrals)
     out = None
     if cache:
         out = cache.get(cache_key)
     if out is None:
-        pipe = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        out, err = pipe.communicate()
-        if pipe.returncode in (0, 1):
-            if cache:
-                cache.set(cache_key, out, cache_timeout or DEFAULT_CACHE_TIMEOUT)
-            return out
-        error_text = ['cmd > {0}'.format(' '.join(cmd)), ]
-        if out:
-            error_text += ['out > {0}'.format(line) for line in out.splitlines()]
-        if err:
-            error_text += ['err > {0}'.format(line) for line in err.splitlines()]
-        raise RuntimeError('\n'.join(error_text))
-    else:
-        return out
+        for attempt in range(retry.attempts):
+            if attempt:
+                delay = retry.get_delay(attempt - 1)
+                if deadline is not None and time.time() + delay >= deadline:
+                    raise WhoisThrottled('{0} > {1}'.format(domain, out.strip()[:200]))
+                retry.sleep(delay)
+            if (transport or DEFAULT_TRANSPORT) == SOCKET_TRANSPORT:
+                try:
+                    out = default_client.whois(domain, whois_server, referrals, deadline, hedge)
+                except WhoisServerNotFound:
+                    out = subprocess_whois(domain, whois_server, deadline)
+            else:
+                out = subprocess_whois(domain, whois_server, deadline)
+            if not throttled(out):
+                break
+        else:
+            raise WhoisThrottled('{0} > {1}'.format(domain, out.strip()[:200]))
+        if cache:
+            cache.set(cache_key, out, cache_timeout or DEFAULT_CACHE_TIMEOUT)
+    return out
+
+
+def get_cache_key(domain, whois_server=None, referrals=FULL_REFERRALS):
+    """
+    Return key of whois data of the domain in the cache
+    """
+    cache_key = ':'.join((domain, whois_server or ''))
+    if referrals != FULL_REFERRALS:
+        cache_key = ':'.join((cache_key, referrals))
+    return cache_key
 
 
 def normalize_domain_name(domain_name):